@@ -11,3 +11,12 @@ class ApiConfig(AppConfig):
             import api.isms_signals
         except Exception:
             pass
+
+        # search_vector maintenance (post_save receivers)
+        import api.search  # noqa: F401
+
+        # evidence blob reference release (post_delete receivers)
+        import api.evidence  # noqa: F401
+
+        # per-tenant audit lock cache invalidation (Audit post_save/post_delete)
+        import api.isms_audit_lock  # noqa: F401
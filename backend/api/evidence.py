@@ -0,0 +1,247 @@
+# backend/api/evidence.py
+
+"""
+Content-addressed evidence storage.
+
+Every upload is hashed (SHA-256) while it streams in (see the upload handlers
+below, wired in settings.FILE_UPLOAD_HANDLERS). Identical content is stored
+ONCE as an EvidenceBlob at evidence/blobs/<aa>/<sha256>; evidence FileFields
+simply point at that path. Blobs are shared across tenants, so the path holds
+no filename: each record keeps its uploader's name (`evidence_name`,
+EvidenceItem.name) and downloads are served under it.
+
+    attach_evidence(record, upload)  -> store (or reuse) the blob, point the
+                                        field at it, release the old one
+    detach_evidence(record)          -> clear the field, release the blob
+
+Blobs are reference counted: the file is deleted (after commit) only when the
+last reference goes. Files that predate the blob table are owned by their one
+record and are deleted directly.
+
+Each blob's text is extracted once, in the background (api.evidence_text);
+records copy it into their own `evidence_vector` so evidence search stays a
+tenant-scoped GIN lookup.
+"""
+
+import hashlib
+import os
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+from django.contrib.postgres.search import SearchVector
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save
+
+from .models import ComplianceClause, EvidenceBlob, EvidenceItem
+from .isms_models import ISO27001ClauseRecord
+from .search import SEARCH_CONFIG
+
+
+# Records whose FileField `evidence` holds blob references, by API name,
+# with the save() fields used when attaching
+EVIDENCE_TARGETS = {
+    "compliance-clause": {"model": ComplianceClause, "update_fields": None},
+    "iso27001-clause": {
+        "model": ISO27001ClauseRecord,
+        "update_fields": ["evidence", "updated_at"],
+    },
+}
+EVIDENCE_MODELS = tuple(spec["model"] for spec in EVIDENCE_TARGETS.values())
+
+BLOB_PREFIX = "evidence/blobs/"
+
+
+# ---------------------------------------------------------------------
+# Hash while streaming
+# ---------------------------------------------------------------------
+class _HashingMixin:
+    """Feeds every received chunk to SHA-256; the file gets `.sha256`."""
+
+    def new_file(self, *args, **kwargs):
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        # An inactive memory handler passes chunks on to the temp-file one
+        if getattr(self, "activated", True):
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        if uploaded is not None:
+            uploaded.sha256 = self.sha256.hexdigest()
+        return uploaded
+
+
+class HashingMemoryFileUploadHandler(_HashingMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(_HashingMixin, TemporaryFileUploadHandler):
+    pass
+
+
+def upload_digest(upload) -> str:
+    """SHA-256 of an uploaded file; hashes it now if no handler did."""
+    digest = getattr(upload, "sha256", None)
+    if digest is None:
+        hasher = hashlib.sha256()
+        for chunk in upload.chunks():
+            hasher.update(chunk)
+        digest = hasher.hexdigest()
+    return digest
+
+
+def evidence_record(tenant, target, record_id):
+    """The tenant's record for an EVIDENCE_TARGETS name, or None."""
+    model = EVIDENCE_TARGETS[target]["model"]
+    return model.objects.filter(organization=tenant, pk=record_id).first()
+
+
+def blob_digest(name: str):
+    """SHA-256 encoded in a blob path, None for pre-blob uploads."""
+    if not name.startswith(BLOB_PREFIX):
+        return None
+    # <aa>/<sha256>, or <aa>/<sha256>/<name> for blobs stored before names
+    # were dropped from the path
+    parts = name[len(BLOB_PREFIX):].split("/")
+    return parts[1] if len(parts) in (2, 3) else None
+
+
+def blob_filename(digest: str) -> str:
+    return f"{digest[:2]}/{digest}"
+
+
+def display_name(name: str) -> str:
+    """An uploaded file's own name (as EvidenceItem.name), for records and downloads."""
+    return os.path.basename(name or "")[:255] or "evidence"
+
+
+# ---------------------------------------------------------------------
+# Store / release
+# ---------------------------------------------------------------------
+def store_evidence(upload) -> EvidenceBlob:
+    """
+    Take one reference on the blob for `upload`'s content, writing the file
+    only if this content has never been stored (or its file went missing).
+    """
+    digest = upload_digest(upload)
+
+    with transaction.atomic():
+        blob, created = EvidenceBlob.objects.select_for_update().get_or_create(
+            sha256=digest, defaults={"size": upload.size}
+        )
+        if created or not blob.file or not blob.file.storage.exists(blob.file.name):
+            blob.file.save(blob_filename(digest), upload, save=False)
+            blob.save(update_fields=["file"])
+
+        EvidenceBlob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+        blob.refresh_from_db(fields=["ref_count"])
+
+    return blob
+
+
+def release_evidence(name: str) -> None:
+    """Drop one reference to the stored file `name`."""
+    if not name:
+        return
+
+    with transaction.atomic():
+        blob = EvidenceBlob.objects.select_for_update().filter(file=name).first()
+        if blob is None:
+            # Pre-blob upload: the record was its only owner
+            transaction.on_commit(lambda: default_storage.delete(name))
+            return
+
+        if blob.ref_count > 1:
+            EvidenceBlob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") - 1)
+            return
+
+        storage = blob.file.storage
+        blob.delete()
+        transaction.on_commit(lambda: storage.delete(name))
+
+
+def refresh_evidence_vectors(queryset) -> int:
+    """
+    Copy the extracted text of each row's evidence blob into its
+    evidence_vector (NULL while pending or without evidence). One UPDATE.
+    """
+    blob_vector = (
+        EvidenceBlob.objects.filter(file=OuterRef("evidence"), text_status="extracted")
+        .annotate(vector=SearchVector("text", config=SEARCH_CONFIG))
+        .values("vector")[:1]
+    )
+    return queryset.update(evidence_vector=Subquery(blob_vector))
+
+
+def _with_name_field(instance, field, update_fields):
+    """`<field>_name` (the display filename) if the model has one."""
+    name_field = f"{field}_name"
+    if not hasattr(instance, name_field):
+        return None, update_fields
+    if update_fields is not None:
+        update_fields = [*update_fields, name_field]
+    return name_field, update_fields
+
+
+def attach_evidence(instance, upload, field: str = "evidence", update_fields=None):
+    """Point `instance.<field>` at the blob for `upload` and save."""
+    name_field, update_fields = _with_name_field(instance, field, update_fields)
+    with transaction.atomic():
+        previous = getattr(instance, field).name
+        blob = store_evidence(upload)
+
+        setattr(instance, field, blob.file.name)
+        if name_field:
+            setattr(instance, name_field, display_name(upload.name))
+        instance.save(update_fields=update_fields)
+
+        release_evidence(previous)
+    return blob
+
+
+def detach_evidence(instance, field: str = "evidence", update_fields=None) -> bool:
+    """Clear `instance.<field>` and release its blob. Returns whether one was set."""
+    previous = getattr(instance, field).name
+    if not previous:
+        return False
+
+    name_field, update_fields = _with_name_field(instance, field, update_fields)
+    with transaction.atomic():
+        setattr(instance, field, None)
+        if name_field:
+            setattr(instance, name_field, "")
+        instance.save(update_fields=update_fields)
+        release_evidence(previous)
+    return True
+
+
+def _refresh_on_save(sender, instance, update_fields=None, raw=False, **kwargs):
+    # Full saves also rewrite evidence_vector from a possibly stale instance
+    if raw or (update_fields is not None and "evidence" not in update_fields):
+        return
+    refresh_evidence_vectors(sender.objects.filter(pk=instance.pk))
+
+
+def _release_on_delete(sender, instance, **kwargs):
+    release_evidence(instance.evidence.name)
+
+
+def _release_item_on_delete(sender, instance, **kwargs):
+    release_evidence(instance.file.name)
+
+
+for _model in EVIDENCE_MODELS:
+    post_save.connect(
+        _refresh_on_save, sender=_model, dispatch_uid=f"evidence-vector-{_model.__name__}"
+    )
+    post_delete.connect(
+        _release_on_delete, sender=_model, dispatch_uid=f"evidence-release-{_model.__name__}"
+    )
+post_delete.connect(_release_item_on_delete, sender=EvidenceItem, dispatch_uid="evidence-release-item")
@@ -0,0 +1,171 @@
+# backend/api/evidence_downloads.py
+
+"""
+Serving evidence files after the tenant check has passed.
+
+serve_evidence() answers conditional requests (ETag / Last-Modified: 304,
+412) itself, then hands the byte transfer off:
+
+  nginx   -> empty response + X-Accel-Redirect: nginx streams the file and
+             handles Range on its own
+  apache  -> empty response + X-Sendfile (mod_xsendfile)
+  default -> FileResponse over the open file (wsgi.file_wrapper / sendfile
+             where the server supports it); a single `Range: bytes=` request
+             gets a 206 over a bounded view of the same file
+
+Blob paths carry their SHA-256, which doubles as a strong ETag.
+"""
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from .evidence import blob_digest
+
+
+_BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeUnsatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int):
+    """
+    (start, end) inclusive for a single byte range, or None to send the whole
+    file (no header, multiple ranges, or a syntactically invalid one).
+    """
+    match = _BYTE_RANGE.match((header or "").strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeUnsatisfiable
+        return max(0, size - suffix), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeUnsatisfiable
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1)
+
+
+class FileRange:
+    """
+    Read-only view of bytes [start, start + length) of an open file.
+    Exposes fileno() so sendfile-capable servers can still use the fd
+    (the file is positioned at `start`; Content-Length bounds the transfer).
+    """
+
+    def __init__(self, fh, start, length):
+        self.fh = fh
+        self.remaining = length
+        fh.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.fh.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.fh.fileno()
+
+    def close(self):
+        self.fh.close()
+
+
+def _etag(name, stat):
+    digest = blob_digest(name)
+    if digest:
+        return f'"{digest}"'
+    return f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _if_range_matches(request, etag, last_modified) -> bool:
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag  # strong comparison; weak tags never match
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def serve_evidence(request, name: str, as_attachment: bool = False, filename: str = None):
+    """
+    Serve the stored file `name`. `filename` is what the client sees (the
+    referencing record's own name): blobs are shared between records and
+    tenants, so the stored path is not one to show.
+    """
+    filename = filename or os.path.basename(name)
+    try:
+        path = default_storage.path(name)
+        stat = os.stat(path)
+    except (FileNotFoundError, NotImplementedError):
+        raise Http404("Evidence file not found")
+
+    etag = _etag(name, stat)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _file_response(request, name, filename, path, stat.st_size, etag, last_modified)
+
+    response["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _file_response(request, name, filename, path, size, etag, last_modified):
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    backend = settings.EVIDENCE_SENDFILE_BACKEND
+    if backend == "nginx":
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = quote(settings.EVIDENCE_ACCEL_PREFIX.rstrip("/") + "/" + name)
+        return response
+    if backend == "apache":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = path
+        return response
+
+    byte_range = None
+    if _if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(request.META.get("HTTP_RANGE"), size)
+        except RangeUnsatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    fh = open(path, "rb")
+    if byte_range is None:
+        return FileResponse(fh, content_type=content_type)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = FileResponse(FileRange(fh, start, length), status=206, content_type=content_type)
+    response["Content-Length"] = str(length)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
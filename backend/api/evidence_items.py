@@ -0,0 +1,192 @@
+# backend/api/evidence_items.py
+
+"""
+Multi-file evidence (EvidenceItem) and bulk zip import.
+
+A zip's folder names are clause / control codes:
+
+    iso-27001:  4.1/context.pdf        -> ISO27001ClauseRecord (clause 4.1)
+                A.5.15/access.docx     -> SoAEntry (control A.5.15)
+    other:      4.1/...                -> ComplianceClause (that standard)
+
+Each file belongs to the deepest folder on its path that names a code, so
+zipping a wrapper folder ("audit-pack/A.5.15/...") works too. All folders
+are resolved (a few IN queries) before anything is stored; unmatched files
+fail the whole import.
+
+Each entry is decompressed once: it is hashed while being spooled (in memory
+up to FILE_UPLOAD_MAX_MEMORY_SIZE, like a regular upload), and the spool is
+written to the blob store only when the content is new. All items are created
+with one bulk_create.
+"""
+
+import hashlib
+import os
+import tempfile
+import zipfile
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+
+from .evidence import display_name, store_evidence
+from .models import ComplianceClause, EvidenceItem, Finding
+from .isms_models import ISO27001ClauseRecord, SoAEntry
+
+
+# API name → EvidenceItem FK, record model, tenant lookup
+ITEM_TARGETS = {
+    "compliance-clause": {"field": "compliance_clause", "model": ComplianceClause,
+                          "tenant": "organization"},
+    "iso27001-clause": {"field": "iso27001_clause", "model": ISO27001ClauseRecord,
+                        "tenant": "organization"},
+    "soa-entry": {"field": "soa_entry", "model": SoAEntry, "tenant": "organization"},
+    "finding": {"field": "finding", "model": Finding, "tenant": "audit__organization"},
+}
+
+ZIP_MAX_ENTRIES = 1000
+
+
+class ZipImportError(Exception):
+    def __init__(self, detail, unmatched=None):
+        super().__init__(detail)
+        self.detail = detail
+        self.unmatched = unmatched or []
+
+
+def item_record(tenant, target, record_id):
+    spec = ITEM_TARGETS[target]
+    return spec["model"].objects.filter(**{spec["tenant"]: tenant}, pk=record_id).first()
+
+
+def item_target(item):
+    """(target, record_id) of an EvidenceItem."""
+    for target, spec in ITEM_TARGETS.items():
+        record_id = getattr(item, f"{spec['field']}_id")
+        if record_id is not None:
+            return target, record_id
+    return None, None
+
+
+def add_items(tenant, user, target, record, uploads):
+    """Attach uploaded files to one record."""
+    field = ITEM_TARGETS[target]["field"]
+    with transaction.atomic():
+        items = []
+        for upload in uploads:
+            blob = store_evidence(upload)
+            items.append(EvidenceItem(
+                organization=tenant, **{field: record}, file=blob.file.name,
+                name=os.path.basename(upload.name), size=blob.size, uploaded_by=user,
+            ))
+        return EvidenceItem.objects.bulk_create(items)
+
+
+# ---------------------------------------------------------------------
+# Zip import
+# ---------------------------------------------------------------------
+def _normalize_code(folder: str) -> str:
+    code = folder.strip()
+    if code[:2].lower() == "a.":
+        code = "A." + code[2:]
+    return code
+
+
+def resolve_folders(tenant, standard, codes):
+    """{code: (target, record)} for the codes that name a tenant record."""
+    found = {}
+    if standard == "iso-27001":
+        control_codes = [c for c in codes if c.startswith("A.")]
+        clause_codes = [c for c in codes if not c.startswith("A.")]
+        if control_codes:
+            entries = SoAEntry.objects.filter(
+                organization=tenant, standard=standard, control__code__in=control_codes
+            ).select_related("control")
+            found.update({e.control.code: ("soa-entry", e) for e in entries})
+        if clause_codes:
+            records = ISO27001ClauseRecord.objects.filter(
+                organization=tenant, clause__code__in=clause_codes
+            ).select_related("clause")
+            found.update({r.clause.code: ("iso27001-clause", r) for r in records})
+    else:
+        clauses = ComplianceClause.objects.filter(
+            organization=tenant, standard=standard, clause_number__in=codes
+        )
+        found.update({c.clause_number: ("compliance-clause", c) for c in clauses})
+    return found
+
+
+def _plan(archive, tenant, standard):
+    """[(ZipInfo, target, record)] for every file, or ZipImportError."""
+    files = []
+    for info in archive.infolist():
+        path = PurePosixPath(info.filename)
+        if info.is_dir() or any(p.startswith((".", "__MACOSX")) for p in path.parts):
+            continue
+        files.append((info, [_normalize_code(p) for p in path.parts[:-1]]))
+
+    if not files:
+        raise ZipImportError("The archive contains no files.")
+    if len(files) > ZIP_MAX_ENTRIES:
+        raise ZipImportError(f"Too many files in archive (max {ZIP_MAX_ENTRIES}).")
+    if sum(info.file_size for info, _ in files) > settings.EVIDENCE_UPLOAD_MAX_SIZE:
+        raise ZipImportError("Archive content exceeds the evidence size limit.")
+
+    folders = resolve_folders(tenant, standard, {c for _, codes in files for c in codes})
+
+    plan, unmatched = [], []
+    for info, codes in files:
+        match = next((folders[c] for c in reversed(codes) if c in folders), None)
+        if match is None:
+            unmatched.append(info.filename)
+        else:
+            plan.append((info, *match))
+
+    if unmatched:
+        raise ZipImportError(
+            "Some files are not inside a folder named after a known clause or control code.",
+            unmatched=unmatched,
+        )
+    return plan
+
+
+def _spool_member(archive, info):
+    """The decompressed entry in a spooled temp file, with `.sha256` and `.size`."""
+    spool = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+    hasher, size = hashlib.sha256(), 0
+    with archive.open(info) as member:
+        for chunk in iter(lambda: member.read(File.DEFAULT_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            spool.write(chunk)
+            size += len(chunk)
+    spool.seek(0)
+    spool.sha256, spool.size = hasher.hexdigest(), size
+    return spool
+
+
+def import_evidence_zip(tenant, user, standard, upload):
+    try:
+        archive = zipfile.ZipFile(upload)
+    except zipfile.BadZipFile:
+        raise ZipImportError("Not a valid zip archive.")
+
+    with archive:
+        plan = _plan(archive, tenant, standard)
+
+        try:
+            with transaction.atomic():
+                items = []
+                for info, target, record in plan:
+                    name = display_name(PurePosixPath(info.filename).name)
+                    with _spool_member(archive, info) as spool:
+                        entry = File(spool, name=name)
+                        entry.size, entry.sha256 = spool.size, spool.sha256
+                        blob = store_evidence(entry)
+                    items.append(EvidenceItem(
+                        organization=tenant, **{ITEM_TARGETS[target]["field"]: record},
+                        file=blob.file.name, name=name, size=blob.size, uploaded_by=user,
+                    ))
+                return EvidenceItem.objects.bulk_create(items)
+        except zipfile.BadZipFile as exc:
+            raise ZipImportError(f"Corrupt archive: {exc}")
@@ -0,0 +1,200 @@
+# backend/api/evidence_text.py
+
+"""
+Background text extraction for evidence blobs.
+
+Never runs inside an upload request: new blobs start as text_status="pending"
+and `manage.py extract_evidence_text` works through the backlog in batches
+(id order), extracting in a worker pool and writing each batch back with one
+bulk UPDATE plus one evidence_vector refresh per record model. Every blob is
+marked as soon as its batch is written, so an interrupted run resumes where
+it stopped.
+
+Extractors are pure Python: DOCX/ODT via zipfile + iterparse, PDF via pypdf
+(optional; PDFs stay pending while it is not installed), plain text as-is.
+Other types (images, archives...) are marked "unsupported" and skipped.
+
+Blob paths carry no filename (api.evidence), so the type is sniffed from
+the file's first bytes; older named blobs still go by their extension.
+"""
+
+import codecs
+import os
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+from django.db import transaction
+from django.utils import timezone
+
+from .evidence import EVIDENCE_MODELS, refresh_evidence_vectors
+from .models import EvidenceBlob
+
+
+# tsvector input is capped at 1 MB by PostgreSQL; keep well below it
+TEXT_MAX_CHARS = 500_000
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+
+
+class ExtractorUnavailable(Exception):
+    """The extractor's optional dependency is missing; retry later."""
+
+
+def _capped(parts):
+    out, total = [], 0
+    for part in parts:
+        out.append(part)
+        total += len(part)
+        if total >= TEXT_MAX_CHARS:
+            break
+    return "".join(out)[:TEXT_MAX_CHARS]
+
+
+# ---------------------------------------------------------------------
+# Extractors: path -> text
+# ---------------------------------------------------------------------
+def extract_docx(path) -> str:
+    def parts():
+        with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml:
+            for _, elem in iterparse(xml):
+                if elem.tag == f"{_W}t" and elem.text:
+                    yield elem.text
+                elif elem.tag == f"{_W}tab":
+                    yield "\t"
+                elif elem.tag == f"{_W}p":
+                    yield "\n"
+                    elem.clear()
+
+    return _capped(parts())
+
+
+def extract_odt(path) -> str:
+    def parts():
+        with zipfile.ZipFile(path) as archive, archive.open("content.xml") as xml:
+            for _, elem in iterparse(xml):
+                if elem.tag in (f"{_TEXT}p", f"{_TEXT}h"):
+                    yield "".join(elem.itertext()) + "\n"
+                    elem.clear()
+
+    return _capped(parts())
+
+
+def extract_pdf(path) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ExtractorUnavailable("PDF extraction requires pypdf to be installed.")
+
+    reader = PdfReader(path)
+    return _capped((page.extract_text() or "") + "\n" for page in reader.pages)
+
+
+def extract_plain(path) -> str:
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        return fh.read(TEXT_MAX_CHARS)
+
+
+EXTRACTORS = {
+    ".pdf": extract_pdf,
+    ".docx": extract_docx,
+    ".odt": extract_odt,
+    ".txt": extract_plain,
+    ".csv": extract_plain,
+    ".md": extract_plain,
+}
+
+
+SNIFF_BYTES = 8192
+
+
+def sniff_type(path):
+    """The EXTRACTORS key for a file's content, or None."""
+    with open(path, "rb") as fh:
+        head = fh.read(SNIFF_BYTES)
+
+    if head.startswith(b"%PDF-"):
+        return ".pdf"
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(path) as archive:
+                names = set(archive.namelist())
+                if "word/document.xml" in names:
+                    return ".docx"
+                if "mimetype" in names and archive.read("mimetype").startswith(
+                    b"application/vnd.oasis.opendocument.text"
+                ):
+                    return ".odt"
+        except zipfile.BadZipFile:
+            pass
+        return None
+    if b"\x00" in head:
+        return None
+    try:
+        # final=False: the sample may end inside a multi-byte character
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+    return ".txt"
+
+
+def extract_file(path):
+    """
+    (status, text) for one file. Runs in pool workers: no database access.
+    status is "extracted", "unsupported", "failed", or "pending" when the
+    extractor is unavailable here.
+    """
+    try:
+        extension = os.path.splitext(path)[1].lower()
+        extractor = EXTRACTORS.get(extension if extension in EXTRACTORS else sniff_type(path))
+    except OSError:
+        return "failed", ""
+    if extractor is None:
+        return "unsupported", ""
+    try:
+        # NUL bytes cannot be stored in a PostgreSQL text column
+        return "extracted", extractor(path).replace("\x00", "")
+    except ExtractorUnavailable:
+        return "pending", ""
+    except Exception:
+        return "failed", ""
+
+
+# ---------------------------------------------------------------------
+# Batches
+# ---------------------------------------------------------------------
+def pending_batch(after_id: int, batch_size: int):
+    """Next pending blobs by id: [(id, name, path), ...]."""
+    blobs = (
+        EvidenceBlob.objects.filter(text_status="pending", id__gt=after_id)
+        .order_by("id")
+        .values_list("id", "file")[:batch_size]
+    )
+    storage = EvidenceBlob._meta.get_field("file").storage
+    return [(pk, name, storage.path(name)) for pk, name in blobs]
+
+
+def save_batch(batch, results) -> dict:
+    """
+    Write one batch of extract_file() results back: one bulk UPDATE of the
+    blobs, then one evidence_vector refresh per record model.
+    Returns counts by status.
+    """
+    now = timezone.now()
+    blobs, extracted_names, counts = [], [], {}
+
+    for (pk, name, _), (status, text) in zip(batch, results):
+        counts[status] = counts.get(status, 0) + 1
+        if status == "pending":
+            continue
+        blobs.append(EvidenceBlob(pk=pk, text=text, text_status=status, text_extracted_at=now))
+        if status == "extracted":
+            extracted_names.append(name)
+
+    with transaction.atomic():
+        EvidenceBlob.objects.bulk_update(blobs, ["text", "text_status", "text_extracted_at"])
+        if extracted_names:
+            for model in EVIDENCE_MODELS:
+                refresh_evidence_vectors(model.objects.filter(evidence__in=extracted_names))
+
+    return counts
@@ -0,0 +1,203 @@
+# backend/api/evidence_uploads.py
+
+"""
+Chunked, resumable evidence uploads.
+
+    start_upload()    -> EvidenceUpload session + empty temp file
+    append_chunk()    -> chunk N is streamed onto the end of the temp file
+    complete_upload() -> size + SHA-256 verified, file attached to the clause
+                         record through the blob store (api.evidence)
+
+Chunks must arrive in order. A client that lost a response re-reads the
+session (received / next_chunk) and carries on; re-sending a chunk that was
+already stored is acknowledged without writing. Bytes from a chunk that broke
+off midway are overwritten by the next append.
+
+Neither a chunk body nor the final hash is read under a row lock: positions
+are committed with conditional UPDATEs (see _claim).
+
+Temp files live in settings.EVIDENCE_UPLOAD_DIR; abandoned sessions are
+removed by `manage.py cleanup_evidence_uploads`.
+"""
+
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from .evidence import EVIDENCE_TARGETS, attach_evidence, evidence_record
+from .models import EvidenceUpload
+
+
+COPY_BUFFER_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    def __init__(self, detail, status=400):
+        super().__init__(detail)
+        self.detail = detail
+        self.status = status
+
+
+def temp_path(upload) -> str:
+    return os.path.join(settings.EVIDENCE_UPLOAD_DIR, f"{upload.pk}.part")
+
+
+def remove_temp_file(upload) -> None:
+    try:
+        os.remove(temp_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def file_sha256(path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(COPY_BUFFER_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+# ---------------------------------------------------------------------
+# Session lifecycle
+# ---------------------------------------------------------------------
+def start_upload(tenant, user, target, record_id, filename, size, sha256="") -> EvidenceUpload:
+    if evidence_record(tenant, target, record_id) is None:
+        raise UploadError("Clause record not found.", status=404)
+
+    upload = EvidenceUpload.objects.create(
+        organization=tenant,
+        created_by=user if user and user.is_authenticated else None,
+        target=target,
+        record_id=record_id,
+        filename=filename,
+        size=size,
+        sha256=sha256.lower(),
+    )
+    os.makedirs(settings.EVIDENCE_UPLOAD_DIR, exist_ok=True)
+    open(temp_path(upload), "wb").close()
+    return upload
+
+
+def _claim(upload, **changes) -> bool:
+    """
+    Conditional UPDATE: apply `changes` only if the session is still open at
+    the position `upload` was read at. False when another request got there
+    first.
+    """
+    return bool(
+        EvidenceUpload.objects.filter(
+            pk=upload.pk, status="open", received=upload.received, next_chunk=upload.next_chunk
+        ).update(updated_at=timezone.now(), **changes)
+    )
+
+
+def append_chunk(upload, index: int, stream, length: int) -> EvidenceUpload:
+    """
+    Stream `length` bytes of chunk `index` from `stream` into the temp file.
+
+    No lock is held while the body arrives: the session position is checked,
+    the bytes are written at that offset, and the new position is committed
+    with a conditional UPDATE. A concurrent copy of the same chunk writes the
+    same bytes at the same offset; only one of them advances the session.
+    """
+    if length <= 0:
+        raise UploadError("Empty chunk.")
+    if length > settings.EVIDENCE_CHUNK_SIZE:
+        raise UploadError(
+            f"Chunk too large (max {settings.EVIDENCE_CHUNK_SIZE} bytes).", status=413
+        )
+
+    upload = EvidenceUpload.objects.get(pk=upload.pk)
+    if upload.status != "open":
+        raise UploadError("Upload already completed.", status=409)
+    if index < upload.next_chunk:
+        return upload  # retried chunk, already stored
+    if index > upload.next_chunk:
+        raise UploadError(f"Expected chunk {upload.next_chunk}.", status=409)
+    if upload.received + length > upload.size:
+        raise UploadError("Chunk exceeds the declared upload size.")
+
+    # Bytes past `received` (a chunk that broke off) are simply overwritten
+    written = 0
+    with open(temp_path(upload), "r+b") as fh:
+        fh.seek(upload.received)
+        while written < length:
+            block = stream.read(min(COPY_BUFFER_SIZE, length - written))
+            if not block:
+                break
+            fh.write(block)
+            written += len(block)
+
+    if written != length:
+        raise UploadError(f"Incomplete chunk: received {written} of {length} bytes.")
+
+    if not _claim(upload, received=upload.received + written, next_chunk=index + 1):
+        current = EvidenceUpload.objects.get(pk=upload.pk)
+        if current.status == "open" and current.next_chunk > index:
+            return current  # the same chunk, stored by a concurrent retry
+        raise UploadError("Upload changed while the chunk was sent; re-read it.", status=409)
+
+    return EvidenceUpload.objects.get(pk=upload.pk)
+
+
+def complete_upload(upload, sha256=""):
+    """
+    Verify size and checksum, attach the file, close the session.
+    Returns (upload, record). Completing twice returns the same record.
+
+    The file is hashed before the session row is locked; the lock is only
+    held while the blob is stored and the record updated.
+    """
+    spec = EVIDENCE_TARGETS[upload.target]
+
+    upload = EvidenceUpload.objects.get(pk=upload.pk)
+    record = evidence_record(upload.organization, upload.target, upload.record_id)
+    if record is None:
+        raise UploadError("Clause record not found.", status=404)
+    if upload.status == "complete":
+        return upload, record
+
+    if upload.received != upload.size:
+        raise UploadError(f"Upload incomplete: received {upload.received} of {upload.size} bytes.")
+
+    expected = (sha256 or upload.sha256).lower()
+    if not expected:
+        raise UploadError("sha256 is required to complete the upload.")
+
+    path = temp_path(upload)
+    digest = file_sha256(path)
+
+    if digest != expected:
+        # Start over from chunk 0; the session itself stays usable
+        if _claim(upload, received=0, next_chunk=0):
+            open(path, "wb").close()
+        raise UploadError("Checksum mismatch; upload discarded, resend from chunk 0.")
+
+    with transaction.atomic():
+        locked = EvidenceUpload.objects.select_for_update().get(pk=upload.pk)
+        if locked.status == "complete":
+            return locked, evidence_record(locked.organization, locked.target, locked.record_id)
+        if (locked.received, locked.next_chunk) != (upload.received, upload.next_chunk):
+            raise UploadError("Upload changed while it was being verified; retry.", status=409)
+
+        with open(path, "rb") as fh:
+            evidence = File(fh, name=upload.filename)
+            evidence.size = upload.size
+            evidence.sha256 = digest  # store_evidence skips re-hashing
+            attach_evidence(record, evidence, update_fields=spec["update_fields"])
+
+        locked.status = "complete"
+        locked.sha256 = digest
+        locked.save(update_fields=["status", "sha256", "updated_at"])
+        transaction.on_commit(lambda: remove_temp_file(locked))
+
+    return locked, record
+
+
+def abort_upload(upload) -> None:
+    remove_temp_file(upload)
+    upload.delete()
@@ -0,0 +1,298 @@
+# backend/api/evidence_views.py
+from rest_framework import permissions, status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .evidence import EVIDENCE_TARGETS, evidence_record
+from .evidence_downloads import serve_evidence
+from .evidence_items import (
+    ITEM_TARGETS,
+    ZipImportError,
+    add_items,
+    import_evidence_zip,
+    item_record,
+    item_target,
+)
+from .evidence_uploads import (
+    UploadError,
+    abort_upload,
+    append_chunk,
+    complete_upload,
+    start_upload,
+)
+from .isms_audit_lock import ISMS_EVIDENCE_TARGETS, ISMSAuditLockMixin
+from .isms_serializers import ISO27001ClauseRecordSerializer
+from .models import EvidenceItem, EvidenceUpload
+from .serializers import (
+    ComplianceClauseSerializer,
+    EvidenceItemSerializer,
+    EvidenceUploadSerializer,
+)
+
+
+def _error(exc: UploadError):
+    return Response({"detail": exc.detail}, status=exc.status)
+
+
+class EvidenceUploadMixin(ISMSAuditLockMixin):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def audit_lock_applies(self, request, *args, **kwargs):
+        # Chunks only reach a temp file; the record changes on complete
+        return False
+
+    def get_upload(self, request, upload_id):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return None
+        return EvidenceUpload.objects.filter(pk=upload_id, organization=tenant).first()
+
+
+class EvidenceUploadCreateView(EvidenceUploadMixin, APIView):
+    """
+    POST /api/evidence/uploads/
+    {"target": "iso27001-clause", "record_id": 12, "filename": "pack.zip",
+     "size": 209715200, "sha256": "<optional, may be sent on complete>"}
+    """
+
+    def audit_lock_applies(self, request, *args, **kwargs):
+        return request.data.get("target") in ISMS_EVIDENCE_TARGETS
+
+    def post(self, request):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return Response({"detail": "Tenant missing"}, status=status.HTTP_400_BAD_REQUEST)
+
+        ser = EvidenceUploadSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+
+        try:
+            upload = start_upload(tenant, request.user, **ser.validated_data)
+        except UploadError as exc:
+            return _error(exc)
+
+        return Response(EvidenceUploadSerializer(upload).data, status=status.HTTP_201_CREATED)
+
+
+class EvidenceUploadDetailView(EvidenceUploadMixin, APIView):
+    """GET: resume state (received / next_chunk). DELETE: abandon the upload."""
+
+    def get(self, request, upload_id):
+        upload = self.get_upload(request, upload_id)
+        if upload is None:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(EvidenceUploadSerializer(upload).data)
+
+    def delete(self, request, upload_id):
+        upload = self.get_upload(request, upload_id)
+        if upload is None:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        abort_upload(upload)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class EvidenceUploadChunkView(EvidenceUploadMixin, APIView):
+    """PUT /api/evidence/uploads/<id>/chunks/<n>/ with the raw chunk bytes as body."""
+
+    def put(self, request, upload_id, index):
+        upload = self.get_upload(request, upload_id)
+        if upload is None:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            length = int(request.META.get("CONTENT_LENGTH") or "")
+        except ValueError:
+            return Response(
+                {"detail": "Content-Length is required."},
+                status=status.HTTP_411_LENGTH_REQUIRED,
+            )
+
+        try:
+            upload = append_chunk(upload, index, request.stream, length)
+        except UploadError as exc:
+            return _error(exc)
+
+        return Response(EvidenceUploadSerializer(upload).data)
+
+
+class EvidenceUploadCompleteView(EvidenceUploadMixin, APIView):
+    """
+    POST /api/evidence/uploads/<id>/complete/ [{"sha256": "..."}]
+    Returns the clause record, same as the single-request evidence upload.
+    """
+
+    def post(self, request, upload_id):
+        upload = self.get_upload(request, upload_id)
+        if upload is None:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        if upload.target in ISMS_EVIDENCE_TARGETS:
+            self.check_audit_lock(request)
+
+        try:
+            upload, record = complete_upload(upload, request.data.get("sha256") or "")
+        except UploadError as exc:
+            return _error(exc)
+
+        if upload.target == "iso27001-clause":
+            data = ISO27001ClauseRecordSerializer(record, context={"request": request}).data
+        else:
+            data = ComplianceClauseSerializer(record).data
+        return Response(data)
+
+
+class EvidenceDownloadView(APIView):
+    """
+    GET /api/evidence/<target>/<record_id>/download/[?download=1]
+    The tenant's own evidence only; supports Range and conditional requests.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, target, record_id):
+        tenant = getattr(request, "tenant", None)
+        if not tenant or target not in EVIDENCE_TARGETS:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        record = evidence_record(tenant, target, record_id)
+        if record is None or not record.evidence:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        as_attachment = request.query_params.get("download") in {"1", "true"}
+        return serve_evidence(request, record.evidence.name, as_attachment=as_attachment,
+                              filename=record.evidence_name or None)
+
+
+# ---------------------------------------------------------------------
+# Evidence items (many files per record)
+# ---------------------------------------------------------------------
+def _uploader(request):
+    return request.user if request.user and request.user.is_authenticated else None
+
+
+class EvidenceItemListCreateView(ISMSAuditLockMixin, APIView):
+    """
+    GET  /api/evidence/items/?target=soa-entry&record_id=12
+    POST /api/evidence/items/  multipart: target, record_id, file (repeatable)
+    target: compliance-clause | iso27001-clause | soa-entry | finding
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def audit_lock_applies(self, request, *args, **kwargs):
+        return request.method == "POST" and request.data.get("target") in ISMS_EVIDENCE_TARGETS
+
+    def _record(self, request, params):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return None, Response({"detail": "Tenant missing"}, status=status.HTTP_400_BAD_REQUEST)
+
+        target = params.get("target")
+        if target not in ITEM_TARGETS:
+            return None, Response(
+                {"detail": f"target must be one of: {', '.join(ITEM_TARGETS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            record_id = int(params.get("record_id"))
+        except (TypeError, ValueError):
+            return None, Response({"detail": "record_id is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        record = item_record(tenant, target, record_id)
+        if record is None:
+            return None, Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        return record, None
+
+    def get(self, request):
+        record, error = self._record(request, request.query_params)
+        if error:
+            return error
+
+        field = ITEM_TARGETS[request.query_params["target"]]["field"]
+        items = EvidenceItem.objects.filter(organization=request.tenant, **{field: record})
+        return Response(EvidenceItemSerializer(items, many=True, context={"request": request}).data)
+
+    def post(self, request):
+        record, error = self._record(request, request.data)
+        if error:
+            return error
+
+        files = request.FILES.getlist("file")
+        if not files:
+            return Response({"detail": "No file uploaded (field: file)"}, status=status.HTTP_400_BAD_REQUEST)
+
+        items = add_items(request.tenant, _uploader(request), request.data["target"], record, files)
+        return Response(
+            EvidenceItemSerializer(items, many=True, context={"request": request}).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class EvidenceItemZipImportView(ISMSAuditLockMixin, APIView):
+    """
+    POST /api/evidence/items/zip/  multipart: file (zip), standard (default iso-27001)
+    Folder names are clause / control codes, see api.evidence_items.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def audit_lock_applies(self, request, *args, **kwargs):
+        return (request.data.get("standard") or "iso-27001") == "iso-27001"
+
+    def post(self, request):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return Response({"detail": "Tenant missing"}, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = request.FILES.get("file")
+        if not upload:
+            return Response({"detail": "No file uploaded (field: file)"}, status=status.HTTP_400_BAD_REQUEST)
+
+        standard = request.data.get("standard") or "iso-27001"
+        try:
+            items = import_evidence_zip(tenant, _uploader(request), standard, upload)
+        except ZipImportError as exc:
+            body = {"detail": exc.detail}
+            if exc.unmatched:
+                body["unmatched"] = exc.unmatched
+            return Response(body, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "created": len(items),
+                "items": EvidenceItemSerializer(items, many=True, context={"request": request}).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class EvidenceItemMixin:
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_item(self, request, pk):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return None
+        return EvidenceItem.objects.filter(pk=pk, organization=tenant).first()
+
+
+class EvidenceItemDetailView(ISMSAuditLockMixin, EvidenceItemMixin, APIView):
+    def audit_lock_applies(self, request, *args, **kwargs):
+        return False  # depends on the item's target, checked in delete()
+
+    def delete(self, request, pk):
+        item = self.get_item(request, pk)
+        if item is None:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        if item_target(item)[0] in ISMS_EVIDENCE_TARGETS:
+            self.check_audit_lock(request)
+        item.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class EvidenceItemDownloadView(EvidenceItemMixin, APIView):
+    def get(self, request, pk):
+        item = self.get_item(request, pk)
+        if item is None:
+            return Response({"detail": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        as_attachment = request.query_params.get("download") in {"1", "true"}
+        return serve_evidence(request, item.file.name, as_attachment=as_attachment, filename=item.name)
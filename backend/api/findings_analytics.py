@@ -0,0 +1,143 @@
+# backend/api/findings_analytics.py
+
+"""
+Findings aging / remediation analytics, computed in the database.
+
+ONE grouped query per request: findings JOIN audits, GROUP BY (audit,
+severity), with conditional aggregates for counts, time to close
+(completion_date - audit.date) and the aging / overdue buckets (date
+comparisons against today). The result has at most audits × severities
+rows whatever the number of findings; the per-audit, per-standard,
+per-severity and overall figures are sums over those rows.
+
+    mean_days_to_close   over closed findings that have a completion_date
+    aging                open findings by days since the audit date
+    overdue              open findings by days past target_date
+"""
+
+from datetime import timedelta
+
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+
+from .models import Finding
+
+
+# (label, min days, max days or None)
+AGE_BUCKETS = (("0-30", 0, 30), ("31-60", 31, 60), ("61-90", 61, 90), ("90+", 91, None))
+OVERDUE_BUCKETS = (("1-30", 1, 30), ("31-60", 31, 60), ("61-90", 61, 90), ("90+", 91, None))
+
+SEVERITIES = ("High", "Medium", "Low")
+
+OPEN = Q(status="Open")
+CLOSED = Q(status="Closed")
+TIMED = CLOSED & Q(completion_date__isnull=False)
+
+
+def _days_ago(field, today, low, high):
+    """`field` is between `low` and `high` days before today (inclusive)."""
+    q = Q(**{f"{field}__lte": today - timedelta(days=low)})
+    if high is not None:
+        q &= Q(**{f"{field}__gte": today - timedelta(days=high)})
+    return q
+
+
+def _aggregates(today):
+    aggregates = {
+        "total": Count("id"),
+        "open": Count("id", filter=OPEN),
+        "closed": Count("id", filter=CLOSED),
+        "timed": Count("id", filter=TIMED),
+        "close_time": Sum(
+            ExpressionWrapper(F("completion_date") - F("audit__date"), output_field=DurationField()),
+            filter=TIMED,
+        ),
+    }
+    for label, low, high in AGE_BUCKETS:
+        aggregates[f"age:{label}"] = Count(
+            "id", filter=OPEN & _days_ago("audit__date", today, low, high)
+        )
+    for label, low, high in OVERDUE_BUCKETS:
+        aggregates[f"overdue:{label}"] = Count(
+            "id", filter=OPEN & _days_ago("target_date", today, low, high)
+        )
+    return aggregates
+
+
+class _Totals:
+    def __init__(self):
+        self.total = self.open = self.closed = self.timed = 0
+        self.close_time = timedelta()
+        self.aging = {label: 0 for label, _, _ in AGE_BUCKETS}
+        self.overdue = {label: 0 for label, _, _ in OVERDUE_BUCKETS}
+
+    def add(self, row):
+        self.total += row["total"]
+        self.open += row["open"]
+        self.closed += row["closed"]
+        self.timed += row["timed"]
+        self.close_time += row["close_time"] or timedelta()
+        for label in self.aging:
+            self.aging[label] += row[f"age:{label}"]
+        for label in self.overdue:
+            self.overdue[label] += row[f"overdue:{label}"]
+
+    def data(self):
+        mean = self.close_time.total_seconds() / 86400 / self.timed if self.timed else None
+        return {
+            "findings": self.total,
+            "open": self.open,
+            "closed": self.closed,
+            "overdue": sum(self.overdue.values()),
+            "mean_days_to_close": round(mean, 1) if mean is not None else None,
+            "aging": self.aging,
+            "overdue_by_age": self.overdue,
+        }
+
+
+def findings_analytics(tenant, today, standard=None, date_from=None, date_to=None):
+    """
+    Analytics for the tenant's findings. standard / date_from / date_to
+    filter on the audit (its standard and date).
+    """
+    qs = Finding.objects.filter(audit__organization=tenant)
+    if standard:
+        qs = qs.filter(audit__standard=standard)
+    if date_from:
+        qs = qs.filter(audit__date__gte=date_from)
+    if date_to:
+        qs = qs.filter(audit__date__lte=date_to)
+
+    rows = (
+        qs.values("audit_id", "audit__audit_id", "audit__audit_name", "audit__standard",
+                  "audit__date", "severity")
+        .annotate(**_aggregates(today))
+        .order_by("audit__date", "audit_id", "severity")
+    )
+
+    overall = _Totals()
+    by_severity, by_standard, by_audit, audits = {}, {}, {}, {}
+    for row in rows:
+        overall.add(row)
+        by_severity.setdefault(row["severity"], _Totals()).add(row)
+        by_standard.setdefault(row["audit__standard"], _Totals()).add(row)
+        by_audit.setdefault(row["audit_id"], _Totals()).add(row)
+        audits.setdefault(row["audit_id"], {
+            "id": row["audit_id"],
+            "audit_id": row["audit__audit_id"],
+            "audit_name": row["audit__audit_name"],
+            "standard": row["audit__standard"],
+            "date": row["audit__date"],
+        })
+
+    severities = list(SEVERITIES) + sorted(set(by_severity) - set(SEVERITIES))
+    return {
+        "as_of": today,
+        "totals": overall.data(),
+        "by_severity": [
+            {"severity": s, **by_severity.get(s, _Totals()).data()} for s in severities
+        ],
+        "by_standard": [
+            {"standard": s, **totals.data()} for s, totals in sorted(by_standard.items())
+        ],
+        "by_audit": [{**audits[pk], **totals.data()} for pk, totals in by_audit.items()],
+    }
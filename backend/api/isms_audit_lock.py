@@ -1,17 +1,99 @@
 # backend/api/isms_audit_lock.py
 
+"""
+ISO/IEC 27001 audit lock.
+
+A tenant's ISMS is read-only ONLY while one of ITS OWN ISO/IEC 27001
+audits is actively IN PROGRESS.
+
+    Scheduled audits → editable
+    Completed audits → editable
+
+The lock state is cached per tenant, so the check on a write request is a
+cache lookup (no query) in the common case. Saving or deleting an Audit
+drops that tenant's entry; other processes pick the change up within
+AUDIT_LOCK_CACHE_SECONDS (immediately with a shared cache backend).
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework import permissions, status
+from rest_framework.exceptions import APIException
+
 from api.models import Audit
 
 
-def is_iso27001_audit_locked():
+ISMS_STANDARD = "iso-27001"
+
+# How long a process may serve a cached lock state without re-reading it
+AUDIT_LOCK_CACHE_SECONDS = 60
+
+# Evidence targets that belong to the ISMS (see api.evidence / api.evidence_items)
+ISMS_EVIDENCE_TARGETS = {"iso27001-clause", "soa-entry"}
+
+
+def _lock_key(tenant_id) -> str:
+    return f"isms:audit-lock:{tenant_id}"
+
+
+def is_iso27001_audit_locked(tenant) -> bool:
+    tenant_id = getattr(tenant, "pk", tenant)
+    key = _lock_key(tenant_id)
+    locked = cache.get(key)
+    if locked is None:
+        locked = Audit.objects.filter(
+            organization_id=tenant_id,
+            standard=ISMS_STANDARD,
+            status="In Progress",
+        ).exists()
+        cache.set(key, locked, AUDIT_LOCK_CACHE_SECONDS)
+    return locked
+
+
+def invalidate_audit_lock(tenant_id) -> None:
+    cache.delete(_lock_key(tenant_id))
+
+
+@receiver(post_save, sender=Audit)
+@receiver(post_delete, sender=Audit)
+def _audit_changed(sender, instance, **kwargs):
+    tenant_id = instance.organization_id
+    invalidate_audit_lock(tenant_id)
+    # Again once committed: a concurrent request may have re-cached the old
+    # state from outside this transaction in the meantime
+    transaction.on_commit(lambda: invalidate_audit_lock(tenant_id))
+
+
+# ---------------------------------------------------------------------
+# View mixin
+# ---------------------------------------------------------------------
+class AuditLocked(APIException):
+    status_code = status.HTTP_423_LOCKED
+    default_detail = "ISMS is read-only while audit in progress."
+    default_code = "audit_locked"
+
+
+class ISMSAuditLockMixin:
     """
-    ISMS is read-only ONLY while an ISO/IEC 27001 audit
-    is actively IN PROGRESS.
+    For DRF views that write ISMS data: unsafe methods get 423 while the
+    tenant has an ISO 27001 audit in progress.
 
-    Scheduled audits → editable
-    Completed audits → editable
+    Override audit_lock_applies() when only some requests touch the ISMS;
+    views that only know that after loading an object call
+    check_audit_lock() themselves.
     """
-    return Audit.objects.filter(
-        standard="iso-27001",
-        status="In Progress",
-    ).exists()
+
+    def audit_lock_applies(self, request, *args, **kwargs) -> bool:
+        return request.method not in permissions.SAFE_METHODS
+
+    def check_audit_lock(self, request):
+        tenant = getattr(request, "tenant", None)
+        if tenant is not None and is_iso27001_audit_locked(tenant):
+            raise AuditLocked()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.audit_lock_applies(request, *args, **kwargs):
+            self.check_audit_lock(request)
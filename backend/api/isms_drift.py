@@ -0,0 +1,187 @@
+# backend/api/isms_drift.py
+
+"""
+Drift detection for derived ISMS state.
+
+isms_signals keeps derived fields consistent on model.save() — but
+queryset.update(), bulk_create() and raw SQL skip the signals. This module
+recomputes what every derived value SHOULD be, for ALL tenants at once,
+with a handful of grouped queries, and reports (or repairs) the rows whose
+stored value differs.
+
+Checks run in cascade order (SoA → Risk → Asset). Each check's fixes are
+applied inside the surrounding transaction before the next check runs, so
+downstream expectations are computed from corrected upstream state. When
+not repairing, the transaction is rolled back at the end.
+"""
+
+from collections import defaultdict
+from typing import Dict, List
+
+from django.db import connection, transaction
+from django.db.models import F
+
+from .isms_models import Control, ISORisk, SoAEntry, Asset, TenantLibrarySeed
+from .isms_signals import (
+    annotate_asset_security,
+    compute_risk_coverage_map,
+    risk_level_case,
+    soa_entries_missing_applicability,
+)
+
+
+def _by_tenant(rows) -> Dict[str, List[int]]:
+    """[(org_id, row_id), ...] → {org_id: [row_id, ...]}"""
+    grouped = defaultdict(list)
+    for org_id, row_id in rows:
+        grouped[str(org_id)].append(row_id)
+    return grouped
+
+
+# ---------------------------------------------------------------------
+# Individual checks: each returns {org_id: [...]} and repairs in place
+# ---------------------------------------------------------------------
+def check_soa_completeness() -> Dict[str, List[str]]:
+    """
+    SoA rows missing for library controls, in tenants seeded for that
+    standard (TenantLibrarySeed). ONE query finds every missing
+    (tenant, control) pair with its derived applicability; ONE bulk_create
+    inserts them. Reports the missing control codes per tenant.
+    """
+    seeds = TenantLibrarySeed._meta.db_table
+    controls = Control._meta.db_table
+    entries = SoAEntry._meta.db_table
+    risks = ISORisk._meta.db_table
+    risk_controls = ISORisk.controls.through._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT s.organization_id, c.id, c.standard, c.code,
+                   EXISTS (
+                       SELECT 1 FROM {risk_controls} rc
+                       JOIN {risks} r ON r.id = rc.isorisk_id
+                       WHERE rc.control_id = c.id AND r.organization_id = s.organization_id
+                         AND r.standard = c.standard AND r.treatment = 'Reduce'
+                   )
+            FROM {seeds} s
+            JOIN {controls} c ON c.standard = s.standard
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {entries} e
+                WHERE e.organization_id = s.organization_id
+                  AND e.control_id = c.id AND e.standard = c.standard
+            )
+            ORDER BY s.organization_id, c.id
+            """
+        )
+        missing = cursor.fetchall()
+
+    # ONLY Reduce risks justify applicability (same rule as isms_signals)
+    SoAEntry.objects.bulk_create(
+        [
+            SoAEntry(
+                organization_id=org_id,
+                control_id=control_id,
+                standard=standard,
+                applicable=applicable,
+                status="Not Implemented",
+                justification="",
+                evidence_notes="",
+            )
+            for org_id, control_id, standard, _, applicable in missing
+        ],
+        ignore_conflicts=True,
+    )
+
+    gaps = defaultdict(list)
+    for org_id, _, _, code, _ in missing:
+        gaps[str(org_id)].append(code)
+    return gaps
+
+
+def check_soa_applicability() -> Dict[str, List[int]]:
+    stale = soa_entries_missing_applicability(ISORisk.objects.all())
+    drift = _by_tenant(stale.values_list("organization_id", "id").order_by())
+
+    SoAEntry.objects.filter(id__in=[i for ids in drift.values() for i in ids]).update(
+        applicable=True
+    )
+    return drift
+
+
+def check_risk_scores() -> Dict[str, List[int]]:
+    score = F("likelihood") * F("impact")
+    stale = ISORisk.objects.exclude(risk_score=score) | ISORisk.objects.exclude(
+        level=risk_level_case("risk_score")
+    )
+    drift = _by_tenant(stale.values_list("organization_id", "id").order_by())
+
+    ids = [i for ids in drift.values() for i in ids]
+    ISORisk.objects.filter(id__in=ids).update(risk_score=score)
+    ISORisk.objects.filter(id__in=ids).update(level=risk_level_case("risk_score"))
+    return drift
+
+
+def check_risk_coverage() -> Dict[str, List[int]]:
+    expected = compute_risk_coverage_map(ISORisk.objects.all())
+
+    drift = defaultdict(list)
+    fixes = defaultdict(list)
+    for risk_id, org_id, stored in ISORisk.objects.values_list(
+        "id", "organization_id", "control_coverage"
+    ).order_by():
+        coverage = expected.get(risk_id)
+        if coverage is None:
+            continue  # inserted after the expected map was built: next run
+        if stored != coverage:
+            drift[str(org_id)].append(risk_id)
+            fixes[coverage].append(risk_id)
+
+    for coverage, ids in fixes.items():
+        ISORisk.objects.filter(id__in=ids).update(control_coverage=coverage)
+    return drift
+
+
+def check_asset_security() -> Dict[str, List[int]]:
+    rows = (
+        annotate_asset_security(Asset.objects.all())
+        .values_list("id", "organization_id", "is_secure", "risk_count", "secured_count")
+        .order_by()
+    )
+
+    drift = defaultdict(list)
+    fixes = defaultdict(list)
+    for asset_id, org_id, stored, total, secured in rows:
+        expected = bool(total) and secured == total
+        if stored != expected:
+            drift[str(org_id)].append(asset_id)
+            fixes[expected].append(asset_id)
+
+    for secure, ids in fixes.items():
+        Asset.objects.filter(id__in=ids).update(is_secure=secure)
+    return drift
+
+
+# Cascade order matters (see module docstring)
+CHECKS = [
+    ("soa_missing", check_soa_completeness),
+    ("soa_applicable", check_soa_applicability),
+    ("risk_score", check_risk_scores),
+    ("risk_coverage", check_risk_coverage),
+    ("asset_security", check_asset_security),
+]
+
+
+def detect_isms_drift(repair: bool = False) -> Dict[str, Dict[str, list]]:
+    """
+    Run every check across all tenants.
+    Returns {check_name: {org_id: [drifted ids / standards]}}.
+    Changes are only committed when repair=True.
+    """
+    report = {}
+    with transaction.atomic():
+        for name, check in CHECKS:
+            report[name] = dict(check())
+        if not repair:
+            transaction.set_rollback(True)
+    return report
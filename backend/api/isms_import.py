@@ -0,0 +1,377 @@
+# backend/api/isms_import.py
+
+"""
+Bulk import of tenant ISMS data (CSV / XLSX uploads).
+
+All rows are validated up front. Nothing is written unless every row is
+valid, so a failed import never leaves a half-populated register behind.
+
+Writes go through bulk_create(), which skips model.save() and the ISMS
+signals — derived state is rebuilt afterwards with ONE set-based
+derivation pass (see isms_signals.derive_tenant_isms_state).
+"""
+
+import csv
+import io
+import os
+import time
+
+from django.db import transaction
+
+from .isms_library import is_library_standard
+from .isms_models import Asset, Control, ISORisk
+from .models import Audit
+from .isms_signals import NON_REDUCE_TREATMENTS, derive_tenant_isms_state
+from .search import refresh_search_vectors
+from .sequences import assign_ids
+
+
+RISK_TREATMENTS = ("Reduce",) + NON_REDUCE_TREATMENTS
+RISK_STATUSES = (("Open", "Open"), ("Closed", "Closed"))
+
+# column → max length (free-text risk columns besides title)
+RISK_TEXT_COLUMNS = {"owner": 128}
+
+
+class ImportFileError(Exception):
+    """The upload itself could not be read (bad type, encoding, no header)."""
+
+
+# ---------------------------------------------------------------------
+# Upload readers
+# ---------------------------------------------------------------------
+def _normalize_header(value) -> str:
+    return str(value or "").strip().lower().replace(" ", "_")
+
+
+def _clean(value) -> str:
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _iter_csv_rows(upload):
+    try:
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        yield from csv.reader(text)
+    except UnicodeDecodeError:
+        raise ImportFileError("CSV files must be UTF-8 encoded.")
+
+
+def _iter_xlsx_rows(upload):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError("XLSX import requires openpyxl to be installed.")
+
+    try:
+        wb = load_workbook(upload, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFileError("Could not read XLSX file.")
+
+    try:
+        yield from wb.active.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def iter_upload_rows(upload):
+    """
+    Yield (row_number, {column: value}) for a CSV or XLSX upload.
+    Row numbers match the spreadsheet (header = row 1). Blank rows are skipped.
+    """
+    ext = os.path.splitext(upload.name or "")[1].lower()
+    if ext == ".csv":
+        rows = _iter_csv_rows(upload)
+    elif ext in (".xlsx", ".xlsm"):
+        rows = _iter_xlsx_rows(upload)
+    else:
+        raise ImportFileError("Unsupported file type. Upload a .csv or .xlsx file.")
+
+    header = None
+    for row_number, row in enumerate(rows, start=1):
+        if header is None:
+            header = [_normalize_header(h) for h in row]
+            continue
+
+        values = [_clean(v) for v in row]
+        if not any(values):
+            continue
+
+        yield row_number, dict(zip(header, values))
+
+    if header is None:
+        raise ImportFileError("File is empty (a header row is required).")
+
+
+# ---------------------------------------------------------------------
+# ISO 27001 risk register import
+# ---------------------------------------------------------------------
+def _parse_scale(value: str, field: str, errors: dict):
+    if not value:
+        return 3  # model default
+    # "3" or "3.0" (XLSX numeric cells); not "3.7", "nan" or "inf"
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is None or not number.is_integer():
+        errors[field] = "Must be a whole number between 1 and 5."
+        return None
+    n = int(number)
+    if not 1 <= n <= 5:
+        errors[field] = "Must be between 1 and 5."
+        return None
+    return n
+
+
+def _parse_choice(value: str, choices, field: str, errors: dict):
+    """Accept a choice key or its label, case-insensitively ("High" → "high")."""
+    if not value:
+        return None
+    lookup = {}
+    for key, label in choices:
+        lookup[key.lower()] = key
+        lookup[label.lower()] = key
+    key = lookup.get(value.lower())
+    if key is None:
+        errors[field] = f"Must be one of: {', '.join(k for k, _ in choices)}."
+    return key
+
+
+def _split_codes(value: str):
+    return [c.strip() for c in value.replace(";", ",").split(",") if c.strip()]
+
+
+def validate_risk_rows(tenant, rows, standard="iso-27001"):
+    """
+    Validate every row and resolve asset / control references in bulk
+    (one query each). Returns (prepared_rows, errors).
+    """
+    rows = list(rows)
+
+    asset_refs = {r.get("asset_id", "") for _, r in rows} - {""}
+    assets = {
+        a.asset_id: a
+        for a in Asset.objects.filter(organization=tenant, asset_id__in=asset_refs)
+    }
+
+    control_refs = {code for _, r in rows for code in _split_codes(r.get("controls", ""))}
+    controls = {
+        c.code: c.id
+        for c in Control.objects.filter(standard=standard, code__in=control_refs).only("id", "code")
+    }
+
+    prepared, errors = [], []
+
+    for row_number, r in rows:
+        row_errors = {}
+
+        title = r.get("title", "")
+        if not title:
+            row_errors["title"] = "Title is required."
+        elif len(title) > 255:
+            row_errors["title"] = "Title must be 255 characters or fewer."
+
+        likelihood = _parse_scale(r.get("likelihood", ""), "likelihood", row_errors)
+        impact = _parse_scale(r.get("impact", ""), "impact", row_errors)
+
+        treatment = (r.get("treatment", "") or "Reduce").title()
+        if treatment not in RISK_TREATMENTS:
+            row_errors["treatment"] = f"Must be one of: {', '.join(RISK_TREATMENTS)}."
+
+        owner = r.get("owner", "")
+        for column, max_length in RISK_TEXT_COLUMNS.items():
+            if len(r.get(column, "")) > max_length:
+                row_errors[column] = f"Must be {max_length} characters or fewer."
+
+        status = _parse_choice(r.get("status", ""), RISK_STATUSES, "status", row_errors) or "Open"
+
+        justification = r.get("acceptance_justification", "")
+        if treatment in NON_REDUCE_TREATMENTS:
+            if not justification:
+                row_errors["acceptance_justification"] = (
+                    "Justification is required when risk treatment is "
+                    "Accept, Transfer, or Avoid."
+                )
+            if not owner:
+                row_errors["owner"] = (
+                    "Risk owner is required when risk treatment is "
+                    "Accept, Transfer, or Avoid."
+                )
+
+        asset = None
+        asset_ref = r.get("asset_id", "")
+        if asset_ref:
+            asset = assets.get(asset_ref)
+            if asset is None:
+                row_errors["asset_id"] = f"Unknown asset '{asset_ref}'."
+
+        codes = _split_codes(r.get("controls", ""))
+        missing = [c for c in codes if c not in controls]
+        if missing:
+            row_errors["controls"] = f"Unknown control(s): {', '.join(missing)}."
+
+        if row_errors:
+            errors.append({"row": row_number, "errors": row_errors})
+            continue
+
+        prepared.append({
+            "risk": ISORisk(
+                organization=tenant,
+                title=title,
+                description=r.get("description", ""),
+                asset=asset,
+                likelihood=likelihood,
+                impact=impact,
+                treatment=treatment,
+                owner=owner,
+                status=status,
+                standard=standard,
+                acceptance_justification=justification,
+            ),
+            "control_ids": sorted({controls[c] for c in codes}),
+        })
+
+    return prepared, errors
+
+
+def import_iso_risks(tenant, rows, standard="iso-27001", dry_run=False):
+    """
+    Import risks for a tenant. Returns a result dict:
+      {"dry_run", "rows", "created", "errors", "derived"}
+    Nothing is written when dry_run is set or any row has errors.
+    """
+    prepared, errors = validate_risk_rows(tenant, rows, standard=standard)
+
+    result = {
+        "dry_run": dry_run,
+        "rows": len(prepared) + len(errors),
+        "created": 0,
+        "errors": errors,
+        "derived": {},
+    }
+    if dry_run or errors or not prepared:
+        return result
+
+    Through = ISORisk.controls.through
+
+    with transaction.atomic():
+        risks = [p["risk"] for p in prepared]
+        for risk in risks:
+            risk.compute_score()
+
+        ISORisk.objects.bulk_create(risks)
+        refresh_search_vectors(ISORisk.objects.filter(id__in=[r.id for r in risks]))
+
+        Through.objects.bulk_create(
+            [
+                Through(isorisk_id=p["risk"].id, control_id=control_id)
+                for p in prepared
+                for control_id in p["control_ids"]
+            ]
+        )
+
+        # 🔁 One derivation pass for the whole tenant (SoA → Risk → Asset)
+        result["derived"] = derive_tenant_isms_state(tenant)
+
+    result["created"] = len(risks)
+    return result
+
+
+# ---------------------------------------------------------------------
+# ISO 27001 asset register import
+# ---------------------------------------------------------------------
+ASSET_IMPORT_BATCH_SIZE = 1000
+
+# column → max length (free-text columns besides name / notes)
+ASSET_TEXT_COLUMNS = {
+    "asset_type": 128,
+    "location": 255,
+    "legal_owner": 255,
+    "technical_owner": 255,
+}
+
+
+def is_known_standard(standard) -> bool:
+    """A standard the platform audits (Audit.standard) or has a library for."""
+    choices = Audit._meta.get_field("standard").choices
+    return standard in {key for key, _ in choices} or is_library_standard(standard)
+
+
+def validate_asset_rows(tenant, rows, standard="iso-27001"):
+    """
+    Validate rows as they are read; only the cleaned, unsaved Assets are
+    kept, not the raw rows. Returns (assets, errors).
+    """
+    assets, errors = [], []
+
+    for row_number, r in rows:
+        row_errors = {}
+
+        name = r.get("name", "")
+        if not name:
+            row_errors["name"] = "Name is required."
+        elif len(name) > 255:
+            row_errors["name"] = "Name must be 255 characters or fewer."
+
+        text = {}
+        for column, max_length in ASSET_TEXT_COLUMNS.items():
+            text[column] = r.get(column, "") or None
+            if text[column] and len(text[column]) > max_length:
+                row_errors[column] = f"Must be {max_length} characters or fewer."
+
+        classification = _parse_choice(
+            r.get("classification", ""), Asset.CLASSIFICATION_CHOICES, "classification", row_errors
+        )
+        value = _parse_choice(r.get("value", ""), Asset.VALUE_CHOICES, "value", row_errors)
+
+        if row_errors:
+            errors.append({"row": row_number, "errors": row_errors})
+            continue
+
+        assets.append(Asset(
+            organization=tenant,
+            name=name,
+            classification=classification,
+            value=value,
+            notes=r.get("notes", "") or None,
+            standard=standard,
+            **text,
+        ))
+
+    return assets, errors
+
+
+def import_assets(tenant, rows, standard="iso-27001", dry_run=False):
+    """
+    Import an asset register for a tenant. Returns a result dict:
+      {"dry_run", "rows", "created", "errors", "seconds", "rows_per_second"}
+    Nothing is written when dry_run is set or any row has errors.
+
+    asset_id is always assigned (AST-xxxx): one sequence reservation for
+    the whole file, then bulk_create in batches. New assets have no risks,
+    so the derived is_secure (False) needs no derivation pass.
+    """
+    started = time.monotonic()
+    assets, errors = validate_asset_rows(tenant, rows, standard=standard)
+
+    result = {
+        "dry_run": dry_run,
+        "rows": len(assets) + len(errors),
+        "created": 0,
+        "errors": errors,
+    }
+
+    if not (dry_run or errors) and assets:
+        with transaction.atomic():
+            assign_ids(assets, "asset")
+            for i in range(0, len(assets), ASSET_IMPORT_BATCH_SIZE):
+                batch = Asset.objects.bulk_create(assets[i:i + ASSET_IMPORT_BATCH_SIZE])
+                refresh_search_vectors(Asset.objects.filter(id__in=[a.id for a in batch]))
+        result["created"] = len(assets)
+
+    seconds = time.monotonic() - started
+    result["seconds"] = round(seconds, 3)
+    result["rows_per_second"] = round(result["rows"] / seconds) if seconds else None
+    return result
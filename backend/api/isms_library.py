@@ -0,0 +1,209 @@
+# backend/api/isms_library.py
+
+"""
+Global clause/control library versioning + per-tenant seeding.
+
+The library (Clause, Control) is global and changes only when an import /
+seed command runs. Each run bumps LibraryVersion for the standard.
+
+Tenants get their per-control rows (SoA entries) and, for ISO 27001, their
+clause records (4–10) seeded:
+- at tenant provisioning (Organization created)
+- at library import time (for every tenant)
+- lazily, on read, ONLY when the library version moved since the tenant
+  was last seeded
+
+The read-path check is a single cache lookup in the common case.
+
+The serialized library itself (clause/control list payloads, lookup
+indexes) is cached in-process per (kind, standard, library version); a
+version bump makes every process rebuild on its next read.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from .models import Organization
+from .isms_models import (
+    Clause,
+    Control,
+    ISO27001ClauseRecord,
+    LibraryVersion,
+    TenantLibrarySeed,
+)
+from .isms_signals import seed_missing_soa_entries
+
+
+# How long a process may serve a cached library version before re-reading it.
+# Library imports run in another process, so this bounds how stale it can be.
+LIBRARY_VERSION_CACHE_SECONDS = 60
+
+# Browsers/proxies may reuse a library response this long, then revalidate
+# with the ETag (a 304 until the library version moves).
+LIBRARY_HTTP_MAX_AGE = 60 * 60
+
+# Tenant clause records cover ISO 27001 clauses 4.* to 10.* (inclusive)
+ISO27001_CLAUSE_MAJORS = (4, 10)
+
+# (kind, standard) → (version, payload); only the current version is kept,
+# and only for standards that exist in the library (see is_library_standard)
+_payload_cache = {}
+
+LIBRARY_STANDARDS_KEY = "isms:library-standards"
+
+
+def _version_key(standard: str) -> str:
+    return f"isms:library-version:{standard}"
+
+
+def _seeded_key(tenant_id, standard: str) -> str:
+    return f"isms:library-seeded:{tenant_id}:{standard}"
+
+
+def library_version(standard: str) -> int:
+    key = _version_key(standard)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            LibraryVersion.objects.filter(standard=standard)
+            .values_list("version", flat=True)
+            .first()
+        ) or 0
+        cache.set(key, version, LIBRARY_VERSION_CACHE_SECONDS)
+    return version
+
+
+def bump_library_version(standard: str) -> int:
+    """Call after changing the Clause/Control library for `standard`."""
+    with transaction.atomic():
+        obj, _ = LibraryVersion.objects.select_for_update().get_or_create(standard=standard)
+        obj.version = F("version") + 1
+        obj.save(update_fields=["version", "updated_at"])
+        obj.refresh_from_db(fields=["version"])
+
+    cache.delete_many([_version_key(standard), LIBRARY_STANDARDS_KEY])
+    for key in [k for k in _payload_cache if k[1] == standard]:
+        _payload_cache.pop(key, None)
+    return obj.version
+
+
+def library_etag(kind: str, standard: str, version: int) -> str:
+    return f'"{kind}-{standard}-v{version}"'
+
+
+def cached_library_payload(kind: str, standard: str, version: int, build):
+    """
+    Return the serialized `kind` payload for standard@version, calling
+    build() only on the first request for that version in this process.
+
+    `standard` usually comes straight from a query string: payloads for
+    standards the library doesn't have are built but never cached.
+    """
+    if not is_library_standard(standard):
+        return build()
+
+    hit = _payload_cache.get((kind, standard))
+    if hit is not None and hit[0] == version:
+        return hit[1]
+
+    payload = build()
+    _payload_cache[(kind, standard)] = (version, payload)
+    return payload
+
+
+def clear_library_payloads() -> None:
+    _payload_cache.clear()
+
+
+def seed_missing_clause_records(tenant, standard: str) -> int:
+    """Create the tenant's missing ISO 27001 clause records. Idempotent."""
+    if standard != "iso-27001":
+        return 0
+
+    missing = Clause.objects.filter(
+        standard=standard, sort_major__range=ISO27001_CLAUSE_MAJORS
+    ).exclude(tenant_records__organization=tenant)
+
+    created = ISO27001ClauseRecord.objects.bulk_create(
+        [
+            ISO27001ClauseRecord(
+                organization=tenant,
+                clause=clause,
+                status="NI",
+                owner="Unassigned",
+                comments="",
+            )
+            for clause in missing.only("id")
+        ],
+        ignore_conflicts=True,
+    )
+    return len(created)
+
+
+def seed_tenant_library(tenant, standard: str) -> int:
+    """Seed missing rows for one tenant + standard and record the marker."""
+    version = library_version(standard)
+
+    with transaction.atomic():
+        created = seed_missing_soa_entries(tenant, standard)
+        created += seed_missing_clause_records(tenant, standard)
+        TenantLibrarySeed.objects.update_or_create(
+            organization=tenant,
+            standard=standard,
+            defaults={"library_version": version},
+        )
+
+    cache.set(_seeded_key(tenant.pk, standard), version, None)
+    return created
+
+
+def ensure_tenant_library_seeded(tenant, standard: str) -> None:
+    """
+    Cheap read-path guard. Common case: one cache round-trip, zero queries.
+    """
+    vkey, skey = _version_key(standard), _seeded_key(tenant.pk, standard)
+    cached = cache.get_many([vkey, skey])
+    if vkey in cached and cached.get(skey) == cached[vkey]:
+        return
+
+    version = library_version(standard)
+    seeded = (
+        TenantLibrarySeed.objects.filter(organization=tenant, standard=standard)
+        .values_list("library_version", flat=True)
+        .first()
+    )
+    if seeded == version:
+        cache.set(skey, version, None)
+        return
+
+    seed_tenant_library(tenant, standard)
+
+
+def library_standards():
+    controls = Control.objects.values_list("standard", flat=True).distinct().order_by()
+    clauses = Clause.objects.values_list("standard", flat=True).distinct().order_by()
+    return sorted(set(controls) | set(clauses))
+
+
+def is_library_standard(standard: str) -> bool:
+    """Membership test against library_standards(), cached like the version."""
+    standards = cache.get(LIBRARY_STANDARDS_KEY)
+    if standards is None:
+        standards = library_standards()
+        cache.set(LIBRARY_STANDARDS_KEY, standards, LIBRARY_VERSION_CACHE_SECONDS)
+    return standard in standards
+
+
+def provision_tenant_library(tenant) -> None:
+    """New tenant: seed every library standard up front."""
+    for standard in library_standards():
+        seed_tenant_library(tenant, standard)
+
+
+def seed_all_tenants(standard: str) -> int:
+    """Library import time: bring every tenant up to the current version."""
+    created = 0
+    for tenant in Organization.objects.only("id"):
+        created += seed_tenant_library(tenant, standard)
+    return created
@@ -0,0 +1,86 @@
+# backend/api/isms_lookup.py
+
+"""
+In-memory typeahead over the global clause/control library.
+
+The library changes only when its LibraryVersion is bumped, so each process
+builds ONE prefix index per (kind, standard, version) and answers lookups
+from memory: a dict hit per query term plus a set intersection.
+
+A query matches an entry when every term is a prefix of its code
+("a.8.1", "8.1") or of a word in its title ("back" → "Information backup").
+Code matches rank first, then library order.
+"""
+
+import re
+
+from .isms_library import cached_library_payload, is_library_standard, library_version
+from .isms_models import Clause, Control
+
+
+LOOKUP_KINDS = {"controls": Control, "clauses": Clause}
+LOOKUP_LIMIT = 10
+LOOKUP_MAX = 50
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _prefixes(term: str):
+    return (term[:n] for n in range(1, len(term) + 1))
+
+
+def _code_forms(code: str):
+    code = code.lower()
+    yield code
+    if code.startswith("a."):
+        yield code[2:]  # "8.13" finds "A.8.13"
+
+
+class LookupIndex:
+    def __init__(self, rows):
+        # rows: (id, code, title) in library order
+        self.entries = [{"id": pk, "code": code, "title": title} for pk, code, title in rows]
+        self.code_prefixes = {}
+        self.word_prefixes = {}
+
+        for position, (_, code, title) in enumerate(rows):
+            for form in _code_forms(code):
+                for prefix in _prefixes(form):
+                    self.code_prefixes.setdefault(prefix, set()).add(position)
+            for word in _WORD.findall(title.lower()):
+                for prefix in _prefixes(word):
+                    self.word_prefixes.setdefault(prefix, set()).add(position)
+
+    def _matches(self, term):
+        return self.code_prefixes.get(term, set()) | self.word_prefixes.get(term, set())
+
+    def search(self, query: str, limit: int = LOOKUP_LIMIT):
+        terms = query.lower().split()
+        if not terms:
+            return []
+
+        positions = self._matches(terms[0])
+        for term in terms[1:]:
+            positions = positions & self._matches(term)
+            if not positions:
+                return []
+
+        code_hits = self.code_prefixes.get(terms[0], set()) if len(terms) == 1 else set()
+        ranked = sorted(positions, key=lambda p: (p not in code_hits, p))
+        return [self.entries[p] for p in ranked[:limit]]
+
+
+def lookup_index(kind: str, standard: str) -> LookupIndex:
+    if not is_library_standard(standard):
+        # Anything from ?standard=: never build (or cache) an index for it
+        return LookupIndex([])
+
+    model = LOOKUP_KINDS[kind]
+
+    def build():
+        rows = model.objects.filter(standard=standard).order_by(
+            "sort_major", "sort_minor", "code"
+        ).values_list("id", "code", "title")
+        return LookupIndex(list(rows))
+
+    return cached_library_payload(f"{kind}-lookup", standard, library_version(standard), build)
@@ -1,7 +1,43 @@
 # backend/api/isms_models.py
 
-from django.db import models, transaction
-from .models import Organization, TenantSequence
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from .models import Organization
+from .sequences import assign_ids
+
+
+# Score thresholds (likelihood × impact) → level, highest first.
+RISK_LEVEL_THRESHOLDS = [
+    (16, "Critical"),
+    (10, "High"),
+    (5, "Medium"),
+]
+
+
+def risk_level_for_score(score: int) -> str:
+    for threshold, level in RISK_LEVEL_THRESHOLDS:
+        if score >= threshold:
+            return level
+    return "Low"
+
+
+# Codes that don't parse sort after every numbered clause/control
+UNPARSED_SORT_KEY = (999, 999)
+
+
+def code_sort_key(code: str) -> tuple[int, int]:
+    """
+    Numeric (major, minor) sort key for library codes:
+    "4.1" → (4, 1), "10.2" → (10, 2), "A.5.10" → (5, 10)
+    """
+    parts = (code or "").strip().upper().removeprefix("A.").split(".")
+    try:
+        major = int(parts[0])
+        minor = int(parts[1]) if len(parts) > 1 else 0
+    except ValueError:
+        return UNPARSED_SORT_KEY
+    return (major, minor)
 
 
 class Clause(models.Model):
@@ -10,9 +46,20 @@ class Clause(models.Model):
     text = models.TextField(blank=True)
     standard = models.CharField(max_length=64, default="iso-27001")
 
+    # Derived from code on save (see code_sort_key)
+    sort_major = models.PositiveSmallIntegerField(default=UNPARSED_SORT_KEY[0])
+    sort_minor = models.PositiveSmallIntegerField(default=UNPARSED_SORT_KEY[1])
+
     class Meta:
         unique_together = ("code", "standard")
-        ordering = ["code"]
+        ordering = ["sort_major", "sort_minor", "code"]
+        indexes = [
+            models.Index(fields=["standard", "sort_major", "sort_minor"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.sort_major, self.sort_minor = code_sort_key(self.code)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.standard} {self.code} - {self.title}"
@@ -25,14 +72,57 @@ class Control(models.Model):
     group = models.CharField(max_length=128, blank=True)
     standard = models.CharField(max_length=64, default="iso-27001")
 
+    # Derived from code on save (see code_sort_key)
+    sort_major = models.PositiveSmallIntegerField(default=UNPARSED_SORT_KEY[0])
+    sort_minor = models.PositiveSmallIntegerField(default=UNPARSED_SORT_KEY[1])
+
     class Meta:
         unique_together = ("code", "standard")
-        ordering = ["code"]
+        ordering = ["sort_major", "sort_minor", "code"]
+        indexes = [
+            models.Index(fields=["standard", "sort_major", "sort_minor"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.sort_major, self.sort_minor = code_sort_key(self.code)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.standard} {self.code} - {self.title}"
 
 
+class LibraryVersion(models.Model):
+    """
+    Version of the GLOBAL clause/control library for a standard.
+    Bumped by the library import/seed commands (see isms_library).
+    """
+    standard = models.CharField(max_length=64, unique=True)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.standard} library v{self.version}"
+
+
+class TenantLibrarySeed(models.Model):
+    """
+    Marker: this tenant's per-control rows (SoA) were seeded from
+    library_version of the standard's library.
+    """
+    organization = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="library_seeds"
+    )
+    standard = models.CharField(max_length=64)
+    library_version = models.PositiveIntegerField()
+    seeded_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("organization", "standard")
+
+    def __str__(self):
+        return f"{self.organization.slug} {self.standard} seeded v{self.library_version}"
+
+
 class Asset(models.Model):
     organization = models.ForeignKey(
         Organization, on_delete=models.CASCADE, related_name="assets"
@@ -70,6 +160,9 @@ class Asset(models.Model):
     # Computed by signals
     is_secure = models.BooleanField(default=False)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         unique_together = ("organization", "asset_id")
         ordering = ["-created_at"]
@@ -77,26 +170,21 @@ class Asset(models.Model):
             models.Index(fields=["organization", "standard"]),
             models.Index(fields=["organization", "classification"]),
             models.Index(fields=["organization", "asset_type"]),
+            # keyset pagination: (sort key, id)
+            models.Index(fields=["organization", "created_at", "id"]),
+            GinIndex(fields=["search_vector"]),
         ]
 
     def save(self, *args, **kwargs):
         """
-        Generate sequential asset_id PER TENANT safely under concurrency.
-        Uses TenantSequence + SELECT ... FOR UPDATE.
+        Generate sequential asset_id PER TENANT (AST-0001...) from the
+        block-allocated TenantSequence, see api.sequences.
+        Bulk creates: call assign_ids(assets, "asset") before bulk_create().
         """
         if not self.asset_id:
             if not self.organization_id:
                 raise ValueError("Asset.organization must be set before saving.")
-
-            with transaction.atomic():
-                seq, _ = TenantSequence.objects.select_for_update().get_or_create(
-                    organization_id=self.organization_id,
-                    defaults={"next_asset_number": 1},
-                )
-                n = seq.next_asset_number
-                self.asset_id = f"AST-{str(n).zfill(4)}"
-                seq.next_asset_number = n + 1
-                seq.save(update_fields=["next_asset_number"])
+            assign_ids([self], "asset")
 
         super().save(*args, **kwargs)
 
@@ -132,26 +220,30 @@ class ISORisk(models.Model):
     acceptance_justification = models.TextField(blank=True)
     control_coverage = models.CharField(max_length=32, default="Untreated", blank=True)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["organization", "standard"]),
             models.Index(fields=["organization", "standard", "status"]),
             models.Index(fields=["organization", "standard", "level"]),
+            # keyset pagination: (sort key, id)
+            models.Index(fields=["organization", "created_at", "id"]),
+            GinIndex(fields=["search_vector"]),
         ]
 
-    def save(self, *args, **kwargs):
+    def compute_score(self):
+        """
+        Derive risk_score + level from likelihood × impact.
+        Called by save(); call it directly before bulk_create().
+        """
         self.risk_score = (self.likelihood or 0) * (self.impact or 0)
+        self.level = risk_level_for_score(self.risk_score)
 
-        if self.risk_score >= 16:
-            self.level = "Critical"
-        elif self.risk_score >= 10:
-            self.level = "High"
-        elif self.risk_score >= 5:
-            self.level = "Medium"
-        else:
-            self.level = "Low"
-
+    def save(self, *args, **kwargs):
+        self.compute_score()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -177,13 +269,17 @@ class SoAEntry(models.Model):
     standard = models.CharField(max_length=64, default="iso-27001")
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         unique_together = ("organization", "control", "standard")
-        ordering = ["control__code"]
+        ordering = ["control__sort_major", "control__sort_minor"]
         indexes = [
             models.Index(fields=["organization", "standard"]),
             models.Index(fields=["organization", "standard", "applicable"]),
             models.Index(fields=["organization", "standard", "status"]),
+            GinIndex(fields=["search_vector"]),
         ]
 
     def __str__(self):
@@ -217,8 +313,13 @@ class ISO27001ClauseRecord(models.Model):
 
     # evidence should accept any file type
     evidence = models.FileField(upload_to="evidence/iso27001/clauses/", blank=True, null=True)
+    # The uploader's filename: blob paths are content hashes (api.evidence)
+    evidence_name = models.CharField(max_length=255, blank=True, default="")
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Text of the evidence file, copied from its blob by api.evidence
+    evidence_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -229,6 +330,7 @@ class ISO27001ClauseRecord(models.Model):
         indexes = [
             models.Index(fields=["organization"]),
             models.Index(fields=["organization", "status"]),
+            GinIndex(fields=["evidence_vector"]),
         ]
 
     def __str__(self):
@@ -4,12 +4,14 @@ from rest_framework import serializers
 
 from .isms_models import Clause, Control, Asset, ISORisk, SoAEntry, ISO27001ClauseRecord
 from .isms_signals import aggregate_risk_coverage_for_risk
+from .serializer_fields import BulkPrimaryKeyRelatedField, EvidenceDownloadURLField
+from .serializer_mixins import SparseFieldsetMixin
 
 
 # ---------------------------------------------------------------------
 # CLAUSES (GLOBAL)
 # ---------------------------------------------------------------------
-class ClauseSerializer(serializers.ModelSerializer):
+class ClauseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Clause
         fields = ["id", "code", "title", "text", "standard"]
@@ -18,7 +20,7 @@ class ClauseSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 # CONTROLS (GLOBAL)
 # ---------------------------------------------------------------------
-class ControlSerializer(serializers.ModelSerializer):
+class ControlSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Control
         fields = ["id", "code", "title", "description", "group", "standard"]
@@ -27,7 +29,7 @@ class ControlSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 # ASSETS (TENANT-SCOPED via views; organization is read-only)
 # ---------------------------------------------------------------------
-class AssetSerializer(serializers.ModelSerializer):
+class AssetSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Asset
         fields = [
@@ -53,9 +55,19 @@ class AssetSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 # RISKS (ISO/IEC 27001 CORE GOVERNANCE; TENANT-SCOPED)
 # ---------------------------------------------------------------------
-class ISORiskSerializer(serializers.ModelSerializer):
-    # Read controls as full objects
-    controls = serializers.SerializerMethodField()
+class ISORiskSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = ("asset", "controls")
+
+    # Read controls as full objects (uses the view's prefetch cache);
+    # write them as ids under the same "controls" key (see to_internal_value)
+    controls = ControlSerializer(many=True, read_only=True)
+    control_ids = BulkPrimaryKeyRelatedField(
+        source="controls",
+        queryset=Control.objects.all(),
+        many=True,
+        write_only=True,
+        required=False,
+    )
 
     # Asset handling (read object, write ID)
     asset = AssetSerializer(read_only=True)
@@ -69,7 +81,7 @@ class ISORiskSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ISORisk
-        fields = "__all__"
+        exclude = ("search_vector",)
         extra_kwargs = {
             "organization": {"read_only": True},
             "risk_score": {"read_only": True},
@@ -84,6 +96,10 @@ class ISORiskSerializer(serializers.ModelSerializer):
         """
         fields = super().get_fields()
 
+        # Reads never validate asset_id: skip building the queryset
+        if not hasattr(self.root, "initial_data"):
+            return fields
+
         request = self.context.get("request")
         tenant = getattr(request, "tenant", None) if request else None
 
@@ -92,11 +108,24 @@ class ISORiskSerializer(serializers.ModelSerializer):
 
         return fields
 
-    # -----------------------------
-    # READ helpers
-    # -----------------------------
-    def get_controls(self, obj):
-        return ControlSerializer(obj.controls.all(), many=True).data
+    def to_internal_value(self, data):
+        # Clients send "controls": [ids]; validate them via control_ids
+        if "controls" not in data or "control_ids" in data:
+            return super().to_internal_value(data)
+
+        data = data.copy()
+        if hasattr(data, "setlist"):
+            data.setlist("control_ids", data.getlist("controls"))
+        else:
+            data["control_ids"] = data["controls"]
+
+        try:
+            return super().to_internal_value(data)
+        except serializers.ValidationError as exc:
+            # Report errors under the key the client sent
+            if isinstance(exc.detail, dict) and "control_ids" in exc.detail:
+                exc.detail["controls"] = exc.detail.pop("control_ids")
+            raise
 
     # -----------------------------
     # VALIDATION (ISO governance)
@@ -136,13 +165,12 @@ class ISORiskSerializer(serializers.ModelSerializer):
     # CREATE logic (needed for controls M2M)
     # -----------------------------
     def create(self, validated_data):
-        controls_data = self.initial_data.get("controls", None)
+        controls = validated_data.pop("controls", None)
 
         instance = ISORisk.objects.create(**validated_data)
 
-        if controls_data is not None:
-            control_ids = [int(c) for c in controls_data if c is not None]
-            instance.controls.set(Control.objects.filter(id__in=control_ids))
+        if controls is not None:
+            instance.controls.set(controls)
 
         # 🔁 Recompute coverage AFTER all changes
         aggregate_risk_coverage_for_risk(instance)
@@ -153,7 +181,7 @@ class ISORiskSerializer(serializers.ModelSerializer):
     # UPDATE logic
     # -----------------------------
     def update(self, instance, validated_data):
-        controls_data = self.initial_data.get("controls", None)
+        controls = validated_data.pop("controls", None)
 
         # Update scalar fields
         for attr, value in validated_data.items():
@@ -167,9 +195,8 @@ class ISORiskSerializer(serializers.ModelSerializer):
         instance.save()  # recompute score + level via model.save()
 
         # Update controls M2M explicitly
-        if controls_data is not None:
-            control_ids = [int(c) for c in controls_data if c is not None]
-            instance.controls.set(Control.objects.filter(id__in=control_ids))
+        if controls is not None:
+            instance.controls.set(controls)
 
         # 🔁 Recompute coverage AFTER all changes
         aggregate_risk_coverage_for_risk(instance)
@@ -180,7 +207,9 @@ class ISORiskSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 # SoA READ / LIST
 # ---------------------------------------------------------------------
-class SoAEntrySerializer(serializers.ModelSerializer):
+class SoAEntrySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = ("control", "linked_risks")
+
     control = ControlSerializer(read_only=True)
     linked_risks = serializers.SerializerMethodField()
 
@@ -201,17 +230,21 @@ class SoAEntrySerializer(serializers.ModelSerializer):
         }
 
     def get_linked_risks(self, obj):
-        #tenant-scoped: only risks from the same organization
-        risks = (
-            ISORisk.objects
-            .filter(
-                organization=obj.organization,
-                controls=obj.control,
-                standard=obj.standard,
+        # Prefetched by SoAListView (tenant + standard scoped Prefetch)
+        risks = getattr(obj.control, "linked_risks", None)
+
+        if risks is None:
+            #tenant-scoped: only risks from the same organization
+            risks = (
+                ISORisk.objects
+                .filter(
+                    organization_id=obj.organization_id,
+                    controls=obj.control,
+                    standard=obj.standard,
+                )
+                .select_related("asset")
+                .order_by("-created_at")
             )
-            .select_related("asset")
-            .order_by("-created_at")
-        )
 
         return [
             {
@@ -254,12 +287,13 @@ class SoAEntryUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class ISO27001ClauseRecordSerializer(serializers.ModelSerializer):
+class ISO27001ClauseRecordSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     clause_number = serializers.CharField(source="clause.code", read_only=True)
     short_description = serializers.CharField(source="clause.title", read_only=True)
     description = serializers.CharField(source="clause.text", read_only=True)
 
-    evidence = serializers.SerializerMethodField()
+    # No raw `evidence` storage URL, see ComplianceClauseSerializer
+    evidence_download_url = EvidenceDownloadURLField("iso27001-clause")
 
     class Meta:
         model = ISO27001ClauseRecord
@@ -271,17 +305,11 @@ class ISO27001ClauseRecordSerializer(serializers.ModelSerializer):
             "status",
             "owner",
             "comments",
-            "evidence",
+            "evidence_name",
+            "evidence_download_url",
             "updated_at",
         ]
-
-    def get_evidence(self, obj):
-        request = self.context.get("request")
-        if not obj.evidence:
-            return None
-        if request:
-            return request.build_absolute_uri(obj.evidence.url)
-        return obj.evidence.url
+        read_only_fields = ["evidence_name"]
 
 
 class ISO27001ClauseRecordPatchSerializer(serializers.ModelSerializer):
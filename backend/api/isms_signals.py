@@ -17,11 +17,19 @@ This file is deliberately signal-driven to ensure:
 """
 
 from django.db import transaction
+from django.db.models import (
+    Case, CharField, Count, Exists, F, OuterRef, Q, Value, When,
+)
 from django.db.models.signals import post_save, m2m_changed
 from django.dispatch import receiver
-from typing import Tuple
+from typing import Dict, Tuple
 
-from .isms_models import SoAEntry, ISORisk, Asset
+from .models import Organization
+from .isms_models import SoAEntry, ISORisk, Asset, Control, RISK_LEVEL_THRESHOLDS
+
+
+# Treatments for which control coverage is not meaningful (coverage = N/A)
+NON_REDUCE_TREATMENTS = ("Accept", "Transfer", "Avoid")
 
 
 # -------------------------------------------------------------------
@@ -87,7 +95,7 @@ def aggregate_risk_coverage_for_risk(risk: ISORisk) -> str:
     """
 
     # 1️⃣ Non-reduction treatments → N/A
-    if risk.treatment in ["Accept", "Transfer", "Avoid"]:
+    if risk.treatment in NON_REDUCE_TREATMENTS:
         new_status = "N/A"
 
     else:
@@ -97,7 +105,10 @@ def aggregate_risk_coverage_for_risk(risk: ISORisk) -> str:
         if not controls.exists():
             new_status = "Untreated"
         else:
+            # SoA is tenant + standard scoped: only the risk's own SoA counts
             entries = SoAEntry.objects.filter(
+                organization_id=risk.organization_id,
+                standard=risk.standard,
                 control__in=controls,
                 applicable=True,
             )
@@ -157,7 +168,7 @@ def compute_asset_security(asset: Asset) -> bool:
             (
                 (risk.treatment == "Reduce" and risk.control_coverage == "Adequate")
                 or
-                (risk.treatment in ("Accept", "Transfer", "Avoid"))
+                (risk.treatment in NON_REDUCE_TREATMENTS)
             )
             for risk in risks
         )
@@ -169,6 +180,234 @@ def compute_asset_security(asset: Asset) -> bool:
     return secure
 
 
+# -------------------------------------------------------------------
+# SET-BASED DERIVATION (BULK PATHS)
+# -------------------------------------------------------------------
+# Purpose:
+#   Apply exactly the same rules as the per-row functions above, but
+#   for many rows at once with grouped queries and set-based UPDATEs.
+#
+# Used by:
+#   - bulk imports (bulk_create skips save() and therefore the signals)
+#   - full recomputes / repairs of derived state
+#
+# IMPORTANT:
+#   - Order matters: SoA applicability → risk coverage → asset security
+#   - Every apply_* function returns the number of rows it changed
+# -------------------------------------------------------------------
+
+def _coverage_from_counts(total: int, full: int, partial: int) -> str:
+    if not total:
+        return "Untreated"
+    if full == total:
+        return "Adequate"
+    if full > 0 or partial > 0:
+        return "Partial"
+    return "Untreated"
+
+
+def risk_level_case(score_field: str = "risk_score") -> Case:
+    """SQL equivalent of isms_models.risk_level_for_score()."""
+    return Case(
+        *[
+            When(**{f"{score_field}__gte": threshold}, then=Value(level))
+            for threshold, level in RISK_LEVEL_THRESHOLDS
+        ],
+        default=Value("Low"),
+        output_field=CharField(),
+    )
+
+
+def apply_risk_scores(risks) -> Dict[str, int]:
+    """
+    Rebuild risk_score (likelihood × impact) and level in two UPDATEs,
+    touching only rows whose stored value differs.
+    """
+    score = F("likelihood") * F("impact")
+
+    scores = risks.exclude(risk_score=score).update(risk_score=score)
+    levels = risks.exclude(level=risk_level_case()).update(level=risk_level_case())
+
+    return {"risk_score": scores, "risk_level": levels}
+
+
+def compute_risk_coverage_map(risks) -> Dict[int, str]:
+    """
+    Expected control_coverage for every risk in the `risks` queryset,
+    computed with one grouped query over the risk ↔ control table.
+    """
+    Through = ISORisk.controls.through
+
+    counts = (
+        Through.objects.filter(
+            isorisk__in=risks.exclude(treatment__in=NON_REDUCE_TREATMENTS),
+            control__soa_entries__organization=F("isorisk__organization"),
+            control__soa_entries__standard=F("isorisk__standard"),
+            control__soa_entries__applicable=True,
+        )
+        .values("isorisk_id")
+        .annotate(
+            total=Count("control__soa_entries"),
+            full=Count(
+                "control__soa_entries",
+                filter=Q(control__soa_entries__status="Full"),
+            ),
+            partial=Count(
+                "control__soa_entries",
+                filter=Q(control__soa_entries__status="Partial"),
+            ),
+        )
+        .order_by()
+    )
+    by_risk = {
+        row["isorisk_id"]: _coverage_from_counts(row["total"], row["full"], row["partial"])
+        for row in counts
+    }
+
+    return {
+        risk_id: "N/A" if treatment in NON_REDUCE_TREATMENTS else by_risk.get(risk_id, "Untreated")
+        for risk_id, treatment in risks.values_list("id", "treatment").order_by()
+    }
+
+
+def apply_risk_coverage(risks) -> int:
+    expected = compute_risk_coverage_map(risks)
+    stored = dict(
+        ISORisk.objects.filter(id__in=list(expected))
+        .values_list("id", "control_coverage")
+        .order_by()
+    )
+
+    changed_by_status: Dict[str, list] = {}
+    for risk_id, coverage in expected.items():
+        if stored.get(risk_id) != coverage:
+            changed_by_status.setdefault(coverage, []).append(risk_id)
+
+    changed = 0
+    for coverage, ids in changed_by_status.items():
+        changed += ISORisk.objects.filter(id__in=ids).update(control_coverage=coverage)
+    return changed
+
+
+def annotate_asset_security(assets):
+    """Annotate risk_count / secured_count (see compute_asset_security)."""
+    secured = (
+        Q(risks__treatment="Reduce", risks__control_coverage="Adequate")
+        | Q(risks__treatment__in=NON_REDUCE_TREATMENTS)
+    )
+    return assets.annotate(
+        risk_count=Count("risks"),
+        secured_count=Count("risks", filter=secured),
+    )
+
+
+def compute_asset_security_map(assets) -> Dict[int, bool]:
+    """
+    Expected is_secure for every asset in the `assets` queryset,
+    computed with one grouped query.
+    """
+    rows = (
+        annotate_asset_security(assets)
+        .values_list("id", "risk_count", "secured_count")
+        .order_by()
+    )
+    return {
+        asset_id: bool(total) and secured_count == total
+        for asset_id, total, secured_count in rows
+    }
+
+
+def apply_asset_security(assets) -> int:
+    expected = compute_asset_security_map(assets)
+    secure_ids = [asset_id for asset_id, secure in expected.items() if secure]
+    insecure_ids = [asset_id for asset_id, secure in expected.items() if not secure]
+
+    changed = Asset.objects.filter(id__in=secure_ids, is_secure=False).update(is_secure=True)
+    changed += Asset.objects.filter(id__in=insecure_ids, is_secure=True).update(is_secure=False)
+    return changed
+
+
+def soa_entries_missing_applicability(risks):
+    """
+    Non-applicable SoA entries whose control is selected by a Reduce risk
+    in `risks` (same tenant + standard).
+    """
+    Through = ISORisk.controls.through
+
+    selected_by_reduce_risk = Through.objects.filter(
+        isorisk__in=risks.filter(treatment="Reduce"),
+        control_id=OuterRef("control_id"),
+        isorisk__organization=OuterRef("organization"),
+        isorisk__standard=OuterRef("standard"),
+    )
+    return SoAEntry.objects.filter(applicable=False).filter(Exists(selected_by_reduce_risk))
+
+
+def apply_soa_applicability(risks) -> int:
+    """Mark those entries applicable in one UPDATE statement."""
+    return soa_entries_missing_applicability(risks).update(applicable=True)
+
+
+def seed_missing_soa_entries(tenant, standard: str) -> int:
+    """
+    Create the tenant's missing SoA entries (one per library control).
+    Applicability is derived from the tenant's Reduce risks. Idempotent.
+    """
+    existing_control_ids = SoAEntry.objects.filter(
+        organization=tenant, standard=standard
+    ).values_list("control_id", flat=True)
+
+    missing_control_ids = list(
+        Control.objects.filter(standard=standard)
+        .exclude(id__in=existing_control_ids)
+        .values_list("id", flat=True)
+    )
+    if not missing_control_ids:
+        return 0
+
+    # ONLY Reduce risks justify applicability; must be tenant-scoped
+    used_control_ids = set(
+        ISORisk.objects.filter(
+            organization=tenant,
+            standard=standard,
+            treatment="Reduce",
+        ).values_list("controls__id", flat=True)
+    )
+
+    created = SoAEntry.objects.bulk_create(
+        [
+            SoAEntry(
+                organization=tenant,
+                control_id=control_id,
+                standard=standard,
+                applicable=control_id in used_control_ids,
+                status="Not Implemented",
+                justification="",
+                evidence_notes="",
+            )
+            for control_id in missing_control_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return len(created)
+
+
+def derive_tenant_isms_state(tenant) -> Dict[str, int]:
+    """
+    Run one full derivation pass for a tenant (Risk score → SoA → Risk
+    coverage → Asset). Returns counts of changed rows per derived field.
+    """
+    risks = ISORisk.objects.filter(organization=tenant)
+    assets = Asset.objects.filter(organization=tenant)
+
+    with transaction.atomic():
+        counts = apply_risk_scores(risks)
+        counts["soa_applicable"] = apply_soa_applicability(risks)
+        counts["risk_coverage"] = apply_risk_coverage(risks)
+        counts["asset_security"] = apply_asset_security(assets)
+        return counts
+
+
 # -------------------------------------------------------------------
 # SIGNAL: SoAEntry UPDATED
 # -------------------------------------------------------------------
@@ -195,6 +434,8 @@ def on_soaentry_saved(sender, instance: SoAEntry, **kwargs):
 
         # Recompute coverage for ALL linked risks (not just Reduce-filtered)
         risks = ISORisk.objects.filter(
+            organization_id=instance.organization_id,
+            standard=instance.standard,
             controls=instance.control,
         ).distinct()
 
@@ -277,3 +518,22 @@ def on_risk_controls_changed(sender, instance: ISORisk, action, **kwargs):
 
             if instance.asset:
                 compute_asset_security(instance.asset)
+
+
+# -------------------------------------------------------------------
+# SIGNAL: TENANT PROVISIONED
+# -------------------------------------------------------------------
+# Trigger:
+#   A new Organization is created
+#
+# Effect:
+#   Seed the tenant's SoA for every library standard, so the SoA
+#   list never has to seed on the read path
+# -------------------------------------------------------------------
+
+@receiver(post_save, sender=Organization)
+def on_organization_created(sender, instance: Organization, created, **kwargs):
+    if created:
+        from .isms_library import provision_tenant_library
+
+        provision_tenant_library(instance)
@@ -6,11 +6,10 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import transaction
-from django.db.models import IntegerField
-from django.db.models.functions import Cast, Substr
+from django.db.models import Prefetch
+from django.utils.http import parse_etags
 from rest_framework.permissions import IsAuthenticated
-from api.isms_audit_lock import is_iso27001_audit_locked
+from api.isms_audit_lock import ISMSAuditLockMixin
 from .isms_models import Clause, Control, Asset, ISORisk, SoAEntry, ISO27001ClauseRecord
 from .isms_serializers import (
     ClauseSerializer,
@@ -23,41 +22,133 @@ from .isms_serializers import (
     ISO27001ClauseRecordPatchSerializer,
 )
 from .isms_signals import compute_soa_completeness
+from .isms_library import (
+    LIBRARY_HTTP_MAX_AGE,
+    cached_library_payload,
+    ensure_tenant_library_seeded,
+    is_library_standard,
+    library_etag,
+    library_version,
+)
+from .evidence import attach_evidence
+from .isms_import import (
+    ImportFileError,
+    import_assets,
+    import_iso_risks,
+    is_known_standard,
+    iter_upload_rows,
+)
+from .isms_lookup import LOOKUP_KINDS, LOOKUP_LIMIT, LOOKUP_MAX, lookup_index
+from .serializer_mixins import is_expanded, is_sparse_request
 from .tenant_mixins import TenantRequiredMixin
 
+# ---------------------------------------------------------------------
+# GLOBAL LIBRARY LISTS: cached per (standard, library version)
+# ---------------------------------------------------------------------
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/"x" matches "x"; * matches anything."""
+    tags = {tag[2:] if tag.startswith("W/") else tag for tag in parse_etags(if_none_match)}
+    return "*" in tags or etag in tags
+
+
+class CachedLibraryListMixin:
+    """
+    The clause/control library only changes when an import/seed command
+    bumps its LibraryVersion, so the serialized list is built once per
+    version per process and served with Cache-Control + ETag.
+    """
+    library_kind = None
+
+    def get_library_standard(self):
+        return self.request.query_params.get("standard", "iso-27001")
+
+    def list(self, request, *args, **kwargs):
+        if is_sparse_request(request):
+            # ?fields= / ?expand= shapes vary per request: not cached
+            return super().list(request, *args, **kwargs)
+
+        standard = self.get_library_standard()
+        if not is_library_standard(standard):
+            # Not in the library (and straight from the query string): no
+            # validators or caching for it, just the (empty) list
+            return super().list(request, *args, **kwargs)
+
+        version = library_version(standard)
+        etag = library_etag(self.library_kind, standard, version)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={LIBRARY_HTTP_MAX_AGE}",
+        }
+
+        if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        data = cached_library_payload(
+            self.library_kind,
+            standard,
+            version,
+            lambda: self.get_serializer(self.get_queryset(), many=True).data,
+        )
+        return Response(data, headers=headers)
+
+
 # ---------------------------------------------------------------------
 # CLAUSES (GLOBAL LIBRARY)
 # ---------------------------------------------------------------------
-class ClauseListView(generics.ListAPIView):
-    queryset = Clause.objects.all().order_by("code")
+class ClauseListView(CachedLibraryListMixin, generics.ListAPIView):
     serializer_class = ClauseSerializer
     permission_classes = [permissions.AllowAny]
-    filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["standard"]
+    library_kind = "clauses"
+
+    def get_queryset(self):
+        return Clause.objects.filter(standard=self.get_library_standard()).order_by(
+            "sort_major", "sort_minor", "code"
+        )
 
 
 # ---------------------------------------------------------------------
 # CONTROLS (GLOBAL LIBRARY)
 # ---------------------------------------------------------------------
-class ControlListView(generics.ListAPIView):
+class ControlListView(CachedLibraryListMixin, generics.ListAPIView):
     serializer_class = ControlSerializer
     permission_classes = [permissions.AllowAny]
-    filter_backends = [DjangoFilterBackend]
-    filterset_fields = ["standard"]
+    library_kind = "controls"
 
     def get_queryset(self):
-        return (
-            Control.objects.filter(
-                standard=self.request.query_params.get("standard", "iso-27001")
-            )
-            .annotate(
-                chapter=Cast(Substr("code", 3, 1), IntegerField()),
-                section=Cast(Substr("code", 5, 2), IntegerField()),
-            )
-            .order_by("chapter", "section")
+        return Control.objects.filter(standard=self.get_library_standard()).order_by(
+            "sort_major", "sort_minor", "code"
         )
 
 
+# ---------------------------------------------------------------------
+# LIBRARY TYPEAHEAD (GLOBAL, IN-MEMORY INDEX)
+# ---------------------------------------------------------------------
+class LibraryLookupView(APIView):
+    """
+    GET /api/isms/lookup/?q=backup[&kind=controls|clauses][&standard=][&limit=]
+    Code-prefix / title-word matches from the per-version in-memory index.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        kind = request.query_params.get("kind", "controls")
+        if kind not in LOOKUP_KINDS:
+            return Response(
+                {"detail": f"kind must be one of: {', '.join(LOOKUP_KINDS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", LOOKUP_LIMIT))
+        except ValueError:
+            limit = LOOKUP_LIMIT
+        limit = max(1, min(limit, LOOKUP_MAX))
+
+        standard = request.query_params.get("standard", "iso-27001")
+        index = lookup_index(kind, standard)
+        return Response(index.search(request.query_params.get("q", ""), limit))
+
+
 # ---------------------------------------------------------------------
 # ASSETS (TENANT-SCOPED)
 # ---------------------------------------------------------------------
@@ -81,10 +172,53 @@ class AssetListCreateView(generics.ListCreateAPIView):
             raise ValueError("Tenant missing on request. Ensure TenantMiddleware is enabled.")
         serializer.save(organization=tenant)
 
+def _truthy(value) -> bool:
+    return str(value or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class AssetImportView(APIView):
+    """
+    Bulk asset register import (CSV / XLSX, one asset per row), streamed.
+
+    POST multipart: file=<upload>, dry_run=true|false
+    Columns: name, asset_type, classification, location, legal_owner,
+             technical_owner, value, notes
+    asset_id is always assigned server-side (AST-xxxx).
+
+    All rows are validated first; any error → 400 and nothing is written.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return Response({"detail": "Tenant missing"}, status=400)
+
+        f = request.FILES.get("file")
+        if not f:
+            return Response({"detail": "No file uploaded (field: file)"}, status=400)
+
+        dry_run = _truthy(request.data.get("dry_run") or request.query_params.get("dry_run"))
+        standard = request.data.get("standard") or "iso-27001"
+        if not is_known_standard(standard):
+            return Response({"detail": f"Unknown standard: {standard[:64]}"}, status=400)
+
+        try:
+            result = import_assets(
+                tenant, iter_upload_rows(f), standard=standard, dry_run=dry_run
+            )
+        except ImportFileError as e:
+            return Response({"detail": str(e)}, status=400)
+
+        if result["errors"]:
+            return Response(result, status=400)
+        return Response(result, status=200 if dry_run else 201)
+
 # ---------------------------------------------------------------------
 # RISKS (TENANT-SCOPED)
 # ---------------------------------------------------------------------
-class RiskListCreateView(generics.ListCreateAPIView):
+class RiskListCreateView(ISMSAuditLockMixin, generics.ListCreateAPIView):
     serializer_class = ISORiskSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
@@ -94,7 +228,15 @@ class RiskListCreateView(generics.ListCreateAPIView):
         tenant = getattr(self.request, "tenant", None)
         if not tenant:
             return ISORisk.objects.none()
-        return ISORisk.objects.filter(organization=tenant).order_by("-created_at")
+
+        qs = ISORisk.objects.filter(organization=tenant).order_by("-created_at")
+
+        # Asset via JOIN + all controls in ONE query, whatever the list size
+        if is_expanded(self.request, "asset"):
+            qs = qs.select_related("asset")
+        if is_expanded(self.request, "controls"):
+            qs = qs.prefetch_related("controls")
+        return qs
 
     def perform_create(self, serializer):
         tenant = getattr(self.request, "tenant", None)
@@ -102,7 +244,51 @@ class RiskListCreateView(generics.ListCreateAPIView):
             raise ValueError("Tenant missing on request. Ensure TenantMiddleware is enabled.")
         serializer.save(organization=tenant)
 
-class RiskRetrieveUpdateView(generics.RetrieveUpdateAPIView):
+class RiskImportView(ISMSAuditLockMixin, APIView):
+    """
+    Bulk risk register import (CSV / XLSX, one risk per row).
+
+    POST multipart: file=<upload>, dry_run=true|false
+    Columns: title, description, asset_id (AST-xxxx), likelihood, impact,
+             treatment, controls ("A.5.1, A.8.13"), owner, status,
+             acceptance_justification
+
+    All rows are validated first; any error → 400 and nothing is written.
+    A dry run writes nothing, so it is allowed during an audit.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def audit_lock_applies(self, request, *args, **kwargs):
+        return not _truthy(request.data.get("dry_run") or request.query_params.get("dry_run"))
+
+    def post(self, request):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return Response({"detail": "Tenant missing"}, status=400)
+
+        f = request.FILES.get("file")
+        if not f:
+            return Response({"detail": "No file uploaded (field: file)"}, status=400)
+
+        dry_run = _truthy(request.data.get("dry_run") or request.query_params.get("dry_run"))
+        standard = request.data.get("standard") or "iso-27001"
+        if not is_known_standard(standard):
+            return Response({"detail": f"Unknown standard: {standard[:64]}"}, status=400)
+
+        try:
+            result = import_iso_risks(
+                tenant, iter_upload_rows(f), standard=standard, dry_run=dry_run
+            )
+        except ImportFileError as e:
+            return Response({"detail": str(e)}, status=400)
+
+        if result["errors"]:
+            return Response(result, status=400)
+        return Response(result, status=200 if dry_run else 201)
+
+
+class RiskRetrieveUpdateView(ISMSAuditLockMixin, generics.RetrieveUpdateAPIView):
     serializer_class = ISORiskSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -112,16 +298,8 @@ class RiskRetrieveUpdateView(generics.RetrieveUpdateAPIView):
             return ISORisk.objects.none()
         return ISORisk.objects.filter(organization=tenant)
 
-    def update(self, request, *args, **kwargs):
-        if is_iso27001_audit_locked():
-            return Response(
-                {"error": "ISMS is read-only while audit in progress."},
-                status=status.HTTP_423_LOCKED,
-            )
-        return super().update(request, *args, **kwargs)
-
 # ---------------------------------------------------------------------
-# SoA LIST — AUTO-SEED ON FIRST LOAD (TENANT-SCOPED)
+# SoA LIST — SEEDED PER LIBRARY VERSION (TENANT-SCOPED)
 # ---------------------------------------------------------------------
 class SoAListView(generics.ListAPIView):
     serializer_class = SoAEntrySerializer
@@ -136,65 +314,34 @@ class SoAListView(generics.ListAPIView):
 
         standard = self.request.query_params.get("standard", "iso-27001")
 
-        # ✅ Ensure SoA has ALL controls (idempotent)
-        self._ensure_seeded(tenant, standard)
+        # ✅ Seeded at provisioning / library import; this is a cached
+        #    version check and only re-seeds when the library changed
+        ensure_tenant_library_seeded(tenant, standard)
 
-        return (
+        qs = (
             SoAEntry.objects.filter(organization=tenant, standard=standard)
             .select_related("control")
-            .annotate(
-                chapter=Cast(Substr("control__code", 3, 1), IntegerField()),
-                section=Cast(Substr("control__code", 5, 2), IntegerField()),
-            )
-            .order_by("chapter", "section")
-        )
-
-    @transaction.atomic
-    def _ensure_seeded(self, tenant, standard: str):
-        controls_qs = Control.objects.filter(standard=standard).only("id")
-
-        # Existing control IDs already present in SoA for this tenant+standard
-        existing_control_ids = set(
-            SoAEntry.objects.filter(organization=tenant, standard=standard)
-            .values_list("control_id", flat=True)
+            .order_by("control__sort_major", "control__sort_minor", "control__code")
         )
 
-        # Controls that still need a SoA entry
-        missing_controls = [
-            c for c in controls_qs if c.id not in existing_control_ids
-        ]
-
-        if not missing_controls:
-            return  # ✅ already complete
-
-        # ONLY Reduce risks justify applicability; must be tenant-scoped
-        used_control_ids = set(
-            ISORisk.objects.filter(
-                organization=tenant,
-                standard=standard,
-                treatment="Reduce",
-            ).values_list("controls__id", flat=True)
-        )
-
-        SoAEntry.objects.bulk_create(
-            [
-                SoAEntry(
-                    organization=tenant,
-                    control=control,
-                    standard=standard,
-                    applicable=control.id in used_control_ids,
-                    status="Not Implemented",
-                    justification="",
-                    evidence_notes="",
+        if is_expanded(self.request, "linked_risks"):
+            # Linked risks (+ assets) for every row in ONE query, scoped to the
+            # tenant + standard; SoAEntrySerializer reads control.linked_risks
+            qs = qs.prefetch_related(
+                Prefetch(
+                    "control__risks",
+                    queryset=ISORisk.objects.filter(organization=tenant, standard=standard)
+                    .select_related("asset")
+                    .order_by("-created_at"),
+                    to_attr="linked_risks",
                 )
-                for control in missing_controls
-            ],
-            ignore_conflicts=True,  # safe if unique constraint exists (recommended)
-        )
+            )
+        return qs
+
 # ---------------------------------------------------------------------
 # SoA UPDATE (PATCH) — TENANT-SCOPED QUERYSET
 # ---------------------------------------------------------------------
-class SoAEntryUpdateAPIView(generics.UpdateAPIView):
+class SoAEntryUpdateAPIView(ISMSAuditLockMixin, generics.UpdateAPIView):
     serializer_class = SoAEntryUpdateSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -300,95 +447,32 @@ def iso2701_dashboard_view(request):
 ISO27001_STANDARD = "iso-27001"
 
 
-def _parse_clause_code(code: str) -> tuple[int, int, str]:
-    """
-    Sort helper for clause codes like: 4.1, 4.2, ... 10.1
-    Returns (major, minor, original)
-    """
-    try:
-        parts = code.split(".")
-        major = int(parts[0])
-        minor = int(parts[1]) if len(parts) > 1 else 0
-        return (major, minor, code)
-    except Exception:
-        return (999, 999, code)
-
-
-def _iso27001_clause_in_scope(code: str) -> bool:
+class ISO27001ClauseRecordListView(generics.ListAPIView):
     """
-    ISO 27001 compliance clauses should be 4.* to 10.* (inclusive).
+    Tenant clause records (4.1 ... 10.x) in ONE ordered query.
+    Records are seeded at provisioning / library import (isms_library);
+    the read path only runs the cached version guard.
     """
-    try:
-        major = int(code.split(".")[0])
-        return 4 <= major <= 10
-    except Exception:
-        return False
-
-
-class ISO27001ClauseRecordListView(generics.ListAPIView):
     serializer_class = ISO27001ClauseRecordSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["status", "owner"]
 
     def get_queryset(self):
-        print(
-            "ISO27001ClauseRecordListView:",
-            "host=", self.request.get_host(),
-            "path=", self.request.path,
-            "tenant=", getattr(self.request, "tenant", None),
-        )
-
         tenant = getattr(self.request, "tenant", None)
         if not tenant:
             return ISO27001ClauseRecord.objects.none()
 
-        # Seed on first load (per tenant)
-        qs = ISO27001ClauseRecord.objects.filter(organization=tenant).select_related("clause")
-
-        if not qs.exists():
-            self._auto_seed(tenant)
-
-        return ISO27001ClauseRecord.objects.filter(organization=tenant).select_related("clause")
-
-    @transaction.atomic
-    def _auto_seed(self, tenant):
-        # Pull GLOBAL clause definitions for iso-27001, then filter 4–10
-        defs = Clause.objects.filter(standard=ISO27001_STANDARD)
-        defs = [c for c in defs if _iso27001_clause_in_scope(c.code)]
-        defs.sort(key=lambda c: _parse_clause_code(c.code))
-
-        ISO27001ClauseRecord.objects.bulk_create(
-            [
-                ISO27001ClauseRecord(
-                    organization=tenant,
-                    clause=c,
-                    status="NI",
-                    owner="Unassigned",
-                    comments="",
-                )
-                for c in defs
-            ],
-            ignore_conflicts=True,
-        )
-
-    def list(self, request, *args, **kwargs):
-        """
-        Ensure stable ordering by clause code (4.1 ... 10.x)
-        """
-        tenant = getattr(request, "tenant", None)
-        if not tenant:
-            return Response([], status=200)
+        ensure_tenant_library_seeded(tenant, ISO27001_STANDARD)
 
-        records = list(
+        return (
             ISO27001ClauseRecord.objects.filter(organization=tenant)
             .select_related("clause")
+            .order_by("clause__sort_major", "clause__sort_minor", "clause__code")
         )
-        records.sort(key=lambda r: _parse_clause_code(r.clause.code))
-
-        ser = self.get_serializer(records, many=True, context={"request": request})
-        return Response(ser.data)
 
 
-class ISO27001ClauseRecordDetailView(generics.UpdateAPIView):
+class ISO27001ClauseRecordDetailView(ISMSAuditLockMixin, generics.UpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = ISO27001ClauseRecordPatchSerializer
 
@@ -408,7 +492,7 @@ class ISO27001ClauseRecordDetailView(generics.UpdateAPIView):
         return Response(out)
 
 
-class ISO27001ClauseEvidenceUploadView(APIView):
+class ISO27001ClauseEvidenceUploadView(ISMSAuditLockMixin, APIView):
     permission_classes = [permissions.IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
 
@@ -428,8 +512,7 @@ class ISO27001ClauseEvidenceUploadView(APIView):
         if not f:
             return Response({"detail": "No file uploaded (field: evidence)"}, status=400)
 
-        record.evidence = f
-        record.save(update_fields=["evidence", "updated_at"])
+        attach_evidence(record, f, update_fields=["evidence", "updated_at"])
 
         return Response(
             ISO27001ClauseRecordSerializer(record, context={"request": request}).data,
@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import Organization
+from api.isms_drift import detect_isms_drift
+
+
+class Command(BaseCommand):
+    help = (
+        "Detect derived ISMS state (SoA completeness/applicability, risk score, "
+        "control coverage, asset security) that drifted from its source data. "
+        "Cheap enough to run nightly; use --repair to fix drifted rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repair", action="store_true", help="Write the corrected values.")
+        parser.add_argument(
+            "--show-ids",
+            type=int,
+            default=10,
+            help="Max drifted row IDs to list per tenant and check (0 = counts only).",
+        )
+        parser.add_argument(
+            "--fail-on-drift",
+            action="store_true",
+            help="Exit non-zero when drift is found (for cron/monitoring).",
+        )
+
+    def handle(self, *args, **opts):
+        started = time.monotonic()
+        report = detect_isms_drift(repair=opts["repair"])
+        show = opts["show_ids"]
+
+        slugs = dict(
+            (str(org_id), slug)
+            for org_id, slug in Organization.objects.values_list("id", "slug")
+        )
+
+        total = 0
+        for check, by_tenant in report.items():
+            count = sum(len(ids) for ids in by_tenant.values())
+            total += count
+            style = self.style.WARNING if count else self.style.SUCCESS
+            self.stdout.write(style(f"{check}: {count} drifted"))
+
+            for org_id, ids in sorted(by_tenant.items(), key=lambda kv: slugs.get(kv[0], "")):
+                line = f"  {slugs.get(org_id, org_id)}: {len(ids)}"
+                if show:
+                    sample = ", ".join(str(i) for i in ids[:show])
+                    more = " …" if len(ids) > show else ""
+                    line += f" [{sample}{more}]"
+                self.stdout.write(line)
+
+        elapsed = time.monotonic() - started
+        if opts["repair"]:
+            self.stdout.write(self.style.SUCCESS(f"✅ Repaired {total} drifted row(s) in {elapsed:.2f}s"))
+        else:
+            self.stdout.write(f"Found {total} drifted row(s) in {elapsed:.2f}s (no changes written)")
+
+        if total and opts["fail_on_drift"] and not opts["repair"]:
+            raise CommandError("ISMS derived state has drifted.")
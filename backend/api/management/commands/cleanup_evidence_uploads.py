@@ -0,0 +1,60 @@
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.evidence_uploads import remove_temp_file
+from api.models import EvidenceUpload
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete chunked evidence upload sessions (and their temp files) "
+        "that have not been touched for --hours."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=int, default=24)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **opts):
+        dry_run = opts["dry_run"]
+        cutoff = timezone.now() - timedelta(hours=opts["hours"])
+
+        stale = EvidenceUpload.objects.filter(updated_at__lt=cutoff)
+        abandoned = stale.filter(status="open").count()
+        finished = stale.count() - abandoned
+
+        if not dry_run:
+            for upload in stale.filter(status="open").iterator():
+                remove_temp_file(upload)
+            stale.delete()
+
+        # Temp files whose session row is already gone
+        known = {f"{pk}.part" for pk in EvidenceUpload.objects.values_list("pk", flat=True)}
+        strays = 0
+        if os.path.isdir(settings.EVIDENCE_UPLOAD_DIR):
+            with os.scandir(settings.EVIDENCE_UPLOAD_DIR) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_file()
+                        and entry.name.endswith(".part")
+                        and entry.name not in known
+                        and entry.stat().st_mtime < cutoff.timestamp()
+                    ):
+                        strays += 1
+                        if not dry_run:
+                            os.remove(entry.path)
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN: nothing deleted."))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {abandoned} abandoned upload(s), {finished} finished session(s), "
+                f"{strays} stray temp file(s) older than {opts['hours']}h "
+                f"{'found' if dry_run else 'removed'}."
+            )
+        )
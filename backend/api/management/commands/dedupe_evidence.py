@@ -0,0 +1,77 @@
+from collections import defaultdict
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from api.evidence import (
+    BLOB_PREFIX,
+    EVIDENCE_MODELS,
+    refresh_evidence_vectors,
+    store_evidence,
+)
+from api.models import EvidenceBlob
+
+
+class Command(BaseCommand):
+    help = (
+        "Move evidence uploaded before content-addressed storage into shared "
+        "blobs, deleting the duplicate copies."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **opts):
+        dry_run = opts["dry_run"]
+        moved = missing = 0
+        legacy_bytes = 0
+
+        # legacy path → [(model, pk), ...]: rows sharing a file move together
+        legacy = defaultdict(list)
+        for model in EVIDENCE_MODELS:
+            rows = (
+                model.objects.exclude(evidence="")
+                .exclude(evidence__isnull=True)
+                .exclude(evidence__startswith=BLOB_PREFIX)
+                .values_list("pk", "evidence")
+            )
+            for pk, name in rows.iterator():
+                legacy[name].append((model, pk))
+
+        for name, refs in legacy.items():
+            if not default_storage.exists(name):
+                missing += len(refs)
+                for model, pk in refs:
+                    self.stdout.write(self.style.WARNING(f"⚠️ {model.__name__} {pk}: missing {name}"))
+                continue
+
+            legacy_bytes += default_storage.size(name)
+            moved += len(refs)
+            if dry_run:
+                continue
+
+            with transaction.atomic(), default_storage.open(name) as fh:
+                # One reference per row pointing at this file
+                blob = store_evidence(fh)
+                EvidenceBlob.objects.filter(pk=blob.pk).update(
+                    ref_count=F("ref_count") + len(refs) - 1
+                )
+                for model in {model for model, _ in refs}:
+                    rows = model.objects.filter(pk__in=[pk for m, pk in refs if m is model])
+                    # Queryset update: keeps updated_at / last_updated as they were
+                    rows.update(evidence=blob.file.name)
+                    refresh_evidence_vectors(rows)
+                # Only once every row has moved off it
+                transaction.on_commit(lambda name=name: default_storage.delete(name))
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN: nothing changed."))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {moved} legacy evidence reference(s) ({legacy_bytes} bytes) "
+                f"{'would be ' if dry_run else ''}moved into blobs; {missing} missing."
+            )
+        )
@@ -0,0 +1,88 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from api.evidence_text import extract_file, pending_batch, save_batch
+
+
+# Statuses that take a blob out of the backlog; "pending" (extractor not
+# available here) does not, so a batch of only those is no progress
+PROGRESS_STATUSES = ("extracted", "unsupported", "failed")
+
+
+def _init_worker():
+    # Needed for spawn-based pools; a no-op when the worker was forked.
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract text from pending evidence blobs (PDF, DOCX, ODT, plain text) "
+        "in a worker pool and index it for evidence search."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help="Extraction worker processes (1 = run in this process).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new uploads instead of exiting when done.",
+        )
+        parser.add_argument("--interval", type=int, default=30, help="Seconds between polls.")
+
+    def handle(self, *args, **opts):
+        workers = max(1, opts["workers"])
+        pool = None
+        if workers > 1:
+            # Forked workers must not share the parent's DB connection.
+            connections.close_all()
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+        try:
+            while True:
+                totals = self._drain(pool, opts["batch_size"])
+                if not opts["loop"]:
+                    break
+                if not any(totals.get(status) for status in PROGRESS_STATUSES):
+                    time.sleep(opts["interval"])
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def _drain(self, pool, batch_size):
+        started = time.monotonic()
+        totals = {}
+        after_id = 0
+
+        while True:
+            batch = pending_batch(after_id, batch_size)
+            if not batch:
+                break
+            after_id = batch[-1][0]
+
+            paths = [path for _, _, path in batch]
+            results = list(pool.map(extract_file, paths) if pool else map(extract_file, paths))
+            counts = save_batch(batch, results)
+
+            for status, n in counts.items():
+                totals[status] = totals.get(status, 0) + n
+            summary = ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+            self.stdout.write(f"blobs ≤ {after_id}: {summary}")
+
+        summary = ", ".join(f"{k}={v}" for k, v in sorted(totals.items())) or "nothing pending"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Evidence text extraction in {time.monotonic() - started:.2f}s: {summary}"
+            )
+        )
+        return totals
@@ -0,0 +1,138 @@
+import os
+import shutil
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.utils import timezone
+
+
+def referenced_paths() -> set:
+    """Every stored name of every FileField, one query per model."""
+    paths = set()
+    for model in apps.get_models():
+        fields = [f.attname for f in model._meta.concrete_fields if isinstance(f, models.FileField)]
+        if not fields:
+            continue
+        rows = model._default_manager.values_list(*fields).iterator(chunk_size=5000)
+        for row in rows:
+            paths.update(name for name in row if name)
+    return paths
+
+
+def scan_files(root):
+    """DirEntry for every regular file under root, via os.scandir."""
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def remove_empty_dirs(root):
+    for dirpath, _, _ in sorted(os.walk(root), key=lambda d: len(d[0]), reverse=True):
+        if dirpath != root:
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass  # not empty
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete (or quarantine) evidence files under MEDIA_ROOT that no FileField "
+        "references and that are older than the grace period."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir",
+            action="append",
+            dest="dirs",
+            help="Directory under MEDIA_ROOT to sweep (repeatable). Default: evidence",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="Leave files younger than this alone (in-flight uploads).",
+        )
+        parser.add_argument(
+            "--quarantine",
+            action="store_true",
+            help="Move orphans to EVIDENCE_QUARANTINE_DIR instead of deleting them.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **opts):
+        started = time.monotonic()
+        dry_run = opts["dry_run"]
+        media_root = os.path.abspath(settings.MEDIA_ROOT)
+        cutoff = time.time() - opts["grace_hours"] * 3600
+
+        roots = []
+        for rel in opts["dirs"] or ["evidence"]:
+            root = os.path.abspath(os.path.join(media_root, rel))
+            if os.path.commonpath([root, media_root]) != media_root:
+                raise CommandError(f"{rel} is outside MEDIA_ROOT")
+            if os.path.isdir(root):
+                roots.append(root)
+
+        # Build the reference set BEFORE listing files: anything written after
+        # this point is younger than the grace period anyway
+        referenced = referenced_paths()
+
+        quarantine = None
+        if opts["quarantine"]:
+            quarantine = os.path.join(
+                settings.EVIDENCE_QUARANTINE_DIR, timezone.now().strftime("%Y%m%d-%H%M%S")
+            )
+
+        scanned = kept_young = orphans = reclaim = 0
+        for root in roots:
+            for entry in scan_files(root):
+                scanned += 1
+                name = os.path.relpath(entry.path, media_root).replace(os.sep, "/")
+                if name in referenced:
+                    continue
+
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime > cutoff:
+                    kept_young += 1
+                    continue
+
+                orphans += 1
+                reclaim += stat.st_size
+                if opts["verbosity"] > 1:
+                    self.stdout.write(f"  {name} ({stat.st_size} bytes)")
+                if dry_run:
+                    continue
+
+                if quarantine:
+                    target = os.path.join(quarantine, name)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    shutil.move(entry.path, target)
+                else:
+                    os.remove(entry.path)
+
+            if not dry_run:
+                remove_empty_dirs(root)
+
+        action = "would be reclaimed" if dry_run else (
+            f"moved to {quarantine}" if quarantine else "deleted"
+        )
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN: nothing removed."))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Scanned {scanned} file(s) against {len(referenced)} reference(s) in "
+                f"{time.monotonic() - started:.2f}s: {orphans} orphan(s), {reclaim} bytes {action}; "
+                f"{kept_young} unreferenced file(s) inside the {opts['grace_hours']}h grace period."
+            )
+        )
@@ -5,6 +5,7 @@ from django.db import transaction
 from openpyxl import load_workbook
 
 from api.isms_models import Clause, Control, SoAEntry
+from api.isms_library import bump_library_version, seed_all_tenants
 from api.models import ComplianceClause
 
 CONTROL_CODE_PATTERN = re.compile(r"^A\.\d+(\.\d+)?$")
@@ -94,7 +95,7 @@ class Command(BaseCommand):
                 if not CONTROL_CODE_PATTERN.match(raw_code):
                     continue
 
-                ctrl = Control.objects.create(
+                Control.objects.create(
                     code=raw_code,
                     title=title,
                     description="",
@@ -102,20 +103,16 @@ class Command(BaseCommand):
                     standard="iso-27001",
                 )
 
-                SoAEntry.objects.create(
-                    control=ctrl,
-                    standard="iso-27001",
-                    applicable=True,
-                    status="Not implemented",
-                    justification="",
-                    evidence_notes="",
-                )
-
                 control_count += 1
 
+            # New library version → re-seed every tenant's SoA (tenant-scoped)
+            version = bump_library_version("iso-27001")
+            seeded = seed_all_tenants("iso-27001")
+
             self.stdout.write(
                 self.style.SUCCESS(f"✔ Controls imported: {control_count}")
             )
+            self.stdout.write(f"Library version={version}, SoA entries seeded={seeded}")
         else:
             self.stdout.write(self.style.WARNING("No 'Controls' sheet found."))
 
@@ -0,0 +1,102 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from api.models import Organization
+from api.isms_signals import derive_tenant_isms_state
+
+
+def _init_worker():
+    # Needed for spawn-based pools; a no-op when the worker was forked.
+    django.setup()
+
+
+def recompute_tenant(org_id, dry_run=False):
+    """
+    Rebuild all derived ISMS fields for ONE tenant in its own transaction.
+    A dry run performs the same UPDATEs and rolls them back, so the
+    reported counts are exact.
+    """
+    started = time.monotonic()
+    org = Organization.objects.get(pk=org_id)
+
+    with transaction.atomic():
+        counts = derive_tenant_isms_state(org)
+        if dry_run:
+            transaction.set_rollback(True)
+
+    return org.slug, counts, time.monotonic() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild derived ISMS state (risk score/level, SoA applicability, "
+        "risk control coverage, asset security) with set-based SQL, per tenant."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            action="append",
+            dest="tenants",
+            help="Organization slug (repeatable). Default: all tenants.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help="Tenant worker processes (1 = run in this process).",
+        )
+
+    def handle(self, *args, **opts):
+        dry_run = opts["dry_run"]
+        slugs = opts["tenants"]
+
+        orgs = Organization.objects.order_by("slug")
+        if slugs:
+            orgs = orgs.filter(slug__in=slugs)
+            missing = set(slugs) - set(orgs.values_list("slug", flat=True))
+            if missing:
+                raise CommandError(f"Unknown tenant(s): {', '.join(sorted(missing))}")
+
+        org_ids = list(orgs.values_list("id", flat=True))
+        workers = max(1, min(opts["workers"], len(org_ids)))
+
+        started = time.monotonic()
+        totals = {}
+
+        for slug, counts, elapsed in self._run(org_ids, workers, dry_run):
+            for field, n in counts.items():
+                totals[field] = totals.get(field, 0) + n
+            summary = ", ".join(f"{k}={v}" for k, v in counts.items())
+            self.stdout.write(f"{slug}: {summary} ({elapsed:.2f}s)")
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN: all changes rolled back."))
+
+        summary = ", ".join(f"{k}={v}" for k, v in totals.items()) or "nothing to do"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Recomputed {len(org_ids)} tenant(s) with {workers} worker(s) "
+                f"in {time.monotonic() - started:.2f}s: {summary}"
+            )
+        )
+
+    def _run(self, org_ids, workers, dry_run):
+        if workers == 1:
+            for org_id in org_ids:
+                yield recompute_tenant(org_id, dry_run)
+            return
+
+        # Forked workers must not share the parent's DB connection.
+        connections.close_all()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(recompute_tenant, org_id, dry_run) for org_id in org_ids]
+            for future in futures:
+                yield future.result()
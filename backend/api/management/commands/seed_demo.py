@@ -185,16 +185,16 @@ class Command(BaseCommand):
             )
 
         # ---- Tenant data: ISO 7101 Risk Register (tenant-scoped Risk) ----
+        # RSK-/AUD-/FND-xxxx IDs are assigned on save, see api.sequences
         risks_7101 = [
-            ("RSK-0001", "Clinical process variance causing quality incidents", "Medium"),
-            ("RSK-0002", "Supplier delays impacting service continuity", "Low"),
-            ("RSK-0003", "Inadequate training leading to compliance gaps", "Medium"),
+            ("Clinical process variance causing quality incidents", "Medium"),
+            ("Supplier delays impacting service continuity", "Low"),
+            ("Inadequate training leading to compliance gaps", "Medium"),
         ]
         today = timezone.now().date()
-        for rid, desc, level in risks_7101:
+        for desc, level in risks_7101:
             Risk.objects.create(
                 organization=org,
-                risk_id=rid,
                 description=desc,
                 likelihood="Medium",
                 impact="Medium",
@@ -211,7 +211,6 @@ class Command(BaseCommand):
         # ---- Tenant data: Audit + Findings (tenant-scoped via Audit) ----
         audit = Audit.objects.create(
             organization=org,
-            audit_id="AUD-0001",
             audit_name="ISO Demo Internal Audit",
             objective="Validate demo controls and evidence flow",
             scope="ISO 27001 + ISO 7101 demo scope",
@@ -226,7 +225,6 @@ class Command(BaseCommand):
         demo_clause = Clause.objects.filter(standard="iso-27001").order_by("code").first()
         finding = Finding.objects.create(
             audit=audit,
-            finding_id="FND-0001",
             description="Evidence notes incomplete for selected controls.",
             clause=demo_clause,
             severity="Medium",
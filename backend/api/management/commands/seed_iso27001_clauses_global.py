@@ -2,6 +2,8 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.apps import apps
 
+from api.isms_library import bump_library_version, seed_all_tenants
+
 ISO_27001_CLAUSES = [
     ("4.1", "External and internal issues affecting the organization and its information security management system are identified and reviewed."),
     ("4.2", "Information security needs and expectations of relevant interested parties are clearly understood and documented."),
@@ -73,6 +75,11 @@ class Command(BaseCommand):
 
         if dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN: no database writes performed."))
+        elif created or updated:
+            # Library changed → new version, seed every tenant's clause records
+            version = bump_library_version("iso-27001")
+            seeded = seed_all_tenants("iso-27001")
+            self.stdout.write(f"Library version={version}, tenant rows seeded={seeded}")
 
         self.stdout.write(self.style.SUCCESS("✅ ISO 27001 global Clause seed complete"))
         self.stdout.write(f"Created={created}, Existing={existing}, Updated={updated}")
@@ -3,6 +3,8 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.apps import apps
 
+from api.isms_library import bump_library_version, seed_all_tenants
+
 
 ISO_27001_CLAUSES = [
     ("4.1", "External and internal issues affecting the organization and its information security management system are identified and reviewed."),
@@ -235,6 +237,11 @@ class Command(BaseCommand):
 
         if dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN: no database writes performed."))
+        elif c_created or c_updated:
+            # Library changed → new version, re-seed every tenant's SoA
+            version = bump_library_version("iso-27001")
+            seeded = seed_all_tenants("iso-27001")
+            self.stdout.write(f"Library version={version}, SoA entries seeded={seeded}")
 
         self.stdout.write(self.style.SUCCESS(f"✅ ISO 27001 seed complete for org '{slug}'"))
         self.stdout.write(f"Clauses: created={created}, existing={existing}, updated={updated}")
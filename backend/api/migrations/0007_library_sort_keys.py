@@ -0,0 +1,72 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:49
+
+from django.db import migrations, models
+
+
+def _sort_key(code):
+    # Frozen copy of isms_models.code_sort_key
+    parts = (code or "").strip().upper().removeprefix("A.").split(".")
+    try:
+        return int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
+    except ValueError:
+        return 999, 999
+
+
+def backfill_sort_keys(apps, schema_editor):
+    for model_name in ("Clause", "Control"):
+        model = apps.get_model("api", model_name)
+        rows = list(model.objects.only("id", "code"))
+        for row in rows:
+            row.sort_major, row.sort_minor = _sort_key(row.code)
+        model.objects.bulk_update(rows, ["sort_major", "sort_minor"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_libraryversion_tenantlibraryseed'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='clause',
+            options={'ordering': ['sort_major', 'sort_minor', 'code']},
+        ),
+        migrations.AlterModelOptions(
+            name='control',
+            options={'ordering': ['sort_major', 'sort_minor', 'code']},
+        ),
+        migrations.AlterModelOptions(
+            name='soaentry',
+            options={'ordering': ['control__sort_major', 'control__sort_minor']},
+        ),
+        migrations.AddField(
+            model_name='clause',
+            name='sort_major',
+            field=models.PositiveSmallIntegerField(default=999),
+        ),
+        migrations.AddField(
+            model_name='clause',
+            name='sort_minor',
+            field=models.PositiveSmallIntegerField(default=999),
+        ),
+        migrations.AddField(
+            model_name='control',
+            name='sort_major',
+            field=models.PositiveSmallIntegerField(default=999),
+        ),
+        migrations.AddField(
+            model_name='control',
+            name='sort_minor',
+            field=models.PositiveSmallIntegerField(default=999),
+        ),
+        migrations.AddIndex(
+            model_name='clause',
+            index=models.Index(fields=['standard', 'sort_major', 'sort_minor'], name='api_clause_standar_6baa23_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='control',
+            index=models.Index(fields=['standard', 'sort_major', 'sort_minor'], name='api_control_standar_c6d2a1_idx'),
+        ),
+        migrations.RunPython(backfill_sort_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def seed_clause_records(apps, schema_editor):
+    # Clause records are now seeded with the tenant library (isms_library),
+    # not on first read; backfill tenants that never loaded the page.
+    Organization = apps.get_model("api", "Organization")
+    Clause = apps.get_model("api", "Clause")
+    ISO27001ClauseRecord = apps.get_model("api", "ISO27001ClauseRecord")
+
+    clause_ids = list(
+        Clause.objects.filter(
+            standard="iso-27001", sort_major__gte=4, sort_major__lte=10
+        ).values_list("id", flat=True)
+    )
+    for org_id in Organization.objects.values_list("id", flat=True):
+        ISO27001ClauseRecord.objects.bulk_create(
+            [
+                ISO27001ClauseRecord(
+                    organization_id=org_id,
+                    clause_id=clause_id,
+                    status="NI",
+                    owner="Unassigned",
+                    comments="",
+                )
+                for clause_id in clause_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_library_sort_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_clause_records, migrations.RunPython.noop),
+    ]
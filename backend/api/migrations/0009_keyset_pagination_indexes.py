@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_seed_iso27001_clause_records'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['organization', 'created_at', 'id'], name='api_asset_organiz_41bc71_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audit',
+            index=models.Index(fields=['organization', 'standard', 'date', 'id'], name='api_audit_organiz_15a852_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='isorisk',
+            index=models.Index(fields=['organization', 'created_at', 'id'], name='api_isorisk_organiz_fd17fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='risk',
+            index=models.Index(fields=['organization', 'risk_score', 'id'], name='api_risk_organiz_428dd3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thirdparty',
+            index=models.Index(fields=['organization', 'name', 'id'], name='api_thirdpa_organiz_9dd5f8_idx'),
+        ),
+    ]
@@ -0,0 +1,117 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# Frozen copy of api.search.SEARCH_ENTITIES document definitions
+SEARCH_DOCUMENTS = {
+    "ISORisk": [("title", "A"), ("description", "B"), ("owner", "C"),
+                ("acceptance_justification", "C")],
+    "Risk": [("risk_id", "A"), ("description", "A"), ("existing_control", "B"),
+             ("treatment_action", "B"), ("owner", "C")],
+    "Asset": [("name", "A"), ("asset_id", "A"), ("asset_type", "B"), ("location", "C"),
+              ("legal_owner", "C"), ("technical_owner", "C"), ("notes", "C")],
+    "Finding": [("finding_id", "A"), ("description", "A"), ("corrective_action", "B")],
+    "ThirdParty": [("name", "A"), ("category", "B"), ("description", "B"),
+                   ("scope_of_dependency", "C")],
+    "TPRMRisk": [("title", "A"), ("description", "B")],
+    "ComplianceClause": [("clause_number", "A"), ("short_description", "A"),
+                         ("description", "B"), ("comments", "C"), ("owner", "C")],
+    "SoAEntry": [("justification", "B"), ("evidence_notes", "B")],
+}
+
+
+def backfill_search_vectors(apps, schema_editor):
+    from django.contrib.postgres.search import SearchVector
+
+    for model_name, document in SEARCH_DOCUMENTS.items():
+        vector = None
+        for field, weight in document:
+            part = SearchVector(field, weight=weight, config="english")
+            vector = part if vector is None else vector + part
+        apps.get_model("api", model_name).objects.update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='complianceclause',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='finding',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='isorisk',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='risk',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='soaentry',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='thirdparty',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='tprmrisk',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_asset_search__5d0ed4_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='complianceclause',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_complia_search__3a18f4_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='finding',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_finding_search__bd4402_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='isorisk',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_isorisk_search__afc7b5_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='risk',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_risk_search__eb4aec_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='soaentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_soaentr_search__bf97f3_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='thirdparty',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_thirdpa_search__602fc3_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tprmrisk',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='api_tprmris_search__cfdf95_gin'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
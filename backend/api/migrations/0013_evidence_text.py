@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-19 03:19
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_evidence_uploads'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='complianceclause',
+            name='evidence_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evidenceblob',
+            name='text',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='evidenceblob',
+            name='text_extracted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='evidenceblob',
+            name='text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('extracted', 'Extracted'), ('unsupported', 'Unsupported type'), ('failed', 'Failed')], default='pending', max_length=12),
+        ),
+        migrations.AddField(
+            model_name='iso27001clauserecord',
+            name='evidence_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='complianceclause',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['evidence_vector'], name='api_complia_evidenc_144227_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='evidenceblob',
+            index=models.Index(fields=['text_status', 'id'], name='api_evidenc_text_st_b52876_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='iso27001clauserecord',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['evidence_vector'], name='api_iso2700_evidenc_715884_gin'),
+        ),
+    ]
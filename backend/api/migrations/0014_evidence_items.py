@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-19 03:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_evidence_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvidenceItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(max_length=255, upload_to='evidence/items/')),
+                ('name', models.CharField(max_length=255)),
+                ('size', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('compliance_clause', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='evidence_items', to='api.complianceclause')),
+                ('finding', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='evidence_items', to='api.finding')),
+                ('iso27001_clause', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='evidence_items', to='api.iso27001clauserecord')),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evidence_items', to='api.organization')),
+                ('soa_entry', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='evidence_items', to='api.soaentry')),
+                ('uploaded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['organization', 'created_at'], name='api_evidenc_organiz_4a64e9_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('compliance_clause__isnull', False), ('finding__isnull', True), ('iso27001_clause__isnull', True), ('soa_entry__isnull', True)), models.Q(('compliance_clause__isnull', True), ('finding__isnull', True), ('iso27001_clause__isnull', False), ('soa_entry__isnull', True)), models.Q(('compliance_clause__isnull', True), ('finding__isnull', True), ('iso27001_clause__isnull', True), ('soa_entry__isnull', False)), models.Q(('compliance_clause__isnull', True), ('finding__isnull', False), ('iso27001_clause__isnull', True), ('soa_entry__isnull', True)), _connector='OR'), name='evidence_item_single_record')],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.7 on 2026-10-19 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_third_party_references(apps, schema_editor):
+    """TP-0001... per tenant in creation order; the counter continues from there."""
+    ThirdParty = apps.get_model("api", "ThirdParty")
+    TenantSequence = apps.get_model("api", "TenantSequence")
+
+    counters = {}
+    parties = ThirdParty.objects.order_by("organization_id", "created_at", "id")
+    for party in parties.iterator():
+        n = counters.get(party.organization_id, 0) + 1
+        counters[party.organization_id] = n
+        party.reference = f"TP-{str(n).zfill(4)}"
+        party.save(update_fields=["reference"])
+
+    TenantSequence.objects.bulk_create(
+        TenantSequence(organization_id=org_id, name="third_party", next_value=n + 1)
+        for org_id, n in counters.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_evidence_items'),
+    ]
+
+    operations = [
+        # Existing rows are the asset counter
+        migrations.RenameField(
+            model_name='tenantsequence',
+            old_name='next_asset_number',
+            new_name='next_value',
+        ),
+        migrations.AddField(
+            model_name='tenantsequence',
+            name='name',
+            field=models.CharField(default='asset', max_length=32),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='tenantsequence',
+            name='organization',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sequences', to='api.organization'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='tenantsequence',
+            unique_together={('organization', 'name')},
+        ),
+        migrations.AlterField(
+            model_name='finding',
+            name='finding_id',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='thirdparty',
+            name='reference',
+            field=models.CharField(default='', editable=False, max_length=20),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_third_party_references, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='thirdparty',
+            unique_together={('organization', 'reference')},
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-19 10:05
+
+from django.db import migrations, models
+from django.db.models import F, Func, Value
+
+
+def backfill_evidence_names(apps, schema_editor):
+    """Existing evidence: the last path segment is the best name there is."""
+    for model_name in ("ComplianceClause", "ISO27001ClauseRecord"):
+        model = apps.get_model("api", model_name)
+        model.objects.exclude(evidence="").exclude(evidence__isnull=True).update(
+            evidence_name=Func(F("evidence"), Value("^.*/"), Value(""), function="regexp_replace")
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_tenant_sequences'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='complianceclause',
+            name='evidence_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='iso27001clauserecord',
+            name='evidence_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(backfill_evidence_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_finding_organizations(apps, schema_editor):
+    """Each finding belongs to its audit's tenant."""
+    Audit = apps.get_model("api", "Audit")
+    Finding = apps.get_model("api", "Finding")
+    Finding.objects.update(
+        organization_id=Subquery(
+            Audit.objects.filter(pk=OuterRef("audit_id")).values("organization_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_evidence_names'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='finding',
+            name='organization',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='findings', to='api.organization'),
+        ),
+        migrations.RunPython(backfill_finding_organizations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='finding',
+            name='organization',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='findings', to='api.organization'),
+        ),
+        migrations.AlterField(
+            model_name='finding',
+            name='finding_id',
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AlterUniqueTogether(
+            name='finding',
+            unique_together={('organization', 'finding_id')},
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_finding_organization'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='audit',
+            name='audit_id',
+            field=models.CharField(editable=False, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='finding',
+            name='finding_id',
+            field=models.CharField(editable=False, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='risk',
+            name='risk_id',
+            field=models.CharField(editable=False, max_length=20),
+        ),
+    ]
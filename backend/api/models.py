@@ -2,8 +2,11 @@
 
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from .tprm_models import *
+from .sequences import assign_ids
 import uuid
 import re
 
@@ -63,18 +66,22 @@ class Organization(models.Model):
 
 class TenantSequence(models.Model):
     """
-    Per-tenant counters for human-friendly IDs (AST-0001, etc.)
-    Safe under concurrency using select_for_update().
+    Per-tenant counters for human-friendly IDs (AST-0001, RSK-0001, etc.),
+    one row per (tenant, counter). Reserved in blocks by api.sequences.
     """
-    organization = models.OneToOneField(
+    organization = models.ForeignKey(
         "api.Organization",  # ✅ string ref avoids ordering issues
         on_delete=models.CASCADE,
-        related_name="sequence",
+        related_name="sequences",
     )
-    next_asset_number = models.PositiveIntegerField(default=1)
+    name = models.CharField(max_length=32)  # key of api.sequences.SEQUENCES
+    next_value = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ("organization", "name")
 
     def __str__(self):
-        return f"{self.organization.slug} seq (asset={self.next_asset_number})"
+        return f"{self.organization.slug} {self.name} seq (next={self.next_value})"
 
 
 # =========================================================
@@ -108,7 +115,8 @@ class Risk(models.Model):
         Organization, on_delete=models.CASCADE, related_name="risks_7101"
     )
 
-    risk_id = models.CharField(max_length=20)  # ❗ remove unique=True
+    # Human-readable ID per tenant (RSK-0001...), assigned on save, see api.sequences
+    risk_id = models.CharField(max_length=20, editable=False)
     description = models.TextField()
     likelihood = models.CharField(max_length=50)
     impact = models.CharField(max_length=50)
@@ -121,16 +129,106 @@ class Risk(models.Model):
     review_date = models.DateField()
     archived = models.BooleanField(default=False)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         unique_together = ("organization", "risk_id")
         indexes = [
             models.Index(fields=["organization"]),
             models.Index(fields=["organization", "status"]),
+            # keyset pagination: (sort key, id)
+            models.Index(fields=["organization", "risk_score", "id"]),
+            GinIndex(fields=["search_vector"]),
         ]
 
+    def save(self, *args, **kwargs):
+        # RSK-0001... per tenant, see api.sequences
+        assign_ids([self], "risk")
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.risk_id} – {self.description[:40]}"
 
+# =========================================================
+# Evidence Blobs (content-addressed, shared across tenants)
+# =========================================================
+class EvidenceBlob(models.Model):
+    """
+    One stored copy per distinct evidence content (SHA-256).
+    Evidence FileFields point at `file`; ref_count tracks how many do.
+    Managed by api.evidence — never write these rows directly.
+    """
+    TEXT_STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("extracted", "Extracted"),
+        ("unsupported", "Unsupported type"),
+        ("failed", "Failed"),
+    ]
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to="evidence/blobs/", max_length=255)
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # Filled in the background by api.evidence_text (extract_evidence_text)
+    text = models.TextField(blank=True, default="")
+    text_status = models.CharField(max_length=12, choices=TEXT_STATUS_CHOICES, default="pending")
+    text_extracted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["file"]),
+            models.Index(fields=["text_status", "id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes, refs={self.ref_count})"
+
+
+class EvidenceUpload(models.Model):
+    """
+    A chunked, resumable evidence upload session (api.evidence_uploads).
+    Chunks are appended to a temp file; completing the session attaches the
+    file to the target clause record through the blob store.
+    """
+    TARGET_CHOICES = [
+        ("compliance-clause", "Compliance clause"),
+        ("iso27001-clause", "ISO/IEC 27001 clause record"),
+    ]
+    STATUS_CHOICES = [
+        ("open", "Open"),
+        ("complete", "Complete"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    organization = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="evidence_uploads"
+    )
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+
+    target = models.CharField(max_length=32, choices=TARGET_CHOICES)
+    record_id = models.PositiveBigIntegerField()
+
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64, blank=True, default="")
+
+    received = models.BigIntegerField(default=0)
+    next_chunk = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="open")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "updated_at"])]
+
+    def __str__(self):
+        return f"{self.filename} → {self.target}:{self.record_id} ({self.received}/{self.size})"
+
+
 # =========================================================
 # Compliance Clause Records (ISO 7101 module)  Tenant scoped
 # =========================================================
@@ -163,8 +261,15 @@ class ComplianceClause(models.Model):
     comments = models.TextField(blank=True, null=True)
     owner = models.CharField(max_length=100, default="Unassigned")
     evidence = models.FileField(upload_to="evidence/", blank=True, null=True)
+    # The uploader's filename: blob paths are content hashes (api.evidence)
+    evidence_name = models.CharField(max_length=255, blank=True, default="")
     last_updated = models.DateTimeField(auto_now=True)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Text of the evidence file, copied from its blob by api.evidence
+    evidence_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -175,6 +280,8 @@ class ComplianceClause(models.Model):
         indexes = [
             models.Index(fields=["organization", "standard"]),
             models.Index(fields=["organization", "standard", "clause_major", "clause_minor"]),
+            GinIndex(fields=["search_vector"]),
+            GinIndex(fields=["evidence_vector"]),
         ]
 
     def save(self, *args, **kwargs):
@@ -199,7 +306,8 @@ class Audit(models.Model):
         Organization, on_delete=models.CASCADE, related_name="audits"
     )
 
-    audit_id = models.CharField(max_length=20)  # ❗ remove unique=True
+    # Human-readable ID per tenant (AUD-0001...), assigned on save, see api.sequences
+    audit_id = models.CharField(max_length=20, editable=False)
     audit_name = models.CharField(max_length=200)
     objective = models.TextField()
     scope = models.TextField()
@@ -233,14 +341,26 @@ class Audit(models.Model):
         indexes = [
             models.Index(fields=["organization", "standard"]),
             models.Index(fields=["organization", "status"]),
+            # keyset pagination: (sort key, id)
+            models.Index(fields=["organization", "standard", "date", "id"]),
         ]
 
+    def save(self, *args, **kwargs):
+        # AUD-0001... per tenant (across standards), see api.sequences
+        assign_ids([self], "audit")
+        super().save(*args, **kwargs)
+
 # =========================================================
 # Audit Findings
 # =========================================================
 class Finding(models.Model):
     audit = models.ForeignKey(Audit, on_delete=models.CASCADE, related_name="findings")
-    finding_id = models.CharField(max_length=20, unique=True)
+    # Always the audit's organization (set in save); scopes finding_id
+    organization = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="findings", editable=False
+    )
+    # Human-readable ID per tenant (FND-0001...), assigned on save, see api.sequences
+    finding_id = models.CharField(max_length=20, editable=False)
     description = models.TextField()
 
     clause = models.ForeignKey(
@@ -270,10 +390,83 @@ class Finding(models.Model):
     target_date = models.DateField()
     completion_date = models.DateField(blank=True, null=True)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        unique_together = ("organization", "finding_id")
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.organization_id = self.audit.organization_id
+        # FND-0001... per tenant, see api.sequences
+        assign_ids([self], "finding")
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.finding_id} – {self.status}"
 
 
+# =========================================================
+# Evidence Items (many files per record)  Tenant scoped
+# =========================================================
+class EvidenceItem(models.Model):
+    """
+    One evidence file attached to exactly one record. `file` points at a
+    shared EvidenceBlob (api.evidence); deleting the item releases it.
+    """
+    organization = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="evidence_items"
+    )
+
+    compliance_clause = models.ForeignKey(
+        ComplianceClause, on_delete=models.CASCADE, null=True, blank=True,
+        related_name="evidence_items",
+    )
+    iso27001_clause = models.ForeignKey(
+        "api.ISO27001ClauseRecord", on_delete=models.CASCADE, null=True, blank=True,
+        related_name="evidence_items",
+    )
+    soa_entry = models.ForeignKey(
+        "api.SoAEntry", on_delete=models.CASCADE, null=True, blank=True,
+        related_name="evidence_items",
+    )
+    finding = models.ForeignKey(
+        Finding, on_delete=models.CASCADE, null=True, blank=True,
+        related_name="evidence_items",
+    )
+
+    file = models.FileField(upload_to="evidence/items/", max_length=255)
+    name = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(compliance_clause__isnull=False, iso27001_clause__isnull=True,
+                             soa_entry__isnull=True, finding__isnull=True)
+                    | models.Q(compliance_clause__isnull=True, iso27001_clause__isnull=False,
+                               soa_entry__isnull=True, finding__isnull=True)
+                    | models.Q(compliance_clause__isnull=True, iso27001_clause__isnull=True,
+                               soa_entry__isnull=False, finding__isnull=True)
+                    | models.Q(compliance_clause__isnull=True, iso27001_clause__isnull=True,
+                               soa_entry__isnull=True, finding__isnull=False)
+                ),
+                name="evidence_item_single_record",
+            )
+        ]
+        indexes = [models.Index(fields=["organization", "created_at"])]
+
+    def __str__(self):
+        return f"{self.name} ({self.size} bytes)"
+
+
 # =========================================================
 # Platform Updates (for home page feed)
 # =========================================================
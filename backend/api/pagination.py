@@ -0,0 +1,208 @@
+# backend/api/pagination.py
+
+"""
+Keyset (cursor) pagination for tenant list endpoints.
+
+Pages are taken with WHERE (sort key, id) > (last row's values) over the
+view's own ordering, so each page is one indexed range scan no matter how
+deep the client pages. The comparison is spelled out as an OR chain (for
+NULL handling and mixed directions) behind a plain range bound on the
+first sort key, which is what the index scan is driven by. The cursor is an opaque token holding the last row's
+ordering values.
+
+Opt-in for backwards compatibility: a request is only paginated when it
+sends ?cursor= (empty for the first page) or ?page_size=. Without either,
+views return the full list exactly as before.
+"""
+
+import base64
+import binascii
+import json
+from decimal import Decimal
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _resolve(obj, path):
+    for attr in path.split("__"):
+        obj = getattr(obj, attr) if obj is not None else None
+    return obj
+
+
+def _nullable(model, path):
+    """Whether the field at `path` can be NULL (unknown paths: assume so)."""
+    try:
+        *relations, last = path.split("__")
+        for name in relations:
+            model = model._meta.get_field(name).related_model
+        if last == "pk":
+            return False
+        field = model._meta.get_field(last)
+    except (AttributeError, LookupError):
+        return True
+    return field.null or bool(relations)
+
+
+def _cursor_value(value):
+    # Full precision: a truncated timestamp would skip/repeat rows
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_default_page_size(self):
+        return getattr(settings, "API_PAGE_SIZE", 50)
+
+    # -----------------------------------------------------------------
+    # Opt-in + page size
+    # -----------------------------------------------------------------
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.get_default_page_size()
+        return max(1, min(size, self.max_page_size))
+
+    # -----------------------------------------------------------------
+    # Ordering: the queryset's own ordering + pk as the unique tiebreaker
+    # -----------------------------------------------------------------
+    def get_ordering(self, queryset):
+        ordering = [
+            f
+            for f in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(f, str) and f != "?"
+        ]
+
+        if not any(f.lstrip("-") in ("pk", "id") for f in ordering):
+            descending = bool(ordering) and ordering[0].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+        return ordering
+
+    def _order_expressions(self, ordering):
+        # Explicit NULL placement so the keyset filter below matches the
+        # ORDER BY on every backend (NULLs sort as the "largest" value).
+        exprs = []
+        for field in ordering:
+            if field.startswith("-"):
+                exprs.append(F(field[1:]).desc(nulls_first=True))
+            else:
+                exprs.append(F(field).asc(nulls_last=True))
+        return exprs
+
+    def _leading_bound(self, model, field, value):
+        """
+        Redundant range on the first sort key (rows after the cursor can
+        only be >= / <= its value), ANDed in front of the OR chain so the
+        planner gets an index range condition for the scan.
+        """
+        name = field.lstrip("-")
+        nullable = _nullable(model, name)
+        if field.startswith("-"):
+            # DESC NULLS FIRST: a NULL cursor value bounds nothing
+            return Q() if value is None else Q(**{f"{name}__lte": value})
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+        bound = Q(**{f"{name}__gte": value})
+        return (bound | Q(**{f"{name}__isnull": True})) if nullable else bound
+
+    def _after(self, ordering, values, model):
+        """Q for rows strictly after `values` in `ordering`."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            if field.startswith("-"):
+                step = (
+                    Q(**{f"{name}__isnull": False})
+                    if value is None
+                    else Q(**{f"{name}__lt": value})
+                )
+            else:
+                step = Q(pk__in=[]) if value is None else (
+                    Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+                )
+            condition |= equal & step
+            equal &= Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+        return self._leading_bound(model, ordering[0], values[0]) & condition
+
+    # -----------------------------------------------------------------
+    # Opaque cursor
+    # -----------------------------------------------------------------
+    def encode_cursor(self, values):
+        raw = json.dumps([_cursor_value(v) for v in values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, token, ordering):
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, ValueError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    # -----------------------------------------------------------------
+    # BasePagination API
+    # -----------------------------------------------------------------
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self._order_expressions(ordering))
+
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            values = self.decode_cursor(token, ordering)
+            queryset = queryset.filter(self._after(ordering, values, queryset.model))
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+
+        self.next_cursor = None
+        if len(rows) > page_size:
+            last = page[-1]
+            self.next_cursor = self.encode_cursor(
+                [_resolve(last, f.lstrip("-")) for f in ordering]
+            )
+        return page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
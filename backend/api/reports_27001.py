@@ -2,8 +2,6 @@ import csv
 from datetime import datetime
 
 from django.http import HttpResponse
-from django.db.models import IntegerField
-from django.db.models.functions import Cast, Substr
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 
@@ -15,18 +13,17 @@ from .models import ComplianceClause
 # ------------------------------------------------
 # Canonical ordering helpers
 # ------------------------------------------------
+# Ordering uses the persisted numeric sort keys (indexed, 10.x after 9.x)
 def order_clauses(qs):
-    return qs.annotate(
-        major=Cast(Substr("clause_number", 1, 1), IntegerField()),
-        minor=Cast(Substr("clause_number", 3, 1), IntegerField()),
-    ).order_by("major", "minor")
+    return qs.order_by("clause_major", "clause_minor", "clause_number")
 
 
 def order_controls(qs):
-    return qs.annotate(
-        chapter=Cast(Substr("control__code", 3, 1), IntegerField()),
-        section=Cast(Substr("control__code", 5, 2), IntegerField()),
-    ).order_by("chapter", "section")
+    return qs.order_by("control__sort_major", "control__sort_minor", "control__code")
+
+
+def order_clause_records(qs):
+    return qs.order_by("clause__sort_major", "clause__sort_minor", "clause__code")
 
 
 def _get_tenant(request):
@@ -47,17 +44,7 @@ def _has_field(model_cls, field_name: str) -> bool:
 @permission_classes([IsAuthenticated])
 def iso27001_compliance_csv(request):
     from .isms_models import ISO27001ClauseRecord
-    
-    def parse_clause_code(code: str):
-        """Sort helper for codes like 4.1, 10.2"""
-        try:
-            parts = code.split(".")
-            major = int(parts[0])
-            minor = int(parts[1]) if len(parts) > 1 else 0
-            return (major, minor)
-        except Exception:
-            return (999, 999)
-    
+
     tenant = _get_tenant(request)
     if not tenant:
         return HttpResponse("Tenant missing", status=400)
@@ -79,10 +66,9 @@ def iso27001_compliance_csv(request):
     ])
 
     # Query ISO27001ClauseRecord (tenant-scoped)
-    records = ISO27001ClauseRecord.objects.filter(organization=tenant).select_related("clause")
-    
-    # Sort in Python using proper clause code parsing
-    records = sorted(records, key=lambda r: parse_clause_code(r.clause.code))
+    records = order_clause_records(
+        ISO27001ClauseRecord.objects.filter(organization=tenant).select_related("clause")
+    )
 
     for record in records:
         clause = record.clause
@@ -0,0 +1,186 @@
+# backend/api/search.py
+
+"""
+Tenant-wide full-text search (PostgreSQL tsvector).
+
+Each searchable model stores a weighted `search_vector` (GIN indexed).
+It is rebuilt by a post_save receiver with one UPDATE ... SET
+search_vector = to_tsvector(...) computed in the database; bulk writes that
+skip save() call refresh_search_vectors() instead.
+
+Evidence file text is indexed separately: records carry an
+`evidence_vector` filled from their evidence blob (api.evidence); those
+entity types name that column as "vector" and have no "document".
+
+search_tenant() runs ONE ranked query per entity type (tenant-scoped,
+capped at the global limit) and merges them by rank.
+"""
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F
+from django.db.models.signals import post_save
+
+from .models import ComplianceClause, Finding, Risk
+from .isms_models import Asset, ISO27001ClauseRecord, ISORisk, SoAEntry
+from .tprm_models import ThirdParty, TPRMRisk
+
+
+SEARCH_CONFIG = "english"
+SEARCH_RESULT_LIMIT = 20
+SEARCH_RESULT_MAX = 100
+
+# type → model, tenant lookup, extra filters, weighted document fields (or
+# the vector column, default search_vector), and the (title, subtitle)
+# columns returned per hit
+SEARCH_ENTITIES = {
+    "iso_risk": {
+        "model": ISORisk,
+        "tenant": "organization",
+        "document": [("title", "A"), ("description", "B"), ("owner", "C"),
+                     ("acceptance_justification", "C")],
+        "display": ("title", "level"),
+    },
+    "risk": {
+        "model": Risk,
+        "tenant": "organization",
+        "filters": {"archived": False},
+        "document": [("risk_id", "A"), ("description", "A"), ("existing_control", "B"),
+                     ("treatment_action", "B"), ("owner", "C")],
+        "display": ("risk_id", "description"),
+    },
+    "asset": {
+        "model": Asset,
+        "tenant": "organization",
+        "document": [("name", "A"), ("asset_id", "A"), ("asset_type", "B"),
+                     ("location", "C"), ("legal_owner", "C"), ("technical_owner", "C"),
+                     ("notes", "C")],
+        "display": ("name", "asset_id"),
+    },
+    "finding": {
+        "model": Finding,
+        "tenant": "audit__organization",
+        "document": [("finding_id", "A"), ("description", "A"), ("corrective_action", "B")],
+        "display": ("finding_id", "description"),
+    },
+    "third_party": {
+        "model": ThirdParty,
+        "tenant": "organization",
+        "document": [("name", "A"), ("category", "B"), ("description", "B"),
+                     ("scope_of_dependency", "C")],
+        "display": ("name", "category"),
+    },
+    "tprm_risk": {
+        "model": TPRMRisk,
+        "tenant": "third_party__organization",
+        "document": [("title", "A"), ("description", "B")],
+        "display": ("title", "third_party__name"),
+    },
+    "compliance_clause": {
+        "model": ComplianceClause,
+        "tenant": "organization",
+        "document": [("clause_number", "A"), ("short_description", "A"),
+                     ("description", "B"), ("comments", "C"), ("owner", "C")],
+        "display": ("clause_number", "short_description"),
+    },
+    "soa_entry": {
+        "model": SoAEntry,
+        "tenant": "organization",
+        "document": [("justification", "B"), ("evidence_notes", "B")],
+        "display": ("control__code", "control__title"),
+    },
+    "compliance_evidence": {
+        "model": ComplianceClause,
+        "tenant": "organization",
+        "vector": "evidence_vector",
+        "display": ("clause_number", "short_description"),
+    },
+    "iso27001_evidence": {
+        "model": ISO27001ClauseRecord,
+        "tenant": "organization",
+        "vector": "evidence_vector",
+        "display": ("clause__code", "clause__title"),
+    },
+}
+
+
+def search_document(spec) -> SearchVector:
+    vector = None
+    for field, weight in spec["document"]:
+        part = SearchVector(field, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+# ---------------------------------------------------------------------
+# Maintenance
+# ---------------------------------------------------------------------
+def refresh_search_vectors(queryset) -> int:
+    """Recompute search_vector for every row of `queryset` in one UPDATE."""
+    for spec in SEARCH_ENTITIES.values():
+        if spec["model"] is queryset.model and "document" in spec:
+            return queryset.update(search_vector=search_document(spec))
+    raise ValueError(f"{queryset.model.__name__} is not searchable")
+
+
+def _make_receiver(spec):
+    document_fields = {field for field, _ in spec["document"]}
+
+    def on_saved(sender, instance, update_fields=None, raw=False, **kwargs):
+        if raw:
+            return
+        # Partial saves that don't touch the document (status, counters...)
+        if update_fields is not None and not document_fields & set(update_fields):
+            return
+        refresh_search_vectors(sender.objects.filter(pk=instance.pk))
+
+    return on_saved
+
+
+_receivers = {}
+for _name, _spec in SEARCH_ENTITIES.items():
+    if "document" not in _spec:
+        continue
+    _receivers[_name] = _make_receiver(_spec)
+    post_save.connect(
+        _receivers[_name], sender=_spec["model"], dispatch_uid=f"search-vector-{_name}"
+    )
+
+
+# ---------------------------------------------------------------------
+# Query
+# ---------------------------------------------------------------------
+def search_tenant(tenant, text: str, types=None, limit: int = SEARCH_RESULT_LIMIT):
+    """
+    Ranked hits across entity types for ONE tenant:
+    [{"type", "id", "title", "subtitle", "rank"}, ...] best first.
+    """
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+    hits = []
+    for name, spec in SEARCH_ENTITIES.items():
+        if types and name not in types:
+            continue
+
+        title, subtitle = spec["display"]
+        vector = spec.get("vector", "search_vector")
+        rows = (
+            spec["model"].objects.filter(
+                **{spec["tenant"]: tenant}, **spec.get("filters", {}), **{vector: query}
+            )
+            .annotate(rank=SearchRank(F(vector), query))
+            .order_by("-rank")
+            .values_list("pk", title, subtitle, "rank")[:limit]
+        )
+        hits.extend(
+            {
+                "type": name,
+                "id": pk,
+                "title": row_title,
+                "subtitle": row_subtitle,
+                "rank": round(rank, 4),
+            }
+            for pk, row_title, row_subtitle, rank in rows
+        )
+
+    hits.sort(key=lambda hit: hit["rank"], reverse=True)
+    return hits[:limit]
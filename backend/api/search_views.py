@@ -0,0 +1,45 @@
+# backend/api/search_views.py
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .search import SEARCH_ENTITIES, SEARCH_RESULT_LIMIT, SEARCH_RESULT_MAX, search_tenant
+
+
+class GlobalSearchView(APIView):
+    """
+    GET /api/search/?q=backups[&types=iso_risk,asset][&limit=20]
+    Ranked, tenant-scoped hits across the registers.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return Response(
+                {"detail": "Tenant not resolved. Use your organization subdomain."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        text = (request.query_params.get("q") or "").strip()
+        if len(text) < 2:
+            return Response(
+                {"detail": "Query parameter 'q' must be at least 2 characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        types = {t.strip() for t in request.query_params.get("types", "").split(",") if t.strip()}
+        unknown = types - set(SEARCH_ENTITIES)
+        if unknown:
+            return Response(
+                {"detail": f"Unknown type(s): {', '.join(sorted(unknown))}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", SEARCH_RESULT_LIMIT))
+        except ValueError:
+            limit = SEARCH_RESULT_LIMIT
+        limit = max(1, min(limit, SEARCH_RESULT_MAX))
+
+        return Response({"query": text, "results": search_tenant(tenant, text, types, limit)})
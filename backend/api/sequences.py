@@ -0,0 +1,132 @@
+# backend/api/sequences.py
+
+"""
+Per-tenant human-readable IDs: AST-0001, RSK-0001, AUD-0001, FND-0001, TP-0001.
+
+Each (tenant, counter) is one TenantSequence row. Numbers are reserved in
+blocks with a single UPDATE ... RETURNING (an upsert the first time a
+counter is used), so a bulk create of N rows takes the row lock once.
+
+Hi/lo: outside a transaction, a single save() reserves SEQUENCE_BLOCK_SIZE
+numbers and keeps the rest of the block in this process, so most creates
+never touch the counter row. IDs stay unique per tenant but may skip
+numbers (a block's unused tail is lost on restart) and, across worker
+processes, are not strictly in creation order.
+
+Inside a transaction exactly the needed numbers are reserved and nothing
+is cached: the reservation rolls back with the transaction, so handing
+out its leftovers later could duplicate an ID.
+
+A counter's first reservation starts after the highest matching ID
+already stored (e.g. client-supplied "RSK-0042" before this existed).
+"""
+
+import threading
+
+from django.apps import apps
+from django.db import connection
+
+
+SEQUENCE_BLOCK_SIZE = 20
+
+# counter → (prefix, model, ID field, tenant path from the model)
+SEQUENCES = {
+    "asset": ("AST", "api.Asset", "asset_id", "organization"),
+    "risk": ("RSK", "api.Risk", "risk_id", "organization"),
+    "audit": ("AUD", "api.Audit", "audit_id", "organization"),
+    "finding": ("FND", "api.Finding", "finding_id", "organization"),
+    "third_party": ("TP", "api.ThirdParty", "reference", "organization"),
+}
+
+# (tenant_id, counter) → [next, end) left over from this process's last block
+_blocks = {}
+_blocks_lock = threading.Lock()
+
+
+def clear_sequence_blocks():
+    with _blocks_lock:
+        _blocks.clear()
+
+
+def format_id(counter: str, number: int) -> str:
+    return f"{SEQUENCES[counter][0]}-{str(number).zfill(4)}"
+
+
+def _tenant_id(obj, path: str):
+    *relations, last = path.split("__")
+    for name in relations:
+        obj = getattr(obj, name)
+    return getattr(obj, f"{last}_id")
+
+
+def _highest_existing(tenant_id, counter: str) -> int:
+    prefix, label, field, tenant = SEQUENCES[counter]
+    values = (
+        apps.get_model(label)._default_manager
+        .filter(**{f"{tenant}_id": tenant_id, f"{field}__regex": rf"^{prefix}-[0-9]+$"})
+        .values_list(field, flat=True)
+    )
+    return max((int(v.split("-", 1)[1]) for v in values), default=0)
+
+
+def _reserve(tenant_id, counter: str, count: int) -> int:
+    """Reserve `count` numbers; returns the first."""
+    table = apps.get_model("api", "TenantSequence")._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET next_value = next_value + %s "
+            "WHERE organization_id = %s AND name = %s RETURNING next_value",
+            [count, tenant_id, counter],
+        )
+        row = cursor.fetchone()
+        if row is None:
+            start = _highest_existing(tenant_id, counter) + 1
+            cursor.execute(
+                f"INSERT INTO {table} (organization_id, name, next_value) VALUES (%s, %s, %s) "
+                f"ON CONFLICT (organization_id, name) DO UPDATE "
+                f"SET next_value = {table}.next_value + %s RETURNING next_value",
+                [tenant_id, counter, start + count, count],
+            )
+            row = cursor.fetchone()
+    return row[0] - count
+
+
+def reserve_numbers(tenant_id, counter: str, count: int) -> range:
+    if count <= 0:
+        return range(0)
+
+    key = (tenant_id, counter)
+    with _blocks_lock:
+        block = _blocks.get(key)
+        if block and block[1] - block[0] >= count:
+            first = block[0]
+            block[0] += count
+            return range(first, first + count)
+
+    if connection.in_atomic_block:
+        first = _reserve(tenant_id, counter, count)
+        return range(first, first + count)
+
+    size = max(count, SEQUENCE_BLOCK_SIZE)
+    first = _reserve(tenant_id, counter, size)
+    if size > count:
+        with _blocks_lock:
+            _blocks[key] = [first + count, first + size]
+    return range(first, first + count)
+
+
+def assign_ids(objs, counter: str):
+    """
+    Fill the ID field of every unsaved obj that has none, one reservation
+    per tenant. Called by save(); call it directly before bulk_create().
+    """
+    _, _, field, tenant = SEQUENCES[counter]
+    by_tenant = {}
+    for obj in objs:
+        if not getattr(obj, field):
+            by_tenant.setdefault(_tenant_id(obj, tenant), []).append(obj)
+
+    for tenant_id, group in by_tenant.items():
+        for obj, number in zip(group, reserve_numbers(tenant_id, counter, len(group))):
+            setattr(obj, field, format_id(counter, number))
+    return objs
@@ -0,0 +1,82 @@
+# backend/api/serializer_fields.py
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.relations import (
+    MANY_RELATION_KWARGS,
+    ManyRelatedField,
+    PrimaryKeyRelatedField,
+)
+
+
+class BulkManyRelatedField(ManyRelatedField):
+    """
+    many=True counterpart of BulkPrimaryKeyRelatedField: resolves the whole
+    id list with ONE `pk IN (...)` query and reports every missing id at once
+    (DRF's ManyRelatedField runs one get() per id and stops at the first).
+    """
+    default_error_messages = {
+        **ManyRelatedField.default_error_messages,
+        "incorrect_type": "Incorrect type. Expected pk values, received {data_type}.",
+        "does_not_exist": "Invalid pk(s) {pk_value} - object(s) do not exist.",
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        queryset = self.child_relation.get_queryset()
+        pk_field = queryset.model._meta.pk
+
+        pks = []
+        for item in data:
+            if isinstance(item, bool) or item is None:
+                self.fail("incorrect_type", data_type=type(item).__name__)
+            try:
+                pks.append(pk_field.to_python(item))
+            except DjangoValidationError:
+                self.fail("incorrect_type", data_type=type(item).__name__)
+
+        pks = list(dict.fromkeys(pks))  # de-duplicate, keep order
+        found = queryset.in_bulk(pks)
+
+        missing = [pk for pk in pks if pk not in found]
+        if missing:
+            self.fail("does_not_exist", pk_value=", ".join(str(pk) for pk in missing))
+
+        return [found[pk] for pk in pks]
+
+
+class BulkPrimaryKeyRelatedField(PrimaryKeyRelatedField):
+    """PrimaryKeyRelatedField whose many=True form validates in bulk."""
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+
+class EvidenceDownloadURLField(serializers.Field):
+    """
+    Tenant-authorized download URL for a record's `evidence` (None when
+    empty). `target` is the api.evidence.EVIDENCE_TARGETS name.
+    """
+
+    def __init__(self, target, **kwargs):
+        self.target = target
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, obj):
+        if not obj.evidence:
+            return None
+        url = reverse("evidence-download", kwargs={"target": self.target, "record_id": obj.pk})
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
@@ -0,0 +1,83 @@
+# backend/api/serializer_mixins.py
+
+"""
+Sparse fieldsets + opt-in expansion for read responses.
+
+    ?fields=id,title,status        only these fields
+    ?expand=asset,controls         include these nested relations
+    ?expand=findings.controls      dotted paths reach nested serializers
+
+Without either parameter a serializer returns its full (legacy) output.
+With either one, the nested relations listed in `expandable_fields` are
+dropped unless named in ?expand= (or ?fields=), so they are neither
+queried nor serialized. Views can skip the matching select/prefetch with
+is_expanded().
+"""
+
+SPARSE_PARAMS = ("fields", "expand")
+
+
+def _param_set(request, name):
+    raw = request.query_params.get(name, "") if request is not None else ""
+    return {part.strip() for part in raw.split(",") if part.strip()}
+
+
+def is_sparse_request(request) -> bool:
+    return (
+        request is not None
+        and request.method in ("GET", "HEAD")
+        and any(p in request.query_params for p in SPARSE_PARAMS)
+    )
+
+
+def is_expanded(request, path: str) -> bool:
+    """Will the relation at dotted `path` be serialized for this request?"""
+    if not is_sparse_request(request):
+        return True
+    wanted = _param_set(request, "expand") | _param_set(request, "fields")
+    return any(w == path or w.startswith(path + ".") for w in wanted)
+
+
+class SparseFieldsetMixin:
+    # Nested relations omitted from sparse responses unless expanded
+    expandable_fields = ()
+
+    def _sparse_path(self):
+        names = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                names.append(node.field_name)
+            node = node.parent
+        return ".".join(reversed(names))
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        request = self.context.get("request")
+        if not is_sparse_request(request):
+            return fields
+
+        path = self._sparse_path()
+        prefix = f"{path}." if path else ""
+
+        def scoped(values):
+            # "findings.controls" → "controls" at path "findings"
+            return {v[len(prefix):].split(".")[0] for v in values if v.startswith(prefix)}
+
+        requested = scoped(_param_set(request, "fields"))
+        expanded = scoped(_param_set(request, "expand"))
+
+        if requested:
+            keep = (requested | expanded) & set(fields)
+        else:
+            keep = {
+                name for name in fields
+                if name not in self.expandable_fields or name in expanded
+            }
+
+        for name in list(fields):
+            # write_only fields never appear in output; leave them for writes
+            if name not in keep and not fields[name].write_only:
+                fields.pop(name)
+        return fields
@@ -1,8 +1,15 @@
 # api/serializers.py
+import re
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from .evidence_items import item_target
 from .isms_models import Clause, Control
 from .isms_serializers import ClauseSerializer, ControlSerializer
+from .serializer_fields import BulkPrimaryKeyRelatedField, EvidenceDownloadURLField
+from .serializer_mixins import SparseFieldsetMixin
+from django.conf import settings
+from django.urls import reverse
 from django.db import transaction, IntegrityError
 from .models import (
     Risk,
@@ -11,6 +18,8 @@ from .models import (
     Finding,
     Organization,
     UserProfile,
+    EvidenceUpload,
+    EvidenceItem,
 )
 
 
@@ -100,11 +109,12 @@ class UserDetailSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------
 # RISK SERIALIZER
 # ---------------------------------------------------------
-class RiskSerializer(serializers.ModelSerializer):
+class RiskSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Risk
-        fields = "__all__"
-        read_only_fields = ("risk_score", "risk_level", "organization")
+        exclude = ("search_vector",)
+        # risk_id is assigned server-side (api.sequences)
+        read_only_fields = ("risk_id", "risk_score", "risk_level", "organization")
 
     def _level_from_score(self, score: float) -> str:
         if score <= 5:
@@ -132,7 +142,12 @@ class RiskSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class ComplianceClauseSerializer(serializers.ModelSerializer):
+class ComplianceClauseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    # No raw `evidence` storage URL: blobs are shared across tenants, so
+    # files are only reachable through the tenant-checked download view.
+    # Uploads go through the evidence actions (api.evidence.attach_evidence).
+    evidence_download_url = EvidenceDownloadURLField("compliance-clause")
+
     class Meta:
         model = ComplianceClause
         fields = (
@@ -142,12 +157,81 @@ class ComplianceClauseSerializer(serializers.ModelSerializer):
             "status",
             "owner",
             "comments",
-            "evidence",
+            "evidence_name",
+            "evidence_download_url",
             "last_updated",
         )
+        read_only_fields = ("evidence_name",)
+
+
+# ---------------------------------------------------------
+# CHUNKED EVIDENCE UPLOAD SESSION
+# ---------------------------------------------------------
+class EvidenceUploadSerializer(serializers.ModelSerializer):
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EvidenceUpload
+        fields = (
+            "id",
+            "target",
+            "record_id",
+            "filename",
+            "size",
+            "sha256",
+            "chunk_size",
+            "received",
+            "next_chunk",
+            "status",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = ("received", "next_chunk", "status", "created_at", "updated_at")
+
+    def get_chunk_size(self, obj):
+        return settings.EVIDENCE_CHUNK_SIZE
+
+    def validate_size(self, value):
+        if value <= 0 or value > settings.EVIDENCE_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"Size must be between 1 and {settings.EVIDENCE_UPLOAD_MAX_SIZE} bytes."
+            )
+        return value
+
+    def validate_sha256(self, value):
+        value = (value or "").strip().lower()
+        if value and not re.fullmatch(r"[0-9a-f]{64}", value):
+            raise serializers.ValidationError("Expected a hex SHA-256 digest.")
+        return value
+
+
+# ---------------------------------------------------------
+# EVIDENCE ITEM (multi-file evidence)
+# ---------------------------------------------------------
+class EvidenceItemSerializer(serializers.ModelSerializer):
+    target = serializers.SerializerMethodField()
+    record_id = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EvidenceItem
+        fields = ("id", "target", "record_id", "name", "size", "download_url", "created_at")
+
+    def get_target(self, obj):
+        return item_target(obj)[0]
+
+    def get_record_id(self, obj):
+        return item_target(obj)[1]
 
+    def get_download_url(self, obj):
+        url = reverse("evidence-item-download", kwargs={"pk": obj.pk})
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+
+class FindingSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = ("clause", "controls")
 
-class FindingSerializer(serializers.ModelSerializer):
     clause = ClauseSerializer(read_only=True)
     clause_id = serializers.PrimaryKeyRelatedField(
         source="clause",
@@ -157,7 +241,7 @@ class FindingSerializer(serializers.ModelSerializer):
         allow_null=True,
     )
     controls = ControlSerializer(many=True, read_only=True)
-    control_ids = serializers.PrimaryKeyRelatedField(
+    control_ids = BulkPrimaryKeyRelatedField(
         source="controls",
         queryset=Control.objects.all(),
         many=True,
@@ -166,11 +250,16 @@ class FindingSerializer(serializers.ModelSerializer):
     )    
     class Meta:
         model = Finding
-        fields = "__all__"
+        exclude = ("search_vector",)
+        read_only_fields = ("organization", "finding_id")  # finding_id: api.sequences
+
 
+class AuditSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = ("findings",)
 
-class AuditSerializer(serializers.ModelSerializer):
     findings = FindingSerializer(many=True, read_only=True)
+    findings_count = serializers.SerializerMethodField()
+    open_findings_count = serializers.SerializerMethodField()
 
     # ✅ Prevent frontend from being forced to send organization
     organization = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -178,7 +267,18 @@ class AuditSerializer(serializers.ModelSerializer):
     class Meta:
         model = Audit
         fields = "__all__"
-        read_only_fields = ("organization",)
+        read_only_fields = ("organization", "audit_id")  # audit_id: api.sequences
+
+    # --------------------------------------------------
+    # FINDING COUNTS (annotated by AuditViewSet)
+    # --------------------------------------------------
+    def get_findings_count(self, obj):
+        count = getattr(obj, "findings_total", None)
+        return count if count is not None else obj.findings.count()
+
+    def get_open_findings_count(self, obj):
+        count = getattr(obj, "findings_open", None)
+        return count if count is not None else obj.findings.filter(status="Open").count()
 
     # --------------------------------------------------
     # VALIDATION (STANDARD-AWARE, ISO-GOVERNED)
@@ -11,6 +11,7 @@ from .serializers import (
     UserDetailSerializer,
 )
 from .models import Organization, UserProfile
+from .pagination import KeysetPagination
 
 def get_tenant_or_400(request):
     """
@@ -100,6 +101,12 @@ class UserListView(APIView):
             .select_related("profile")
             .order_by("username")
         )
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        if page is not None:
+            return paginator.get_paginated_response(UserDetailSerializer(page, many=True).data)
+
         serializer = UserDetailSerializer(users, many=True)
         return Response(serializer.data)
 
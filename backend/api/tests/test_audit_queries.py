@@ -0,0 +1,223 @@
+# backend/api/tests/test_audit_queries.py
+
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Audit, Finding, Organization
+from api.isms_models import Clause, Control, ISORisk
+from api.serializers import FindingSerializer
+from api.tests.test_isms_queries import TenantAPITestCase
+
+
+class AuditListQueryTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.clause = Clause.objects.create(code="6.1", title="Planning", standard="iso-27001")
+        self.controls = [
+            Control.objects.create(code=f"A.5.{n}", title=f"Control {n}", standard="iso-27001")
+            for n in range(1, 4)
+        ]
+
+    def add_audits(self, audits, findings_per_audit):
+        start = Audit.objects.count()
+        created = Audit.objects.bulk_create(
+            Audit(
+                organization=self.org, audit_id=f"AUD-{start + n}", audit_name=f"Audit {n}",
+                objective="-", scope="ISMS", date=date(2026, 1, 1), lead_auditor="Lee",
+                standard="iso-27001",
+            )
+            for n in range(audits)
+        )
+        findings = Finding.objects.bulk_create(
+            Finding(
+                audit=audit, organization=self.org, finding_id=f"F-{audit.audit_id}-{n}",
+                description="Gap", clause=self.clause, severity="Low", target_date=date(2026, 2, 1),
+                status="Open" if n % 4 == 0 else "Closed",
+            )
+            for audit in created
+            for n in range(findings_per_audit)
+        )
+        Finding.controls.through.objects.bulk_create(
+            Finding.controls.through(finding_id=finding.id, control_id=control.id)
+            for finding in findings
+            for control in self.controls[: finding.id % 3 + 1]
+        )
+
+    def test_query_count_is_constant(self):
+        self.add_audits(2, 3)
+        small, _ = self.count_queries("/api/audits/", standard="iso-27001")
+
+        # Benchmark size: 200 audits × 20 findings
+        self.add_audits(198, 20)
+        large, res = self.count_queries("/api/audits/", standard="iso-27001")
+
+        # tenant lookup + annotated audits + findings/clauses + controls
+        self.assertEqual(small, 4)
+        self.assertEqual(large, 4)
+        self.assertEqual(len(res.data), 200)
+
+        audit = next(a for a in res.data if a["audit_id"] == "AUD-5")
+        self.assertEqual(audit["findings_count"], 20)
+        self.assertEqual(audit["open_findings_count"], 5)
+        self.assertEqual(audit["findings"][0]["clause"]["code"], "6.1")
+        self.assertTrue(audit["findings"][0]["controls"])
+
+    def test_counts_without_findings_payload(self):
+        self.add_audits(3, 4)
+
+        count, res = self.count_queries("/api/audits/", standard="iso-27001", expand="")
+
+        # tenant lookup + annotated audits: findings are not loaded at all
+        self.assertEqual(count, 2)
+        self.assertNotIn("findings", res.data[0])
+        self.assertEqual(res.data[0]["findings_count"], 4)
+        self.assertEqual(res.data[0]["open_findings_count"], 1)
+
+
+    def test_counts_are_annotated_for_reads_only(self):
+        self.add_audits(1, 4)
+        audit = Audit.objects.get()
+
+        _, res = self.count_queries(f"/api/audits/{audit.id}/")
+        self.assertEqual(res.data["findings_count"], 4)
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.patch(
+                f"/api/audits/{audit.id}/", {"scope": "Whole ISMS"}, format="json",
+                HTTP_HOST=self.host,
+            )
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data["findings_count"], 4)
+        self.assertFalse(any("GROUP BY" in q["sql"] for q in ctx.captured_queries))
+
+
+class FindingsAnalyticsTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        other = Organization.objects.create(slug="beta", name="Beta Org")
+        today = date.today()
+
+        def days(n):
+            return today + timedelta(days=n)
+
+        isms = self.audit(self.org, "iso-27001", days(-100))
+        self.finding(isms, "High", "Closed", days(-60), completion=days(-90))
+        self.finding(isms, "Medium", "Closed", days(-60), completion=days(-80))
+        self.finding(isms, "High", "Open", days(-45))
+        self.finding(isms, "Low", "Open", days(10))
+
+        quality = self.audit(self.org, "iso-7101", days(-20))
+        self.finding(quality, "High", "Open", days(-5))
+        self.finding(quality, "Low", "Closed", days(-5))  # closed without a date
+
+        self.finding(self.audit(other, "iso-27001", days(-100)), "High", "Open", days(-200))
+
+    def audit(self, org, standard, when):
+        return Audit.objects.create(
+            organization=org, audit_name="Audit", objective="-", scope="ISMS",
+            date=when, lead_auditor="Lee", standard=standard,
+        )
+
+    def finding(self, audit, severity, status, target, completion=None):
+        Finding.objects.create(
+            audit=audit, description="Gap", severity=severity, status=status,
+            target_date=target, completion_date=completion,
+        )
+
+    def test_analytics_are_one_grouped_query(self):
+        count, res = self.count_queries("/api/findings/analytics/")
+
+        # tenant lookup + one GROUP BY (audit, severity)
+        self.assertEqual(count, 2)
+        totals = res.data["totals"]
+        self.assertEqual(
+            {k: totals[k] for k in ("findings", "open", "closed", "overdue", "mean_days_to_close")},
+            {"findings": 6, "open": 3, "closed": 3, "overdue": 2, "mean_days_to_close": 15.0},
+        )
+        self.assertEqual(totals["aging"], {"0-30": 1, "31-60": 0, "61-90": 0, "90+": 2})
+        self.assertEqual(totals["overdue_by_age"], {"1-30": 1, "31-60": 1, "61-90": 0, "90+": 0})
+
+        high = res.data["by_severity"][0]
+        self.assertEqual(
+            (high["severity"], high["findings"], high["overdue"], high["mean_days_to_close"]),
+            ("High", 3, 2, 10.0),
+        )
+        self.assertEqual(
+            [(s["standard"], s["findings"]) for s in res.data["by_standard"]],
+            [("iso-27001", 4), ("iso-7101", 2)],
+        )
+        self.assertEqual([a["open"] for a in res.data["by_audit"]], [2, 1])
+
+    def test_standard_and_date_filters(self):
+        _, res = self.count_queries("/api/findings/analytics/", standard="iso-7101")
+        self.assertEqual(res.data["totals"]["findings"], 2)
+        self.assertIsNone(res.data["totals"]["mean_days_to_close"])
+
+        since = (date.today() - timedelta(days=50)).isoformat()
+        _, res = self.count_queries("/api/findings/analytics/", **{"from": since})
+        self.assertEqual(len(res.data["by_audit"]), 1)
+
+        self.count_queries("/api/findings/analytics/", expected_status=400, to="last week")
+        self.count_queries("/api/findings/analytics/", expected_status=400, **{"from": "2024-02-30"})
+
+
+class BulkPrimaryKeyValidationTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.controls = [
+            Control.objects.create(code=f"A.5.{n}", title=f"Control {n}", standard="iso-27001")
+            for n in range(1, 21)
+        ]
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.audit = Audit.objects.create(
+            organization=self.org, audit_id="AUD-1", audit_name="Annual", objective="-",
+            scope="ISMS", date=date(2026, 1, 1), lead_auditor="Lee", standard="iso-27001",
+        )
+
+    def validation_queries(self, control_ids):
+        serializer = FindingSerializer(data={
+            "audit": self.audit.id, "finding_id": "F-1", "description": "Gap",
+            "severity": "Low", "target_date": "2026-02-01", "control_ids": control_ids,
+        })
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.is_valid()
+        return len(ctx.captured_queries), serializer
+
+    def test_control_ids_resolve_in_one_query(self):
+        one, serializer = self.validation_queries([self.controls[0].id])
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        many, serializer = self.validation_queries([c.id for c in self.controls])
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(many, one)
+        self.assertEqual(serializer.validated_data["controls"], self.controls)
+
+    def test_every_missing_id_is_reported(self):
+        _, serializer = self.validation_queries([self.controls[0].id, 9998, 9999])
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("9998, 9999", str(serializer.errors["control_ids"][0]))
+
+    def test_risk_controls_are_written_by_id(self):
+        res = self.client.post(
+            "/api/isms/risks/",
+            {"title": "Phishing", "controls": [c.id for c in self.controls[:3]]},
+            format="json",
+            HTTP_HOST=self.host,
+        )
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual([c["code"] for c in res.data["controls"]], ["A.5.1", "A.5.2", "A.5.3"])
+
+        res = self.client.patch(
+            f"/api/isms/risks/{res.data['id']}/",
+            {"controls": [self.controls[0].id, 424242]},
+            format="json",
+            HTTP_HOST=self.host,
+        )
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("424242", str(res.data["controls"]))
+        self.assertEqual(ISORisk.objects.get().controls.count(), 3)
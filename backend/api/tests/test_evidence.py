@@ -0,0 +1,666 @@
+# backend/api/tests/test_evidence.py
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from datetime import date, timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api import evidence_uploads
+from api.evidence_downloads import serve_evidence
+from api.evidence_uploads import UploadError, append_chunk, complete_upload
+from api.evidence_text import ExtractorUnavailable
+from api.models import (
+    Audit,
+    ComplianceClause,
+    EvidenceBlob,
+    EvidenceItem,
+    EvidenceUpload,
+    Finding,
+    Organization,
+)
+from api.isms_models import Clause, Control, ISO27001ClauseRecord, SoAEntry
+from api.tests.test_isms_queries import TenantAPITestCase
+
+
+class EvidenceTestCase(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.upload_dir = tempfile.mkdtemp()
+        for path in (self.media_root, self.upload_dir):
+            self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        media = override_settings(
+            MEDIA_ROOT=self.media_root,
+            EVIDENCE_UPLOAD_DIR=self.upload_dir,
+            EVIDENCE_CHUNK_SIZE=4,
+        )
+        media.enable()
+        self.addCleanup(media.disable)
+
+        for n in (1, 2):
+            Clause.objects.create(code=f"4.{n}", title=f"Clause 4.{n}", standard="iso-27001")
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.records = list(ISO27001ClauseRecord.objects.filter(organization=self.org)
+                            .order_by("clause__sort_minor"))
+        self.clause = ComplianceClause.objects.create(
+            organization=self.org, standard="iso-7101", clause_number="4.1", description="Context"
+        )
+
+    def upload(self, path, content, name="policy.pdf"):
+        return self.client.post(
+            path,
+            {"evidence": SimpleUploadedFile(name, content)},
+            format="multipart",
+            HTTP_HOST=self.host,
+        )
+
+    def stored_files(self):
+        return sorted(
+            os.path.relpath(os.path.join(root, f), self.media_root)
+            for root, _, files in os.walk(self.media_root)
+            for f in files
+        )
+
+
+class EvidenceDedupTests(EvidenceTestCase):
+    def test_identical_uploads_share_one_blob(self):
+        for record in self.records:
+            res = self.upload(f"/api/27001/clauses/{record.id}/evidence/", b"%PDF same bytes")
+            self.assertEqual(res.status_code, 200, res.data)
+        res = self.upload(f"/api/compliance/{self.clause.id}/evidence/", b"%PDF same bytes",
+                          name="copy.pdf")
+        self.assertEqual(res.status_code, 200, res.data)
+
+        blob = EvidenceBlob.objects.get()
+        self.assertEqual(blob.ref_count, 3)
+        self.assertEqual(blob.size, len(b"%PDF same bytes"))
+        self.assertEqual(blob.file.name, f"evidence/blobs/{blob.sha256[:2]}/{blob.sha256}")
+        self.assertEqual(self.stored_files(), [blob.file.name])
+
+        names = {r.evidence.name for r in ISO27001ClauseRecord.objects.filter(organization=self.org)}
+        self.clause.refresh_from_db()
+        names.add(self.clause.evidence.name)
+        self.assertEqual(names, {blob.file.name})
+
+        # Each record keeps the name it was uploaded under
+        self.assertEqual(res.data["evidence_name"], "copy.pdf")
+        self.assertEqual(ISO27001ClauseRecord.objects.get(pk=self.records[0].pk).evidence_name,
+                         "policy.pdf")
+
+    def test_blob_removed_with_last_reference(self):
+        first, second = self.records
+        for record in self.records:
+            self.upload(f"/api/27001/clauses/{record.id}/evidence/", b"shared")
+        self.upload(f"/api/compliance/{self.clause.id}/evidence/", b"other")
+
+        # Replacing evidence releases the previous blob
+        with self.captureOnCommitCallbacks(execute=True):
+            self.upload(f"/api/27001/clauses/{first.id}/evidence/", b"other")
+        shared = EvidenceBlob.objects.get(size=len(b"shared"))
+        self.assertEqual(shared.ref_count, 1)
+
+        second.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(EvidenceBlob.objects.filter(pk=shared.pk).exists())
+        self.assertFalse(default_storage.exists(shared.file.name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.delete(f"/api/compliance/{self.clause.id}/evidence/",
+                                     HTTP_HOST=self.host)
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.data["status_downgraded"])
+        other = EvidenceBlob.objects.get()
+        self.assertEqual(other.ref_count, 1)
+        self.assertTrue(default_storage.exists(other.file.name))
+
+    def test_legacy_files_are_folded_into_blobs(self):
+        first, second = self.records
+        for record in self.records:
+            record.evidence.save("Ortho.docx", ContentFile(b"same docx"), save=True)
+        self.clause.evidence.save("Untitled_1.odt", ContentFile(b"odt"), save=True)
+        self.assertEqual(len(self.stored_files()), 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("dedupe_evidence", stdout=StringIO())
+
+        self.assertEqual(EvidenceBlob.objects.count(), 2)
+        self.assertEqual(len(self.stored_files()), 2)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.evidence.name, second.evidence.name)
+        self.assertEqual(EvidenceBlob.objects.get(file=first.evidence.name).ref_count, 2)
+
+    def test_legacy_file_shared_by_several_rows_moves_once(self):
+        first, second = self.records
+        first.evidence.save("Scope.pdf", ContentFile(b"scope"), save=True)
+        for row in (second, self.clause):
+            type(row).objects.filter(pk=row.pk).update(evidence=first.evidence.name)
+        legacy = first.evidence.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            out = StringIO()
+            call_command("dedupe_evidence", stdout=out)
+
+        self.assertIn("3 legacy evidence reference(s)", out.getvalue())
+        self.assertIn("0 missing", out.getvalue())
+        blob = EvidenceBlob.objects.get()
+        self.assertEqual(blob.ref_count, 3)
+        for row in (first, second, self.clause):
+            row.refresh_from_db()
+            self.assertEqual(row.evidence.name, blob.file.name)
+        self.assertFalse(default_storage.exists(legacy))
+        self.assertEqual(self.stored_files(), [blob.file.name])
+
+
+class ChunkedUploadTests(EvidenceTestCase):
+    content = b"0123456789"
+
+    def start(self, **data):
+        payload = {"target": "iso27001-clause", "record_id": self.records[0].id,
+                   "filename": "audit-pack.zip", "size": len(self.content), **data}
+        return self.client.post("/api/evidence/uploads/", payload, format="json",
+                                HTTP_HOST=self.host)
+
+    def put_chunk(self, upload_id, index, data, host=None):
+        return self.client.put(
+            f"/api/evidence/uploads/{upload_id}/chunks/{index}/", data,
+            content_type="application/octet-stream", HTTP_HOST=host or self.host,
+        )
+
+    def complete(self, upload_id, **data):
+        return self.client.post(f"/api/evidence/uploads/{upload_id}/complete/", data,
+                                format="json", HTTP_HOST=self.host)
+
+    def test_chunks_resume_and_attach(self):
+        res = self.start()
+        self.assertEqual(res.status_code, 201, res.data)
+        upload_id = res.data["id"]
+        self.assertEqual(res.data["chunk_size"], 4)
+
+        self.assertEqual(self.put_chunk(upload_id, 0, self.content[:4]).status_code, 200)
+        self.assertEqual(self.put_chunk(upload_id, 2, self.content[8:]).status_code, 409)
+
+        res = self.put_chunk(upload_id, 1, self.content[4:8])
+        self.assertEqual((res.data["received"], res.data["next_chunk"]), (8, 2))
+        # A retried chunk is acknowledged, not appended twice
+        res = self.put_chunk(upload_id, 1, self.content[4:8])
+        self.assertEqual(res.data["received"], 8)
+
+        self.assertEqual(self.complete(upload_id).status_code, 400)  # incomplete
+        self.put_chunk(upload_id, 2, self.content[8:])
+
+        res = self.client.get(f"/api/evidence/uploads/{upload_id}/", HTTP_HOST=self.host)
+        self.assertEqual((res.data["received"], res.data["next_chunk"]), (10, 3))
+
+        digest = hashlib.sha256(self.content).hexdigest()
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.complete(upload_id, sha256=digest)
+        self.assertEqual(res.status_code, 200, res.data)
+        # Only the tenant-checked download URL is exposed, never the blob path
+        self.assertNotIn("evidence", res.data)
+        self.assertTrue(res.data["evidence_download_url"].endswith(
+            f"/api/evidence/iso27001-clause/{self.records[0].id}/download/"))
+        self.assertEqual(res.data["evidence_name"], "audit-pack.zip")
+
+        blob = EvidenceBlob.objects.get()
+        self.assertEqual((blob.sha256, blob.ref_count), (digest, 1))
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+        # Completing again (lost response) is harmless
+        self.assertEqual(self.complete(upload_id, sha256=digest).status_code, 200)
+        self.assertEqual(EvidenceBlob.objects.get().ref_count, 1)
+
+    def test_checksum_mismatch_restarts_session(self):
+        upload_id = self.start(sha256=hashlib.sha256(b"something else").hexdigest()).data["id"]
+        for index in range(3):
+            self.put_chunk(upload_id, index, self.content[index * 4:index * 4 + 4])
+
+        res = self.complete(upload_id)
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("Checksum mismatch", res.data["detail"])
+
+        upload = EvidenceUpload.objects.get(pk=upload_id)
+        self.assertEqual((upload.received, upload.next_chunk, upload.status), (0, 0, "open"))
+        self.assertFalse(EvidenceBlob.objects.exists())
+        self.records[0].refresh_from_db()
+        self.assertFalse(self.records[0].evidence)
+
+    def test_no_row_lock_while_reading_chunks_or_hashing(self):
+        upload_id = self.start().data["id"]
+        upload = EvidenceUpload.objects.get(pk=upload_id)
+        locked_during_io = []
+
+        class Body(BytesIO):
+            def read(inner, size=-1):
+                locked_during_io.append(any("FOR UPDATE" in q["sql"] for q in ctx.captured_queries))
+                return super().read(size)
+
+        with CaptureQueriesContext(connection) as ctx:
+            for index in range(3):
+                data = self.content[index * 4:index * 4 + 4]
+                append_chunk(upload, index, Body(data), len(data))
+            sha = evidence_uploads.file_sha256
+
+            def hashing(path):
+                locked_during_io.append(any("FOR UPDATE" in q["sql"] for q in ctx.captured_queries))
+                return sha(path)
+
+            with mock.patch.object(evidence_uploads, "file_sha256", hashing):
+                complete_upload(upload, hashlib.sha256(self.content).hexdigest())
+
+        self.assertTrue(locked_during_io)
+        self.assertFalse(any(locked_during_io))
+        self.assertEqual(EvidenceUpload.objects.get(pk=upload_id).status, "complete")
+
+    def test_chunk_stored_by_a_concurrent_retry(self):
+        upload_id = self.start().data["id"]
+        upload = EvidenceUpload.objects.get(pk=upload_id)
+
+        class Racing(BytesIO):
+            def read(inner, size=-1):
+                # The other copy of chunk 0 commits while this one streams
+                EvidenceUpload.objects.filter(pk=upload_id).update(received=4, next_chunk=1)
+                return super().read(size)
+
+        result = append_chunk(upload, 0, Racing(self.content[:4]), 4)
+        self.assertEqual((result.received, result.next_chunk), (4, 1))
+
+        # A session that moved elsewhere (e.g. reset) is a conflict
+        class Resetting(BytesIO):
+            def read(inner, size=-1):
+                EvidenceUpload.objects.filter(pk=upload_id).update(received=0, next_chunk=0)
+                return super().read(size)
+
+        with self.assertRaises(UploadError) as caught:
+            append_chunk(result, 1, Resetting(self.content[4:8]), 4)
+        self.assertEqual(caught.exception.status, 409)
+
+    def test_sessions_are_tenant_scoped_and_cleaned_up(self):
+        Organization.objects.create(slug="beta", name="Beta Org")
+        upload_id = self.start().data["id"]
+        self.put_chunk(upload_id, 0, self.content[:4])
+
+        res = self.put_chunk(upload_id, 1, self.content[4:8], host="beta.localhost")
+        self.assertEqual(res.status_code, 404)
+        other_record = ISO27001ClauseRecord.objects.exclude(organization=self.org).first()
+        res = self.start(record_id=other_record.id)
+        self.assertEqual(res.status_code, 404)
+
+        EvidenceUpload.objects.update(updated_at=timezone.now() - timedelta(hours=30))
+        call_command("cleanup_evidence_uploads", "--hours", "24", stdout=StringIO())
+        self.assertFalse(EvidenceUpload.objects.exists())
+        self.assertEqual(os.listdir(self.upload_dir), [])
+
+
+class EvidenceDownloadTests(EvidenceTestCase):
+    content = b"%PDF-1.7 evidence body"
+
+    def setUp(self):
+        super().setUp()
+        self.record = self.records[0]
+        res = self.upload(f"/api/27001/clauses/{self.record.id}/evidence/", self.content)
+        self.url = res.data["evidence_download_url"]
+        self.etag = f'"{hashlib.sha256(self.content).hexdigest()}"'
+
+    def download(self, host=None, **headers):
+        res = self.client.get(self.url, HTTP_HOST=host or self.host,
+                              **{f"HTTP_{k.upper()}": v for k, v in headers.items()})
+        body = b"".join(res.streaming_content) if res.streaming else res.content
+        return res, body
+
+    def test_full_download_and_conditional_get(self):
+        self.assertTrue(self.url.endswith(f"/api/evidence/iso27001-clause/{self.record.id}/download/"))
+
+        res, body = self.download()
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(body, self.content)
+        self.assertEqual(res["ETag"], self.etag)
+        self.assertEqual(res["Accept-Ranges"], "bytes")
+        self.assertEqual(res["Content-Type"], "application/pdf")
+        self.assertIn("private", res["Cache-Control"])
+
+        res, body = self.download(if_none_match=self.etag)
+        self.assertEqual((res.status_code, body), (304, b""))
+
+    def test_byte_ranges(self):
+        res, body = self.download(range="bytes=2-5")
+        self.assertEqual(res.status_code, 206)
+        self.assertEqual(body, self.content[2:6])
+        self.assertEqual(res["Content-Range"], f"bytes 2-5/{len(self.content)}")
+        self.assertEqual(res["Content-Length"], "4")
+
+        res, body = self.download(range="bytes=-4")
+        self.assertEqual(body, self.content[-4:])
+
+        res, _ = self.download(range="bytes=999-")
+        self.assertEqual(res.status_code, 416)
+        self.assertEqual(res["Content-Range"], f"bytes */{len(self.content)}")
+
+        # Stale If-Range: the whole (changed) file instead of a fragment
+        res, body = self.download(range="bytes=2-5", if_range='"stale"')
+        self.assertEqual((res.status_code, body), (200, self.content))
+
+    def test_shared_blob_is_served_under_each_records_name(self):
+        second = self.records[1]
+        res = self.upload(f"/api/27001/clauses/{second.id}/evidence/", self.content, name="mine.pdf")
+        self.assertEqual(EvidenceBlob.objects.get().ref_count, 2)
+
+        res = self.client.get(res.data["evidence_download_url"], {"download": "1"},
+                              HTTP_HOST=self.host)
+        b"".join(res.streaming_content)
+        self.assertEqual(res["Content-Disposition"], 'attachment; filename="mine.pdf"')
+        self.assertEqual(res["Content-Type"], "application/pdf")
+
+        res, _ = self.download()
+        self.assertEqual(res["Content-Disposition"], 'inline; filename="policy.pdf"')
+
+    def test_served_under_the_given_filename(self):
+        self.record.refresh_from_db()
+        request = RequestFactory().get("/")
+
+        res = serve_evidence(request, self.record.evidence.name, as_attachment=True,
+                             filename="Q3 report.pdf")
+        res.file_to_stream.close()
+
+        self.assertEqual(res["Content-Disposition"], 'attachment; filename="Q3 report.pdf"')
+        self.assertEqual(res["Content-Type"], "application/pdf")
+
+    def test_tenant_scoped(self):
+        Organization.objects.create(slug="beta", name="Beta Org")
+        res, _ = self.download(host="beta.localhost")
+        self.assertEqual(res.status_code, 404)
+
+    def test_front_server_handoff(self):
+        with override_settings(EVIDENCE_SENDFILE_BACKEND="nginx"):
+            res, body = self.download()
+        self.assertEqual(body, b"")
+        self.record.refresh_from_db()
+        self.assertEqual(res["X-Accel-Redirect"], f"/protected-media/{self.record.evidence.name}")
+        self.assertEqual(res["ETag"], self.etag)
+
+        with override_settings(EVIDENCE_SENDFILE_BACKEND="apache"):
+            res, _ = self.download()
+        self.assertEqual(res["X-Sendfile"], os.path.join(self.media_root, self.record.evidence.name))
+
+
+def docx_bytes(*paragraphs):
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in paragraphs)
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        # Fixed timestamp: identical paragraphs must give identical bytes
+        archive.writestr(zipfile.ZipInfo("word/document.xml", (2024, 1, 1, 0, 0, 0)),
+                         f'<w:document xmlns:w="{w}"><w:body>{body}</w:body></w:document>')
+    return buf.getvalue()
+
+
+def odt_bytes(*paragraphs):
+    office = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+    text = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+    body = "".join(f"<text:p>{p}</text:p>" for p in paragraphs)
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr(zipfile.ZipInfo("mimetype", (2024, 1, 1, 0, 0, 0)),
+                         "application/vnd.oasis.opendocument.text")
+        archive.writestr(zipfile.ZipInfo("content.xml", (2024, 1, 1, 0, 0, 0)),
+                         f'<office:document-content xmlns:office="{office}" '
+                         f'xmlns:text="{text}"><office:body><office:text>'
+                         f"{body}</office:text></office:body>"
+                         "</office:document-content>")
+    return buf.getvalue()
+
+
+class EvidenceTextTests(EvidenceTestCase):
+    def search(self, text):
+        _, res = self.count_queries("/api/search/", q=text,
+                                    types="iso27001_evidence,compliance_evidence")
+        return [(hit["type"], hit["id"]) for hit in res.data["results"]]
+
+    def extract(self):
+        call_command("extract_evidence_text", "--workers", "1", "--batch-size", "2",
+                     stdout=StringIO())
+
+    def test_backlog_is_extracted_and_searchable(self):
+        first, second = self.records
+        docx = docx_bytes("Firewall rules are reviewed", "quarterly")
+        self.upload(f"/api/27001/clauses/{first.id}/evidence/", docx, name="fw.docx")
+        self.upload(f"/api/compliance/{self.clause.id}/evidence/",
+                    odt_bytes("Backup restore test passed"), name="restore.odt")
+        self.upload(f"/api/27001/clauses/{second.id}/evidence/", b"\x89PNG...", name="scan.png")
+
+        # Nothing is extracted inside the upload request
+        self.assertEqual(set(EvidenceBlob.objects.values_list("text_status", flat=True)), {"pending"})
+        self.assertEqual(self.search("firewall"), [])
+
+        self.extract()
+
+        statuses = dict(EvidenceBlob.objects.values_list("file", "text_status"))
+        self.assertEqual(sorted(statuses.values()), ["extracted", "extracted", "unsupported"])
+        self.assertIn("Firewall rules are reviewed\nquarterly",
+                      EvidenceBlob.objects.get(sha256=hashlib.sha256(docx).hexdigest()).text)
+
+        self.assertEqual(self.search("firewall"), [("iso27001_evidence", first.id)])
+        self.assertEqual(self.search("restore"), [("compliance_evidence", self.clause.id)])
+
+        # Same content attached elsewhere is searchable at once
+        self.upload(f"/api/27001/clauses/{second.id}/evidence/",
+                    docx_bytes("Firewall rules are reviewed", "quarterly"), name="copy.docx")
+        self.assertEqual(sorted(self.search("firewall")),
+                         [("iso27001_evidence", first.id), ("iso27001_evidence", second.id)])
+
+        # ...and removing evidence drops it from search
+        self.client.delete(f"/api/compliance/{self.clause.id}/evidence/", HTTP_HOST=self.host)
+        self.assertEqual(self.search("restore"), [])
+
+    def test_unavailable_extractor_leaves_blob_pending(self):
+        self.upload(f"/api/27001/clauses/{self.records[0].id}/evidence/", b"%PDF-1.7", name="a.pdf")
+
+        with mock.patch.dict(
+            "api.evidence_text.EXTRACTORS",
+            {".pdf": mock.Mock(side_effect=ExtractorUnavailable)},
+        ):
+            self.extract()
+
+        self.assertEqual(EvidenceBlob.objects.get().text_status, "pending")
+
+    def test_loop_sleeps_when_only_pending_blobs_remain(self):
+        self.upload(f"/api/27001/clauses/{self.records[0].id}/evidence/", b"%PDF-1.7", name="a.pdf")
+        self.upload(f"/api/27001/clauses/{self.records[1].id}/evidence/", b"notes", name="b.txt")
+
+        class Stop(Exception):
+            pass
+
+        with mock.patch.dict(
+            "api.evidence_text.EXTRACTORS",
+            {".pdf": mock.Mock(side_effect=ExtractorUnavailable)},
+        ), mock.patch(
+            "api.management.commands.extract_evidence_text.time.sleep", side_effect=[None, Stop]
+        ) as sleep, self.assertRaises(Stop):
+            call_command("extract_evidence_text", "--workers", "1", "--loop", "--interval", "7",
+                         stdout=StringIO())
+
+        # Pass 1 extracted b.txt: no sleep. Passes 2 and 3 only saw the
+        # pending PDF: sleep before polling again.
+        self.assertEqual(sleep.call_args_list, [mock.call(7), mock.call(7)])
+
+
+def zip_bytes(entries):
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buf.getvalue()
+
+
+class EvidenceItemTests(EvidenceTestCase):
+    def setUp(self):
+        super().setUp()
+        control = Control.objects.create(code="A.5.15", title="Access control", standard="iso-27001")
+        self.soa = SoAEntry.objects.get_or_create(organization=self.org, control=control,
+                                                  standard="iso-27001")[0]
+
+    def post_zip(self, entries, **data):
+        upload = SimpleUploadedFile("pack.zip", zip_bytes(entries), "application/zip")
+        return self.client.post("/api/evidence/items/zip/", {"file": upload, **data},
+                                format="multipart", HTTP_HOST=self.host)
+
+    def test_zip_folders_map_to_clauses_and_controls(self):
+        res = self.post_zip({
+            "audit-pack/4.1/context.pdf": b"context",
+            "audit-pack/a.5.15/access.docx": b"access policy",
+            "audit-pack/A.5.15/old/access-v1.docx": b"context",
+            "audit-pack/4.2/": b"",
+            "__MACOSX/audit-pack/._context.pdf": b"junk",
+        })
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["created"], 3)
+
+        record = self.records[0]
+        self.assertEqual([i.name for i in record.evidence_items.all()], ["context.pdf"])
+        self.assertEqual(sorted(i.name for i in self.soa.evidence_items.all()),
+                         ["access-v1.docx", "access.docx"])
+        # identical content across folders is stored once
+        self.assertEqual(EvidenceBlob.objects.count(), 2)
+        self.assertEqual(EvidenceBlob.objects.get(size=len(b"context")).ref_count, 2)
+
+        item = self.soa.evidence_items.get(name="access.docx")
+        res = self.client.get(f"/api/evidence/items/{item.id}/download/", HTTP_HOST=self.host)
+        self.assertEqual(b"".join(res.streaming_content), b"access policy")
+
+        # Shares its blob with context.pdf, but downloads under its own name
+        item = self.soa.evidence_items.get(name="access-v1.docx")
+        res = self.client.get(f"/api/evidence/items/{item.id}/download/", {"download": "1"},
+                              HTTP_HOST=self.host)
+        self.assertEqual(b"".join(res.streaming_content), b"context")
+        self.assertEqual(res["Content-Disposition"], 'attachment; filename="access-v1.docx"')
+
+    def test_unmatched_folders_fail_the_whole_import(self):
+        res = self.post_zip({"4.1/context.pdf": b"context", "9.9/nope.pdf": b"x",
+                             "loose.pdf": b"y"})
+
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(sorted(res.data["unmatched"]), ["9.9/nope.pdf", "loose.pdf"])
+        self.assertFalse(EvidenceItem.objects.exists())
+        self.assertFalse(EvidenceBlob.objects.exists())
+
+        res = self.client.post("/api/evidence/items/zip/",
+                               {"file": SimpleUploadedFile("x.zip", b"not a zip")},
+                               format="multipart", HTTP_HOST=self.host)
+        self.assertEqual(res.status_code, 400)
+
+    def test_long_member_names_are_truncated(self):
+        name = "r" * 300 + ".pdf"
+        res = self.post_zip({f"4.1/{name}": b"report"})
+        self.assertEqual(res.status_code, 201, res.data)
+        item = EvidenceItem.objects.get()
+        self.assertEqual(item.name, name[:255])
+        with default_storage.open(item.file.name) as fh:
+            self.assertEqual(fh.read(), b"report")
+
+    def test_other_standards_map_to_compliance_clauses(self):
+        res = self.post_zip({"4.1/minutes.odt": b"minutes"}, standard="iso-7101")
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["items"][0]["target"], "compliance-clause")
+        self.assertEqual(res.data["items"][0]["record_id"], self.clause.id)
+
+    def test_many_files_per_finding(self):
+        audit = Audit.objects.create(organization=self.org, audit_id="AUD-1", audit_name="Annual",
+                                     objective="-", scope="ISMS", date=date(2026, 1, 1),
+                                     lead_auditor="Lee", standard="iso-27001")
+        finding = Finding.objects.create(audit=audit, finding_id="F-1", description="Gap",
+                                         severity="Low", target_date=date(2026, 2, 1))
+
+        res = self.client.post(
+            "/api/evidence/items/",
+            {"target": "finding", "record_id": finding.id,
+             "file": [SimpleUploadedFile("a.pdf", b"one"), SimpleUploadedFile("b.pdf", b"two")]},
+            format="multipart", HTTP_HOST=self.host,
+        )
+        self.assertEqual(res.status_code, 201, res.data)
+
+        res = self.client.get("/api/evidence/items/", {"target": "finding", "record_id": finding.id},
+                              HTTP_HOST=self.host)
+        self.assertEqual([i["name"] for i in res.data], ["a.pdf", "b.pdf"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.delete(f"/api/evidence/items/{res.data[0]['id']}/", HTTP_HOST=self.host)
+        self.assertEqual(res.status_code, 204)
+        self.assertEqual(list(EvidenceBlob.objects.values_list("size", flat=True)), [3])
+        self.assertEqual(len(self.stored_files()), 1)
+
+        Organization.objects.create(slug="beta", name="Beta Org")
+        res = self.client.get("/api/evidence/items/", {"target": "finding", "record_id": finding.id},
+                              HTTP_HOST="beta.localhost")
+        self.assertEqual(res.status_code, 404)
+
+
+class EvidenceGarbageCollectorTests(EvidenceTestCase):
+    def write(self, name, data=b"x" * 10, age_hours=48):
+        path = os.path.join(self.media_root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as fh:
+            fh.write(data)
+        stamp = time.time() - age_hours * 3600
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def gc(self, *args):
+        out = StringIO()
+        call_command("gc_evidence", *args, stdout=out)
+        return out.getvalue()
+
+    def test_unreferenced_old_files_are_reclaimed(self):
+        self.upload(f"/api/27001/clauses/{self.records[0].id}/evidence/", b"kept")
+        self.records[1].evidence.save("legacy.pdf", ContentFile(b"legacy"), save=True)
+        kept = set(self.stored_files())
+        for name in kept:
+            stamp = time.time() - 48 * 3600
+            os.utime(os.path.join(self.media_root, name), (stamp, stamp))
+
+        self.write("evidence/Untitled_1_2DaSkCM.odt")
+        self.write("evidence/iso27001/clauses/Ortho_KnWYoc2.docx", b"y" * 5)
+        self.write("evidence/blobs/ab/abcd/orphan.pdf", b"z" * 3)
+        self.write("evidence/fresh-upload.pdf", age_hours=1)
+        self.write("logos/not-evidence.png")
+
+        report = self.gc("--dry-run")
+        self.assertIn("3 orphan(s), 18 bytes would be reclaimed", report)
+        self.assertEqual(len(self.stored_files()), len(kept) + 5)
+
+        report = self.gc()
+        self.assertIn("3 orphan(s), 18 bytes deleted", report)
+        self.assertIn("1 unreferenced file(s) inside the 24h grace period", report)
+        self.assertEqual(
+            set(self.stored_files()),
+            kept | {"evidence/fresh-upload.pdf", "logos/not-evidence.png"},
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.media_root, "evidence/blobs/ab")))
+
+    def test_quarantine_moves_instead_of_deleting(self):
+        quarantine = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, quarantine, ignore_errors=True)
+        self.write("evidence/stale.pdf")
+
+        with override_settings(EVIDENCE_QUARANTINE_DIR=quarantine):
+            self.gc("--quarantine")
+
+        self.assertEqual(self.stored_files(), [])
+        moved = [os.path.relpath(os.path.join(root, f), quarantine)
+                 for root, _, files in os.walk(quarantine) for f in files]
+        self.assertEqual(len(moved), 1)
+        self.assertTrue(moved[0].endswith("evidence/stale.pdf"))
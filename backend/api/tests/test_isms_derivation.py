@@ -0,0 +1,171 @@
+# backend/api/tests/test_isms_derivation.py
+
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from api.models import Organization
+from api import isms_drift
+from api.isms_drift import detect_isms_drift
+from api.isms_library import bump_library_version, ensure_tenant_library_seeded
+from api.isms_models import Asset, Control, ISORisk, SoAEntry, TenantLibrarySeed
+
+
+class RecomputeIsmsCommandTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.control = Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+        self.entry = SoAEntry.objects.create(
+            organization=self.org, control=self.control, applicable=True, status="Full"
+        )
+        self.asset = Asset.objects.create(organization=self.org, name="CRM")
+        self.risk = ISORisk.objects.create(
+            organization=self.org, title="Data loss", treatment="Reduce",
+            asset=self.asset, likelihood=4, impact=4,
+        )
+        self.risk.controls.add(self.control)
+
+        # Simulate writes that bypassed the signals
+        ISORisk.objects.filter(pk=self.risk.pk).update(
+            risk_score=1, level="Low", control_coverage="Untreated", likelihood=5
+        )
+        SoAEntry.objects.filter(pk=self.entry.pk).update(applicable=False)
+        Asset.objects.filter(pk=self.asset.pk).update(is_secure=False)
+
+    def recompute(self, *args):
+        out = StringIO()
+        call_command("recompute_isms", "--workers", "1", *args, stdout=out)
+        return out.getvalue()
+
+    def test_dry_run_reports_without_writing(self):
+        out = self.recompute("--dry-run")
+
+        self.assertIn("alpha: risk_score=1, risk_level=1, soa_applicable=1", out)
+        self.risk.refresh_from_db()
+        self.assertEqual(self.risk.risk_score, 1)
+
+    def test_recompute_rebuilds_derived_fields(self):
+        self.recompute("--tenant", "alpha")
+
+        self.risk.refresh_from_db()
+        self.entry.refresh_from_db()
+        self.asset.refresh_from_db()
+        self.assertEqual((self.risk.risk_score, self.risk.level), (20, "Critical"))
+        self.assertTrue(self.entry.applicable)
+        self.assertEqual(self.risk.control_coverage, "Adequate")
+        self.assertTrue(self.asset.is_secure)
+
+        # Second run is a no-op
+        self.assertIn("risk_score=0, risk_level=0, soa_applicable=0, risk_coverage=0, asset_security=0",
+                      self.recompute())
+
+
+class IsmsDriftTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.c1 = Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+        self.c2 = Control.objects.create(code="A.5.2", title="Roles", standard="iso-27001")
+        self.entry = SoAEntry.objects.create(
+            organization=self.org, control=self.c1, applicable=True, status="Full"
+        )
+        self.asset = Asset.objects.create(organization=self.org, name="CRM")
+        self.risk = ISORisk.objects.create(
+            organization=self.org, title="Data loss", treatment="Reduce", asset=self.asset
+        )
+        self.risk.controls.add(self.c1)
+        TenantLibrarySeed.objects.create(organization=self.org, standard="iso-27001", library_version=1)
+
+    def test_consistent_state_reports_only_missing_soa_rows(self):
+        report = detect_isms_drift()
+
+        self.assertEqual(report["soa_missing"], {str(self.org.id): ["A.5.2"]})
+        for check in ("soa_applicable", "risk_score", "risk_coverage", "asset_security"):
+            self.assertEqual(report[check], {}, check)
+
+    def test_detects_and_repairs_cascading_drift(self):
+        # A bulk update that skipped the SoA → Risk → Asset cascade
+        SoAEntry.objects.filter(pk=self.entry.pk).update(applicable=False)
+        ISORisk.objects.filter(pk=self.risk.pk).update(control_coverage="Partial")
+
+        report = detect_isms_drift()
+        self.assertEqual(report["soa_applicable"], {str(self.org.id): [self.entry.pk]})
+        self.assertEqual(report["risk_coverage"], {str(self.org.id): [self.risk.pk]})
+        self.assertEqual(report["asset_security"], {})
+
+        # Report-only run writes nothing
+        self.entry.refresh_from_db()
+        self.assertFalse(self.entry.applicable)
+
+        out = StringIO()
+        call_command("check_isms_drift", "--repair", stdout=out)
+        self.assertIn("Repaired 3 drifted row(s)", out.getvalue())
+
+        self.entry.refresh_from_db()
+        self.risk.refresh_from_db()
+        self.assertTrue(self.entry.applicable)
+        self.assertEqual(self.risk.control_coverage, "Adequate")
+        self.assertTrue(SoAEntry.objects.filter(organization=self.org, control=self.c2).exists())
+
+        # Fixed cost regardless of data size: 7 queries + savepoint/rollback
+        with self.assertNumQueries(10):
+            self.assertFalse(any(detect_isms_drift().values()))
+
+    def test_risk_created_during_the_check_is_skipped(self):
+        ISORisk.objects.filter(pk=self.risk.pk).update(control_coverage="Partial")
+        real = isms_drift.compute_risk_coverage_map
+
+        def then_insert(risks):
+            expected = real(risks)
+            # A concurrent request adds a risk between the two queries
+            ISORisk.objects.create(organization=self.org, title="Late", treatment="Accept")
+            return expected
+
+        with mock.patch.object(isms_drift, "compute_risk_coverage_map", then_insert):
+            report = detect_isms_drift()
+
+        self.assertEqual(report["risk_coverage"], {str(self.org.id): [self.risk.pk]})
+
+    def test_soa_gaps_only_count_standards_the_tenant_was_seeded_for(self):
+        # Beta has no library seed at all; nobody is seeded for soc-2
+        beta = Organization.objects.create(slug="beta", name="Beta Org")
+        TenantLibrarySeed.objects.filter(organization=beta).delete()
+        SoAEntry.objects.filter(organization=beta).delete()
+        Control.objects.create(code="CC1.1", title="Integrity", standard="soc-2")
+
+        report = detect_isms_drift(repair=True)
+
+        self.assertEqual(report["soa_missing"], {str(self.org.id): ["A.5.2"]})
+        self.assertFalse(SoAEntry.objects.filter(organization=beta).exists())
+        self.assertFalse(SoAEntry.objects.filter(standard="soc-2").exists())
+        self.assertEqual(
+            SoAEntry.objects.get(organization=self.org, control=self.c2).status, "Not Implemented"
+        )
+
+
+class TenantLibrarySeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.control = Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+
+    def test_new_tenant_is_seeded_at_provisioning(self):
+        org = Organization.objects.create(slug="gamma", name="Gamma Org")
+
+        self.assertEqual(SoAEntry.objects.filter(organization=org).count(), 1)
+
+        # Read-path guard is a cache hit: zero queries
+        with self.assertNumQueries(0):
+            ensure_tenant_library_seeded(org, "iso-27001")
+
+    def test_library_version_bump_reseeds_lazily(self):
+        org = Organization.objects.create(slug="gamma", name="Gamma Org")
+        Control.objects.create(code="A.5.2", title="Roles", standard="iso-27001")
+
+        ensure_tenant_library_seeded(org, "iso-27001")
+        self.assertEqual(SoAEntry.objects.filter(organization=org).count(), 1)
+
+        bump_library_version("iso-27001")
+        ensure_tenant_library_seeded(org, "iso-27001")
+        self.assertEqual(SoAEntry.objects.filter(organization=org).count(), 2)
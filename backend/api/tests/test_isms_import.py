@@ -0,0 +1,252 @@
+# backend/api/tests/test_isms_import.py
+
+from io import BytesIO
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.models import Organization
+from api.isms_models import Asset, Control, ISORisk, SoAEntry
+from api.isms_signals import (
+    aggregate_risk_coverage_for_risk,
+    compute_risk_coverage_map,
+)
+
+
+def csv_upload(text, name="risks.csv"):
+    return SimpleUploadedFile(name, text.encode("utf-8"), content_type="text/csv")
+
+
+class RiskImportTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.other = Organization.objects.create(slug="beta", name="Beta Org")
+
+        self.c1 = Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+        self.c2 = Control.objects.create(code="A.8.13", title="Backup", standard="iso-27001")
+        for org in (self.org, self.other):
+            SoAEntry.objects.create(organization=org, control=self.c1, applicable=False, status="Full")
+            SoAEntry.objects.create(organization=org, control=self.c2, applicable=False, status="Full")
+
+        self.asset = Asset.objects.create(organization=self.org, name="File server")
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user("alice", password="x"))
+
+    def post(self, text, **data):
+        return self.client.post(
+            "/api/isms/risks/import/",
+            {"file": csv_upload(text), **data},
+            format="multipart",
+            HTTP_HOST="alpha.localhost",
+        )
+
+    def test_import_creates_risks_links_and_derives_state(self):
+        res = self.post(
+            "title,asset_id,likelihood,impact,treatment,controls\n"
+            f"Ransomware,{self.asset.asset_id},4,5,Reduce,\"A.5.1, A.8.13\"\n"
+            "Lost laptop,,2,2,,A.8.13\n"
+        )
+
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["created"], 2)
+
+        ransomware = ISORisk.objects.get(organization=self.org, title="Ransomware")
+        self.assertEqual(ransomware.asset, self.asset)
+        self.assertEqual(ransomware.risk_score, 20)
+        self.assertEqual(ransomware.level, "Critical")
+        self.assertEqual(set(ransomware.controls.values_list("code", flat=True)), {"A.5.1", "A.8.13"})
+
+        # Derivation pass: SoA applicable (this tenant only) → coverage → asset
+        self.assertFalse(
+            SoAEntry.objects.filter(organization=self.org, applicable=False).exists()
+        )
+        self.assertFalse(
+            SoAEntry.objects.filter(organization=self.other, applicable=True).exists()
+        )
+        self.assertEqual(ransomware.control_coverage, "Adequate")
+        self.asset.refresh_from_db()
+        self.assertTrue(self.asset.is_secure)
+
+    def test_invalid_rows_are_reported_and_nothing_is_written(self):
+        res = self.post(
+            "title,asset_id,likelihood,impact,treatment,controls\n"
+            "Good row,,3,3,Reduce,A.5.1\n"
+            ",AST-9999,9,3,Accept,A.9.99\n"
+        )
+
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(len(res.data["errors"]), 1)
+        error = res.data["errors"][0]
+        self.assertEqual(error["row"], 3)
+        self.assertEqual(
+            set(error["errors"]),
+            {"title", "asset_id", "likelihood", "controls", "owner", "acceptance_justification"},
+        )
+        self.assertFalse(ISORisk.objects.exists())
+
+    def test_scale_must_be_a_whole_number(self):
+        res = self.post(
+            "title,likelihood,impact\n"
+            "Fractional,3.7,2\n"
+            "Not a number,nan,inf\n"
+            "Numeric cell,4.0,2\n"
+        )
+
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(
+            [(e["row"], sorted(e["errors"])) for e in res.data["errors"]],
+            [(2, ["likelihood"]), (3, ["impact", "likelihood"])],
+        )
+        self.assertEqual(res.data["errors"][0]["errors"]["likelihood"],
+                         "Must be a whole number between 1 and 5.")
+
+    def test_unknown_standard_is_rejected(self):
+        for standard in ("iso-9999", "x" * 100):
+            res = self.post("title\nPhishing\n", standard=standard)
+            self.assertEqual(res.status_code, 400, standard)
+            self.assertIn("Unknown standard", res.data["detail"])
+        self.assertFalse(ISORisk.objects.exists())
+
+    def test_owner_length_and_status_are_row_errors(self):
+        res = self.post(
+            "title,owner,status\n"
+            f"Long owner,{'o' * 129},open\n"
+            "Odd status,CISO,Someday\n"
+            "Closed one,CISO,closed\n"
+        )
+
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(
+            [(e["row"], sorted(e["errors"])) for e in res.data["errors"]],
+            [(2, ["owner"]), (3, ["status"])],
+        )
+        self.assertEqual(res.data["errors"][1]["errors"]["status"], "Must be one of: Open, Closed.")
+
+        res = self.post("title,status\nClosed one,closed\n")
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(ISORisk.objects.get().status, "Closed")
+
+    def test_dry_run_validates_without_writing(self):
+        res = self.post("title,controls\nPhishing,A.5.1\n", dry_run="true")
+
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(res.data["rows"], 1)
+        self.assertEqual(res.data["created"], 0)
+        self.assertFalse(ISORisk.objects.exists())
+
+    def test_bulk_coverage_matches_per_row_coverage(self):
+        SoAEntry.objects.filter(organization=self.org, control=self.c2).update(
+            applicable=True, status="Partial"
+        )
+        SoAEntry.objects.filter(organization=self.org, control=self.c1).update(applicable=True)
+
+        cases = [
+            ("Reduce", [self.c1]),
+            ("Reduce", [self.c1, self.c2]),
+            ("Reduce", []),
+            ("Accept", [self.c1]),
+            ("", [self.c2]),
+        ]
+        risks = []
+        for treatment, controls in cases:
+            risk = ISORisk.objects.create(
+                organization=self.org, title=treatment or "blank", treatment=treatment
+            )
+            risk.controls.add(*controls)
+            risks.append(risk)
+
+        expected = {risk.id: aggregate_risk_coverage_for_risk(risk) for risk in risks}
+
+        self.assertEqual(
+            compute_risk_coverage_map(ISORisk.objects.filter(organization=self.org)),
+            expected,
+        )
+
+
+class AssetImportTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        Asset.objects.create(organization=self.org, name="Existing")
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user("alice", password="x"))
+
+    def post(self, upload, **data):
+        return self.client.post(
+            "/api/isms/assets/import/",
+            {"file": upload, **data},
+            format="multipart",
+            HTTP_HOST="alpha.localhost",
+        )
+
+    def test_import_assigns_ids_in_one_reservation(self):
+        rows = "".join(f"Laptop {n},Hardware,Internal,medium\n" for n in range(2500))
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.post(csv_upload(
+                "Name,Asset Type,Classification,Value\n"
+                "File server,Hardware,Confidential,High\n" + rows, name="assets.csv",
+            ))
+
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["created"], 2501)
+        self.assertIn("rows_per_second", res.data)
+        self.assertEqual(
+            len([q for q in ctx.captured_queries if "api_tenantsequence" in q["sql"]]), 1
+        )
+        # ASSET_IMPORT_BATCH_SIZE rows per INSERT
+        self.assertEqual(
+            len([q for q in ctx.captured_queries if q["sql"].startswith("INSERT INTO \"api_asset\"")]), 3
+        )
+
+        server = Asset.objects.get(organization=self.org, name="File server")
+        self.assertEqual(server.asset_id, "AST-0002")
+        self.assertEqual((server.classification, server.value), ("confidential", "high"))
+        self.assertEqual(Asset.objects.get(name="Laptop 2499").asset_id, "AST-2502")
+        self.assertFalse(Asset.objects.filter(search_vector__isnull=True, name__startswith="Laptop").exists())
+
+    def test_invalid_rows_are_reported_and_nothing_is_written(self):
+        res = self.post(csv_upload(
+            "name,classification,value,asset_type\n"
+            "Good,public,low,\n"
+            ",secret,priceless,\n"
+            "Router,internal,low," + "x" * 200 + "\n",
+            name="assets.csv",
+        ))
+
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(
+            [(e["row"], set(e["errors"])) for e in res.data["errors"]],
+            [(3, {"name", "classification", "value"}), (4, {"asset_type"})],
+        )
+        self.assertEqual(Asset.objects.filter(organization=self.org).count(), 1)
+
+    def test_unknown_standard_is_rejected(self):
+        upload = "name\nLaptop\n"
+        for standard in ("iso-9999", "x" * 100):
+            res = self.post(csv_upload(upload, name="assets.csv"), standard=standard)
+            self.assertEqual(res.status_code, 400, standard)
+            self.assertIn("Unknown standard", res.data["detail"])
+
+        res = self.post(csv_upload(upload, name="assets.csv"), standard="iso-42001")
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(Asset.objects.get(name="Laptop").standard, "iso-42001")
+
+    def test_xlsx_dry_run_validates_without_writing(self):
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        wb.active.append(["name", "classification"])
+        wb.active.append(["Payroll DB", "Restricted"])
+        buf = BytesIO()
+        wb.save(buf)
+
+        res = self.post(SimpleUploadedFile("assets.xlsx", buf.getvalue()), dry_run="true")
+
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual((res.data["rows"], res.data["created"]), (1, 0))
+        self.assertEqual(Asset.objects.filter(organization=self.org).count(), 1)
@@ -0,0 +1,420 @@
+# backend/api/tests/test_isms_queries.py
+
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.models import Audit, Finding, Organization
+from api.isms_library import _payload_cache, bump_library_version, clear_library_payloads
+from api.isms_lookup import lookup_index
+from api.isms_models import (
+    Asset,
+    Clause,
+    Control,
+    ISO27001ClauseRecord,
+    ISORisk,
+    SoAEntry,
+    code_sort_key,
+)
+
+
+class TenantAPITestCase(TestCase):
+    host = "alpha.localhost"
+
+    def setUp(self):
+        cache.clear()
+        clear_library_payloads()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user("alice", password="x"))
+
+    def get(self, path, headers=None, **params):
+        return self.client.get(path, params, HTTP_HOST=self.host, headers=headers)
+
+    def count_queries(self, path, expected_status=200, **params):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.get(path, **params)
+        self.assertEqual(res.status_code, expected_status, getattr(res, "data", None))
+        return len(ctx.captured_queries), res
+
+
+class SoAListQueryTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.controls = [
+            Control.objects.create(code=f"A.5.{n}", title=f"Control {n}", standard="iso-27001")
+            for n in range(1, 11)
+        ]
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.other = Organization.objects.create(slug="beta", name="Beta Org")
+
+    def add_risks(self, org, count):
+        asset = Asset.objects.create(organization=org, name=f"Asset {count}")
+        for n in range(count):
+            risk = ISORisk.objects.create(organization=org, title=f"Risk {n}", asset=asset)
+            risk.controls.add(*self.controls[: n % 4 + 1])
+
+    def test_query_count_is_constant_as_risks_grow(self):
+        self.add_risks(self.org, 2)
+        small, _ = self.count_queries("/api/27001/soa/")
+
+        self.add_risks(self.org, 30)
+        self.add_risks(self.other, 10)
+        large, res = self.count_queries("/api/27001/soa/")
+
+        # tenant lookup + SoA rows + one prefetch for risks/assets
+        self.assertEqual(small, 3)
+        self.assertEqual(large, 3)
+        self.assertEqual(len(res.data), 10)
+
+    def test_linked_risks_are_tenant_scoped(self):
+        self.add_risks(self.org, 1)
+        self.add_risks(self.other, 3)
+
+        _, res = self.count_queries("/api/27001/soa/")
+
+        first = next(row for row in res.data if row["control"]["code"] == "A.5.1")
+        self.assertEqual([r["risk_title"] for r in first["linked_risks"]], ["Risk 0"])
+        self.assertEqual(first["linked_risks"][0]["asset_name"], "Asset 1")
+        self.assertEqual(
+            SoAEntry.objects.filter(organization=self.org).count(), len(self.controls)
+        )
+
+
+class LibrarySortKeyTests(TenantAPITestCase):
+    def test_sort_keys_are_numeric(self):
+        self.assertEqual(code_sort_key("A.5.10"), (5, 10))
+        self.assertEqual(code_sort_key("10.2"), (10, 2))
+        self.assertEqual(code_sort_key("4"), (4, 0))
+        self.assertEqual(code_sort_key("Annex"), (999, 999))
+
+    def test_controls_and_clause_records_sort_in_sql(self):
+        for code in ("A.5.10", "A.8.1", "A.5.9", "A.5.1"):
+            Control.objects.create(code=code, title=code, standard="iso-27001")
+        for code in ("10.1", "9.2", "4.1", "3.1"):
+            Clause.objects.create(code=code, title=code, standard="iso-27001")
+        Organization.objects.create(slug="alpha", name="Alpha Org")
+
+        _, res = self.count_queries("/api/isms/controls/")
+        self.assertEqual([c["code"] for c in res.data], ["A.5.1", "A.5.9", "A.5.10", "A.8.1"])
+
+        _, res = self.count_queries("/api/27001/soa/")
+        self.assertEqual(
+            [r["control"]["code"] for r in res.data], ["A.5.1", "A.5.9", "A.5.10", "A.8.1"]
+        )
+
+        # Clauses 4–10 only, with 10.x after 9.x
+        _, res = self.count_queries("/api/27001/clauses/")
+        self.assertEqual([r["clause_number"] for r in res.data], ["4.1", "9.2", "10.1"])
+
+
+class LibraryCacheTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        Organization.objects.create(slug="alpha", name="Alpha Org")
+        Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+
+    def test_payload_is_cached_per_library_version(self):
+        first, res = self.count_queries("/api/isms/controls/", standard="iso-27001")
+        etag = res["ETag"]
+        self.assertIn("max-age=", res["Cache-Control"])
+
+        # Warm: only the tenant lookup, no library queries or serialization
+        warm, res = self.count_queries("/api/isms/controls/", standard="iso-27001")
+        self.assertEqual(warm, 1)
+        self.assertLess(warm, first)
+        self.assertEqual(res["ETag"], etag)
+
+        _, res = self.count_queries(
+            "/api/isms/controls/",
+            expected_status=304,
+            headers={"If-None-Match": etag},
+            standard="iso-27001",
+        )
+
+        # Library import bumps the version → new payload + ETag
+        Control.objects.create(code="A.5.2", title="Roles", standard="iso-27001")
+        bump_library_version("iso-27001")
+        _, res = self.count_queries("/api/isms/controls/", standard="iso-27001")
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual([c["code"] for c in res.data], ["A.5.1", "A.5.2"])
+
+    def test_etag_match_is_exact(self):
+        _, res = self.count_queries("/api/isms/controls/", standard="iso-27001")
+        etag = res["ETag"]
+
+        for header in (f'"x", {etag}', f"W/{etag}", "*"):
+            self.count_queries("/api/isms/controls/", expected_status=304,
+                               headers={"If-None-Match": header}, standard="iso-27001")
+        # Substrings / supersets of the tag are different tags
+        for header in (etag[:-1], f'{etag[:-1]}1"', f"x{etag}x"):
+            self.count_queries("/api/isms/controls/", headers={"If-None-Match": header},
+                               standard="iso-27001")
+
+    def test_unknown_standards_are_not_cached(self):
+        for n in range(5):
+            _, res = self.count_queries("/api/isms/controls/", standard=f"made-up-{n}")
+            self.assertEqual(res.data, [])
+        self.count_queries("/api/isms/controls/", standard="iso-27001")
+
+        self.assertEqual(list(_payload_cache), [("controls", "iso-27001")])
+
+    def test_unknown_standard_gets_no_validators(self):
+        _, res = self.count_queries("/api/isms/controls/", standard="a\r\nX-Injected: 1")
+
+        self.assertEqual(res.data, [])
+        self.assertFalse(res.has_header("ETag"))
+        self.assertFalse(res.has_header("X-Injected"))
+
+
+class ClauseRecordListQueryTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for code in ("10.1", "4.1", "4.2", "9.2", "3.1"):
+            Clause.objects.create(code=code, title=code, standard="iso-27001")
+        # Provisioning seeds the clause records (4–10 only)
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        Organization.objects.create(slug="beta", name="Beta Org")
+
+    def test_list_is_one_ordered_query(self):
+        # tenant lookup + clause records joined to clauses
+        count, res = self.count_queries("/api/27001/clauses/")
+
+        self.assertEqual(count, 2)
+        self.assertEqual([r["clause_number"] for r in res.data], ["4.1", "4.2", "9.2", "10.1"])
+
+    def test_status_and_owner_filters(self):
+        ISO27001ClauseRecord.objects.filter(
+            organization=self.org, clause__code__in=["4.2", "10.1"]
+        ).update(status="IP", owner="Ciso")
+        ISO27001ClauseRecord.objects.filter(organization=self.org, clause__code="9.2").update(
+            status="IP"
+        )
+
+        _, res = self.count_queries("/api/27001/clauses/", status="IP", owner="Ciso")
+        self.assertEqual([r["clause_number"] for r in res.data], ["4.2", "10.1"])
+
+
+class SparseFieldsetTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.control = Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        asset = Asset.objects.create(organization=self.org, name="CRM")
+        for n in range(3):
+            risk = ISORisk.objects.create(organization=self.org, title=f"Risk {n}", asset=asset)
+            risk.controls.add(self.control)
+
+        audit = Audit.objects.create(
+            organization=self.org, audit_id="AUD-1", audit_name="Annual", objective="-",
+            scope="ISMS", date=date(2026, 1, 1), lead_auditor="Lee", standard="iso-27001",
+        )
+        finding = Finding.objects.create(
+            audit=audit, finding_id="F-1", description="Gap", severity="Low",
+            target_date=date(2026, 2, 1),
+        )
+        finding.controls.add(self.control)
+
+    def test_legacy_output_without_parameters(self):
+        _, res = self.count_queries("/api/isms/risks/")
+
+        self.assertEqual(res.data[0]["asset"]["name"], "CRM")
+        self.assertEqual(res.data[0]["controls"][0]["code"], "A.5.1")
+
+    def test_fields_and_expand_trim_payload_and_queries(self):
+        full, _ = self.count_queries("/api/isms/risks/")
+
+        sparse, res = self.count_queries("/api/isms/risks/", fields="id,title")
+        self.assertEqual(set(res.data[0]), {"id", "title"})
+        self.assertLess(sparse, full)
+
+        _, res = self.count_queries("/api/isms/risks/", expand="asset")
+        self.assertIn("asset", res.data[0])
+        self.assertNotIn("controls", res.data[0])
+        self.assertIn("likelihood", res.data[0])
+
+    def test_dotted_expansion_reaches_nested_serializers(self):
+        _, res = self.count_queries("/api/audits/", standard="iso-27001", fields="audit_id")
+        self.assertEqual(res.data, [{"audit_id": "AUD-1"}])
+
+        _, res = self.count_queries("/api/audits/", standard="iso-27001", expand="findings")
+        finding = res.data[0]["findings"][0]
+        self.assertEqual(finding["finding_id"], "F-1")
+        self.assertNotIn("controls", finding)
+
+        _, res = self.count_queries(
+            "/api/audits/", standard="iso-27001", expand="findings.controls"
+        )
+        finding = res.data[0]["findings"][0]
+        self.assertEqual([c["code"] for c in finding["controls"]], ["A.5.1"])
+        self.assertNotIn("clause", finding)
+
+    def test_soa_skips_risk_prefetch_unless_expanded(self):
+        # tenant lookup + SoA rows; no linked-risk prefetch
+        count, res = self.count_queries("/api/27001/soa/", fields="id,status")
+        self.assertEqual(count, 2)
+        self.assertEqual(set(res.data[0]), {"id", "status"})
+
+    def test_sparse_library_requests_bypass_payload_cache(self):
+        _, res = self.count_queries("/api/isms/controls/", fields="code")
+        self.assertEqual(res.data, [{"code": "A.5.1"}])
+
+        _, res = self.count_queries("/api/isms/controls/")
+        self.assertIn("title", res.data[0])
+
+
+class RiskListQueryTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.controls = [
+            Control.objects.create(code=f"A.8.{n}", title=f"Control {n}", standard="iso-27001")
+            for n in range(1, 6)
+        ]
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.assets = [
+            Asset.objects.create(organization=self.org, name=f"Asset {n}") for n in range(10)
+        ]
+
+    def add_risks(self, count):
+        risks = ISORisk.objects.bulk_create(
+            ISORisk(organization=self.org, title=f"Risk {n}", asset=self.assets[n % 10])
+            for n in range(count)
+        )
+        ISORisk.controls.through.objects.bulk_create(
+            ISORisk.controls.through(isorisk_id=risk.id, control_id=control.id)
+            for risk in risks
+            for control in self.controls
+        )
+
+    def test_query_count_is_constant_for_1000_risks(self):
+        self.add_risks(2)
+        small, _ = self.count_queries("/api/isms/risks/")
+
+        self.add_risks(998)
+        large, res = self.count_queries("/api/isms/risks/")
+
+        # tenant lookup + risks JOIN assets + one controls prefetch
+        self.assertEqual(small, 3)
+        self.assertEqual(large, 3)
+        self.assertEqual(len(res.data), 1000)
+        self.assertEqual(len(res.data[0]["controls"]), 5)
+        self.assertTrue(res.data[0]["asset"]["name"].startswith("Asset"))
+
+
+class AuditLockTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        Clause.objects.create(code="4.1", title="Context", standard="iso-27001")
+        Control.objects.create(code="A.5.1", title="Policies", standard="iso-27001")
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.other = Organization.objects.create(slug="beta", name="Beta Org")
+        self.risk = ISORisk.objects.create(organization=self.org, title="Phishing")
+        self.entry = SoAEntry.objects.get(organization=self.org)
+        self.record = ISO27001ClauseRecord.objects.get(organization=self.org)
+
+    def start_audit(self, org, standard="iso-27001"):
+        return Audit.objects.create(
+            organization=org, audit_id="AUD-1", audit_name="Annual", objective="-",
+            scope="ISMS", date=date(2026, 1, 1), lead_auditor="Lee", standard=standard,
+            status="In Progress",
+        )
+
+    def patch(self, path, data):
+        return self.client.patch(path, data, format="json", HTTP_HOST=self.host)
+
+    def write_statuses(self):
+        return [
+            self.patch(f"/api/isms/risks/{self.risk.id}/", {"title": "Phishing 2"}).status_code,
+            self.patch(f"/api/27001/soa/entries/{self.entry.id}/", {"justification": "Required by policy"}).status_code,
+            self.patch(f"/api/27001/clauses/{self.record.id}/", {"owner": "CISO"}).status_code,
+            self.client.post(
+                "/api/evidence/items/", {"target": "soa-entry", "record_id": self.entry.id},
+                HTTP_HOST=self.host,
+            ).status_code,
+        ]
+
+    def test_only_own_iso27001_audit_locks_the_isms(self):
+        self.start_audit(self.other)
+        self.start_audit(self.org, standard="iso-7101")
+        self.assertEqual(self.write_statuses(), [200, 200, 200, 400])  # 400: no file
+
+        self.start_audit(self.org)
+        self.assertEqual(self.write_statuses(), [423, 423, 423, 423])
+        res = self.patch(f"/api/isms/risks/{self.risk.id}/", {"title": "x"})
+        self.assertEqual(res.data["detail"], "ISMS is read-only while audit in progress.")
+
+        # Reads stay open
+        self.assertEqual(self.get(f"/api/isms/risks/{self.risk.id}/").status_code, 200)
+
+    def test_lock_state_is_cached_and_follows_audit_status(self):
+        audit = self.start_audit(self.org)
+        self.assertEqual(self.write_statuses()[0], 423)
+
+        # Cached: the lock check itself costs no query
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.patch(f"/api/isms/risks/{self.risk.id}/", {"title": "x"})
+        self.assertEqual(res.status_code, 423)
+        self.assertFalse(any("api_audit" in q["sql"] for q in ctx.captured_queries))
+
+        audit.status = "Completed"
+        audit.save()
+        self.assertEqual(self.write_statuses()[0], 200)
+
+        audit.status = "In Progress"
+        audit.save()
+        self.assertEqual(self.write_statuses()[0], 423)
+
+        audit.delete()
+        self.assertEqual(self.write_statuses()[0], 200)
+
+
+class LibraryLookupTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        Organization.objects.create(slug="alpha", name="Alpha Org")
+        for code, title in [
+            ("A.8.13", "Information backup"),
+            ("A.8.1", "User endpoint devices"),
+            ("A.5.30", "ICT readiness for business continuity"),
+            ("A.8.14", "Redundancy of information processing facilities"),
+        ]:
+            Control.objects.create(code=code, title=title, standard="iso-27001")
+        Clause.objects.create(code="6.1", title="Actions to address risks", standard="iso-27001")
+
+    def lookup(self, **params):
+        _, res = self.count_queries("/api/isms/lookup/", **params)
+        return [row["code"] for row in res.data]
+
+    def test_code_prefix_and_title_words(self):
+        self.assertEqual(self.lookup(q="a.8.1"), ["A.8.1", "A.8.13", "A.8.14"])
+        self.assertEqual(self.lookup(q="8.13"), ["A.8.13"])
+        self.assertEqual(self.lookup(q="back"), ["A.8.13"])
+        self.assertEqual(self.lookup(q="info proc"), ["A.8.14"])
+        self.assertEqual(self.lookup(q="risks", kind="clauses"), ["6.1"])
+        self.assertEqual(self.lookup(q="8", limit=2), ["A.8.1", "A.8.13"])
+
+    def test_index_is_built_once_per_library_version(self):
+        self.lookup(q="backup")
+        # warm: tenant lookup only, no library queries
+        count, _ = self.count_queries("/api/isms/lookup/", q="backup")
+        self.assertEqual(count, 1)
+
+        # Searches are answered from the in-memory index alone
+        index = lookup_index("controls", "iso-27001")
+        self.assertIs(lookup_index("controls", "iso-27001"), index)
+        with self.assertNumQueries(0):
+            self.assertEqual([r["code"] for r in index.search("info")], ["A.8.13", "A.8.14"])
+
+        Control.objects.create(code="A.8.15", title="Logging backup", standard="iso-27001")
+        bump_library_version("iso-27001")
+        self.assertEqual(self.lookup(q="backup"), ["A.8.13", "A.8.15"])
+
+    def test_unknown_standard_builds_no_index(self):
+        _, res = self.count_queries("/api/isms/lookup/", q="backup", standard="x" * 500)
+
+        self.assertEqual(res.data, [])
+        self.assertFalse(any(key[1] == "x" * 500 for key in _payload_cache))
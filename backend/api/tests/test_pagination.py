@@ -0,0 +1,107 @@
+# backend/api/tests/test_pagination.py
+
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Audit, Organization, UserProfile
+from api.isms_models import Asset
+from api.pagination import KeysetPagination
+from api.tests.test_isms_queries import TenantAPITestCase
+
+
+class KeysetPaginationTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        other = Organization.objects.create(slug="beta", name="Beta Org")
+        for n in range(7):
+            Asset.objects.create(organization=self.org, name=f"Asset {n}")
+        Asset.objects.create(organization=other, name="Not mine")
+
+    def walk(self, path, **params):
+        """Follow next links; return every page's results."""
+        pages = []
+        res = self.get(path, **params)
+        while True:
+            self.assertEqual(res.status_code, 200, res.data)
+            pages.append(res.data["results"])
+            if not res.data["next"]:
+                return pages
+            res = self.client.get(res.data["next"], HTTP_HOST=self.host)
+
+    def test_unpaginated_by_default(self):
+        res = self.get("/api/isms/assets/")
+
+        self.assertIsInstance(res.data, list)
+        self.assertEqual(len(res.data), 7)
+
+    def test_pages_cover_the_ordered_list_once(self):
+        full = [a["name"] for a in self.get("/api/isms/assets/").data]
+
+        pages = self.walk("/api/isms/assets/", page_size=3)
+
+        self.assertEqual([len(p) for p in pages], [3, 3, 1])
+        self.assertEqual([a["name"] for p in pages for a in p], full)
+
+    def test_ties_on_sort_key_are_broken_by_id(self):
+        for n in range(5):
+            Audit.objects.create(
+                organization=self.org, audit_id=f"AUD-{n}", audit_name=f"Audit {n}",
+                objective="-", scope="-", date=date(2026, 1, 1), lead_auditor="Lee",
+                standard="iso-27001",
+            )
+
+        pages = self.walk("/api/audits/", standard="iso-27001", page_size=2)
+
+        ids = [a["id"] for p in pages for a in p]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertEqual(len(ids), 5)
+
+    def test_cursor_filter_leads_with_a_range_bound_on_the_sort_key(self):
+        first = self.get("/api/isms/assets/", page_size=3)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(first.data["next"], HTTP_HOST=self.host)
+        sql = next(q["sql"] for q in ctx.captured_queries if 'FROM "api_asset"' in q["sql"])
+
+        # -created_at (NOT NULL): plain <= bound ANDed before the OR chain
+        where = sql.split("WHERE", 1)[1]
+        self.assertIn('"api_asset"."created_at" <= ', where)
+        self.assertLess(where.index('"created_at" <= '), where.index(" OR "))
+
+    def test_leading_bound_keeps_null_rows_on_nullable_keys(self):
+        paginator = KeysetPagination()
+        for n, location in enumerate(["B", None, "A", "C", None]):
+            Asset.objects.create(organization=self.org, name=f"Loc {n}", location=location)
+        qs = Asset.objects.filter(name__startswith="Loc ").order_by(
+            *paginator._order_expressions(["location", "pk"])
+        )
+        rows = list(qs)
+
+        for i, row in enumerate(rows):
+            after = qs.filter(paginator._after(["location", "pk"], [row.location, row.pk], Asset))
+            self.assertEqual(list(after), rows[i + 1:])
+
+        bound = str(qs.filter(paginator._after(["location", "pk"], ["B", 0], Asset)).query)
+        self.assertIn('("api_asset"."location" >= B OR "api_asset"."location" IS NULL) AND', bound)
+
+    def test_default_page_size_and_invalid_cursor(self):
+        with self.settings(API_PAGE_SIZE=4):
+            res = self.get("/api/isms/assets/", cursor="")
+        self.assertEqual(len(res.data["results"]), 4)
+
+        self.assertEqual(self.get("/api/isms/assets/", cursor="garbage").status_code, 404)
+
+    def test_user_list_paginates(self):
+        for name in ("bob", "carol", "dave"):
+            user = User.objects.create_user(name, password="x")
+            UserProfile.objects.create(user=user, organization=self.org)
+
+        pages = self.walk("/api/settings/users/", page_size=2)
+
+        self.assertEqual(
+            [u["username"] for p in pages for u in p], ["bob", "carol", "dave"]
+        )
@@ -0,0 +1,84 @@
+# backend/api/tests/test_search.py
+
+from datetime import date
+
+from api.models import Audit, Finding, Organization, Risk
+from api.isms_models import Asset, Control, ISORisk, SoAEntry
+from api.tprm_models import ThirdParty, TPRMRisk
+from api.tests.test_isms_queries import TenantAPITestCase
+
+
+class GlobalSearchTests(TenantAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.control = Control.objects.create(code="A.8.13", title="Information backup",
+                                              standard="iso-27001")
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.other = Organization.objects.create(slug="beta", name="Beta Org")
+
+        self.asset = Asset.objects.create(organization=self.org, name="Backup server")
+        ISORisk.objects.create(organization=self.org, title="Ransomware encrypts backups",
+                               description="Offline copies are missing")
+        ISORisk.objects.create(organization=self.org, title="Phishing",
+                               description="Credentials stolen; restore from backup is slow")
+        Risk.objects.create(organization=self.org, risk_id="R-1", description="Backup tapes lost",
+                            likelihood="2", impact="3", risk_score=6, risk_level="Medium",
+                            owner="Ops", review_date=date(2026, 1, 1))
+        audit = Audit.objects.create(organization=self.org, audit_id="AUD-1", audit_name="Annual",
+                                     objective="-", scope="ISMS", date=date(2026, 1, 1),
+                                     lead_auditor="Lee", standard="iso-27001")
+        Finding.objects.create(audit=audit, finding_id="F-1", description="No backup restore test",
+                               severity="High", target_date=date(2026, 3, 1))
+        vendor = ThirdParty.objects.create(organization=self.org, name="Vaultly",
+                                           category="Backup provider", criticality="high")
+        TPRMRisk.objects.create(third_party=vendor, title="Vendor outage", description="Backups unavailable",
+                                risk_type="operational", likelihood=2, impact=4)
+        SoAEntry.objects.filter(organization=self.org, control=self.control).update(
+            justification="Nightly backups"
+        )
+        entry = SoAEntry.objects.get(organization=self.org, control=self.control)
+        entry.save()
+
+        # Other tenant's data must never show up
+        ISORisk.objects.create(organization=self.other, title="Backup theft")
+
+    def test_ranked_tenant_scoped_results_across_types(self):
+        # tenant lookup + one ranked query per entity type
+        count, res = self.count_queries("/api/search/", q="backup")
+
+        self.assertEqual(count, 11)
+        types = {hit["type"] for hit in res.data["results"]}
+        self.assertEqual(
+            types,
+            {"iso_risk", "risk", "asset", "finding", "third_party", "tprm_risk", "soa_entry"},
+        )
+        titles = [hit["title"] for hit in res.data["results"]]
+        self.assertNotIn("Backup theft", titles)
+
+        # Title (weight A) outranks a description mention (weight B)
+        ranks = {hit["title"]: hit["rank"] for hit in res.data["results"]}
+        self.assertGreater(ranks["Ransomware encrypts backups"], ranks["Phishing"])
+        self.assertEqual(
+            [hit["rank"] for hit in res.data["results"]],
+            sorted(ranks.values(), reverse=True)[: len(res.data["results"])],
+        )
+
+    def test_limit_types_and_validation(self):
+        _, res = self.count_queries("/api/search/", q="backup", limit=2)
+        self.assertEqual(len(res.data["results"]), 2)
+
+        count, res = self.count_queries("/api/search/", q="backup", types="asset")
+        self.assertEqual(count, 2)
+        self.assertEqual([hit["id"] for hit in res.data["results"]], [self.asset.id])
+
+        self.assertEqual(self.get("/api/search/", q="b").status_code, 400)
+        self.assertEqual(self.get("/api/search/", q="backup", types="nope").status_code, 400)
+
+    def test_vector_follows_saves(self):
+        self.asset.name = "Mail relay"
+        self.asset.save()
+
+        _, res = self.count_queries("/api/search/", q="relay", types="asset")
+        self.assertEqual(len(res.data["results"]), 1)
+        _, res = self.count_queries("/api/search/", q="backup", types="asset")
+        self.assertEqual(res.data["results"], [])
@@ -1,11 +1,19 @@
 # backend/api/tests/test_tenancy.py
 
-from django.test import TestCase
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from rest_framework.test import APIClient
 
-from api.models import Organization, ComplianceClause, Risk, Audit, TenantSequence
+from api.models import Organization, ComplianceClause, Risk, Audit, Finding, TenantSequence
 from api.isms_models import Asset, Control, SoAEntry
+from api.sequences import SEQUENCE_BLOCK_SIZE, assign_ids, clear_sequence_blocks
+from api.tprm_models import ThirdParty
 
 
 
@@ -183,3 +191,131 @@ class MultiTenancyModelTests(TestCase):
                 applicable=True,
                 status="Not Implemented",
             )
+
+
+def sequence_queries(ctx):
+    return [q for q in ctx.captured_queries if "api_tenantsequence" in q["sql"]]
+
+
+class TenantSequenceTests(TestCase):
+    def setUp(self):
+        clear_sequence_blocks()
+        self.org_a = Organization.objects.create(slug="alpha", name="Alpha Org")
+        self.org_b = Organization.objects.create(slug="beta", name="Beta Org")
+        self.today = timezone.now().date()
+
+    def audit(self, org):
+        return Audit.objects.create(
+            organization=org, audit_name="Annual", objective="-", scope="ISMS",
+            date=self.today, lead_auditor="Lee", standard="iso-27001",
+        )
+
+    def finding(self, audit):
+        return Finding.objects.create(
+            audit=audit, description="Gap", severity="Low", target_date=self.today,
+        )
+
+    def test_ids_are_assigned_per_tenant_and_counter(self):
+        audit_a, audit_b = self.audit(self.org_a), self.audit(self.org_b)
+        findings = [self.finding(audit_a), self.finding(audit_a), self.finding(audit_b)]
+        party = ThirdParty.objects.create(
+            organization=self.org_a, name="Cloudy", category="SaaS", criticality="high",
+            scope_of_dependency="Hosting",
+        )
+
+        self.assertEqual((audit_a.audit_id, audit_b.audit_id), ("AUD-0001", "AUD-0001"))
+        # finding_id used to be unique across all tenants
+        self.assertEqual([f.finding_id for f in findings], ["FND-0001", "FND-0002", "FND-0001"])
+        self.assertEqual(party.reference, "TP-0001")
+        self.assertEqual(
+            set(TenantSequence.objects.filter(organization=self.org_a).values_list("name", "next_value")),
+            {("audit", 2), ("finding", 3), ("third_party", 2)},
+        )
+
+    def test_finding_id_unique_per_tenant(self):
+        audit_a, audit_b = self.audit(self.org_a), self.audit(self.org_b)
+        first = self.finding(audit_a)
+        self.assertEqual(first.organization, self.org_a)
+
+        # Same ID in another tenant is allowed
+        Finding.objects.create(audit=audit_b, finding_id=first.finding_id, description="Gap",
+                               severity="Low", target_date=self.today)
+
+        # Duplicate in same tenant (even under another audit) should fail
+        with self.assertRaises(IntegrityError):
+            Finding.objects.create(audit=self.audit(self.org_a), finding_id=first.finding_id,
+                                   description="Dup", severity="Low", target_date=self.today)
+
+    def test_client_supplied_ids_are_ignored_by_the_api(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user("alice", password="x"))
+        res = client.post("/api/risks/", {
+            "risk_id": "MY-OWN", "description": "Outage", "likelihood": "2", "impact": "3",
+            "owner": "Ops", "review_date": str(self.today),
+        }, format="json", HTTP_HOST="alpha.localhost")
+
+        self.assertEqual(res.status_code, 201, res.data)
+        self.assertEqual(res.data["risk_id"], "RSK-0001")
+
+    def test_counter_starts_after_existing_ids(self):
+        Risk.objects.create(
+            organization=self.org_a, risk_id="RSK-0042", description="Legacy", likelihood="1",
+            impact="1", risk_score=1, risk_level="Low", owner="Ops", review_date=self.today,
+        )
+        risk = Risk.objects.create(
+            organization=self.org_a, description="New", likelihood="1", impact="1",
+            risk_score=1, risk_level="Low", owner="Ops", review_date=self.today,
+        )
+        self.assertEqual(risk.risk_id, "RSK-0043")
+
+    def test_reseeded_tenant_keeps_allocating_ids(self):
+        def risk(org):
+            return Risk.objects.create(
+                organization=org, description="New", likelihood="1", impact="1",
+                risk_score=1, risk_level="Low", owner="Ops", review_date=self.today,
+            )
+
+        # The counter is already in use when the seed wipes and refills the tenant
+        self.assertEqual(risk(self.org_a).risk_id, "RSK-0001")
+        call_command("seed_demo", slug="alpha", reset=True, stdout=StringIO())
+        self.assertEqual(
+            sorted(Risk.objects.filter(organization=self.org_a).values_list("risk_id", flat=True)),
+            ["RSK-0002", "RSK-0003", "RSK-0004"],
+        )
+
+        audit = self.audit(self.org_a)
+        self.assertEqual((risk(self.org_a).risk_id, audit.audit_id), ("RSK-0005", "AUD-0002"))
+        self.assertEqual(self.finding(audit).finding_id, "FND-0002")
+
+    def test_bulk_create_reserves_all_ids_in_one_statement(self):
+        Asset.objects.create(organization=self.org_a, name="First")
+        assets = [Asset(organization=self.org_a, name=f"Asset {n}") for n in range(50)]
+        assets += [Asset(organization=self.org_b, name=f"Beta {n}") for n in range(3)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            assign_ids(assets, "asset")
+        # org A: UPDATE ... RETURNING; org B: UPDATE (no row) + upsert
+        self.assertEqual(len(sequence_queries(ctx)), 3)
+
+        Asset.objects.bulk_create(assets)
+        self.assertEqual(assets[0].asset_id, "AST-0002")
+        self.assertEqual(assets[49].asset_id, "AST-0051")
+        self.assertEqual(assets[-1].asset_id, "AST-0003")
+
+
+class TenantSequenceBlockTests(TransactionTestCase):
+    def setUp(self):
+        clear_sequence_blocks()
+        self.addCleanup(clear_sequence_blocks)
+        self.org = Organization.objects.create(slug="alpha", name="Alpha Org")
+
+    def test_autocommit_saves_draw_from_a_cached_block(self):
+        first = Asset.objects.create(organization=self.org, name="A0")
+        self.assertEqual(first.asset_id, "AST-0001")
+        seq = TenantSequence.objects.get(organization=self.org, name="asset")
+        self.assertEqual(seq.next_value, SEQUENCE_BLOCK_SIZE + 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            more = [Asset.objects.create(organization=self.org, name=f"A{n}") for n in range(1, 5)]
+        self.assertEqual(sequence_queries(ctx), [])
+        self.assertEqual([a.asset_id for a in more], ["AST-0002", "AST-0003", "AST-0004", "AST-0005"])
@@ -1,9 +1,13 @@
 import uuid
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
+from .sequences import assign_ids
+
 
 class ThirdParty(models.Model):
     """
@@ -38,6 +42,8 @@ class ThirdParty(models.Model):
         related_name="tprm_third_parties",
     )
 
+    # Human-readable ID per tenant (TP-0001...), assigned on save, see api.sequences
+    reference = models.CharField(max_length=20, editable=False)
     name = models.CharField(max_length=255)
     category = models.CharField(max_length=100, help_text="e.g. Cloud Provider, SaaS, Consultant")
     description = models.TextField(blank=True)
@@ -71,10 +77,23 @@ class ThirdParty(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["name"]
         verbose_name = "Third Party"
         verbose_name_plural = "Third Parties"
+        unique_together = ("organization", "reference")
+        indexes = [
+            # keyset pagination: (sort key, id)
+            models.Index(fields=["organization", "name", "id"]),
+            GinIndex(fields=["search_vector"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        assign_ids([self], "third_party")
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return self.name
@@ -150,10 +169,16 @@ class TPRMRisk(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search document, maintained by api.search
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["-inherent_risk_score", "title"]
         verbose_name = "TPRM Risk"
         verbose_name_plural = "TPRM Risks"
+        indexes = [
+            GinIndex(fields=["search_vector"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.third_party.name})"
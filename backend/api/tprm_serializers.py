@@ -7,6 +7,7 @@ class ThirdPartySerializer(serializers.ModelSerializer):
         model = ThirdParty
         fields = [
             "id",
+            "reference",
             "organization",
             "name",
             "category",
@@ -22,7 +23,7 @@ class ThirdPartySerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "organization", "created_at", "updated_at"]
+        read_only_fields = ["id", "reference", "organization", "created_at", "updated_at"]
 
 
 class TPRMRiskSerializer(serializers.ModelSerializer):
@@ -30,13 +30,28 @@ from .reports_27001 import (
 )
 
 from .notifications_views import NotificationsView
+from .search_views import GlobalSearchView
+from .evidence_views import (
+    EvidenceUploadCreateView,
+    EvidenceUploadDetailView,
+    EvidenceUploadChunkView,
+    EvidenceUploadCompleteView,
+    EvidenceDownloadView,
+    EvidenceItemListCreateView,
+    EvidenceItemZipImportView,
+    EvidenceItemDetailView,
+    EvidenceItemDownloadView,
+)
 from .platform_updates_views import PlatformUpdatesView
 from .auth_change_password import ChangePasswordView
 from .isms_views import (
     ClauseListView,
     ControlListView,
+    LibraryLookupView,
     AssetListCreateView,
+    AssetImportView,
     RiskListCreateView,
+    RiskImportView,
     RiskRetrieveUpdateView,
     SoAListView,
     SoAEntryUpdateAPIView,
@@ -89,6 +104,7 @@ urlpatterns += [
 # -------------------------
 urlpatterns += [
     path("notifications/", NotificationsView.as_view(), name="notifications"),
+    path("search/", GlobalSearchView.as_view(), name="global-search"),
     path("platform-updates/", PlatformUpdatesView.as_view(), name="platform-updates"),
 ]
 
@@ -126,8 +142,11 @@ urlpatterns += [
 urlpatterns += [
     path("isms/clauses/", ClauseListView.as_view(), name="isms-clauses"),
     path("isms/controls/", ControlListView.as_view(), name="isms-controls"),
+    path("isms/lookup/", LibraryLookupView.as_view(), name="isms-lookup"),
     path("isms/assets/", AssetListCreateView.as_view(), name="isms-assets"),
+    path("isms/assets/import/", AssetImportView.as_view(), name="isms-asset-import"),
     path("isms/risks/", RiskListCreateView.as_view(), name="isms-risks"),
+    path("isms/risks/import/", RiskImportView.as_view(), name="isms-risk-import"),
     path("isms/risks/<int:pk>/", RiskRetrieveUpdateView.as_view(), name="isms-risk-detail"),
     path("isms/soa/", SoAListView.as_view(), name="isms-soa"),
 ]
@@ -148,6 +167,21 @@ urlpatterns += [
     path("27001/clauses/<int:pk>/evidence/", ISO27001ClauseEvidenceUploadView.as_view(), name="iso27001-clause-evidence"),
 ]
 
+# -------------------------
+# Evidence: chunked uploads, items, authorized downloads
+# -------------------------
+urlpatterns += [
+    path("evidence/uploads/", EvidenceUploadCreateView.as_view(), name="evidence-upload-create"),
+    path("evidence/uploads/<uuid:upload_id>/", EvidenceUploadDetailView.as_view(), name="evidence-upload-detail"),
+    path("evidence/uploads/<uuid:upload_id>/chunks/<int:index>/", EvidenceUploadChunkView.as_view(), name="evidence-upload-chunk"),
+    path("evidence/uploads/<uuid:upload_id>/complete/", EvidenceUploadCompleteView.as_view(), name="evidence-upload-complete"),
+    path("evidence/items/", EvidenceItemListCreateView.as_view(), name="evidence-items"),
+    path("evidence/items/zip/", EvidenceItemZipImportView.as_view(), name="evidence-items-zip"),
+    path("evidence/items/<int:pk>/", EvidenceItemDetailView.as_view(), name="evidence-item-detail"),
+    path("evidence/items/<int:pk>/download/", EvidenceItemDownloadView.as_view(), name="evidence-item-download"),
+    path("evidence/<str:target>/<int:record_id>/download/", EvidenceDownloadView.as_view(), name="evidence-download"),
+]
+
 urlpatterns += [
     path("tprm/", include("api.tprm_urls")),
 ]
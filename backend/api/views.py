@@ -1,11 +1,15 @@
 from datetime import date
 
-from django.db.models import Count
+from django.db.models import Count, Prefetch, Q
+from django.utils.dateparse import parse_date
 from rest_framework import viewsets, status, permissions as REST_permissions
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
 
 from .models import Risk, Audit, Finding, ComplianceClause
+from .evidence import attach_evidence, detach_evidence
+from .findings_analytics import findings_analytics
+from .serializer_mixins import is_expanded
 from .serializers import (
     RiskSerializer,
     AuditSerializer,
@@ -88,6 +92,24 @@ class AuditViewSet(viewsets.ModelViewSet):
                 return Audit.objects.none()
             qs = qs.filter(standard=standard)
 
+        # Counts are only serialized from here for reads; writes fall back
+        # to the serializer's per-object counts instead of a GROUP BY lookup
+        if self.action in ("list", "retrieve"):
+            qs = qs.annotate(
+                findings_total=Count("findings"),
+                findings_open=Count("findings", filter=Q(findings__status="Open")),
+            )
+
+        # Findings (+ clause, controls) for every audit in a fixed number of
+        # queries instead of per audit / per finding
+        if is_expanded(self.request, "findings"):
+            findings = Finding.objects.order_by("id")
+            if is_expanded(self.request, "findings.clause"):
+                findings = findings.select_related("clause")
+            if is_expanded(self.request, "findings.controls"):
+                findings = findings.prefetch_related("controls")
+            qs = qs.prefetch_related(Prefetch("findings", queryset=findings))
+
         return qs.order_by("-date", "-id")
 
     def perform_create(self, serializer):
@@ -160,6 +182,39 @@ class FindingViewSet(viewsets.ModelViewSet):
 
         return Response(self.serializer_class(instance).data)
 
+    @action(detail=False, methods=["get"])
+    def analytics(self, request):
+        """
+        GET /api/findings/analytics/[?standard=][&from=YYYY-MM-DD][&to=YYYY-MM-DD]
+        Time to close, open aging and overdue buckets (one grouped query,
+        see api.findings_analytics). from/to filter on the audit date.
+        """
+        tenant = getattr(request, "tenant", None)
+        if not tenant:
+            return Response({"detail": "Tenant missing"}, status=status.HTTP_400_BAD_REQUEST)
+
+        bounds = {}
+        for param in ("from", "to"):
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    bounds[param] = parse_date(value)
+                except ValueError:  # well formed but impossible, e.g. 2024-02-30
+                    bounds[param] = None
+                if bounds[param] is None:
+                    return Response(
+                        {"detail": f"{param} must be a date (YYYY-MM-DD)."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+        return Response(findings_analytics(
+            tenant,
+            today=date.today(),
+            standard=request.query_params.get("standard"),
+            date_from=bounds.get("from"),
+            date_to=bounds.get("to"),
+        ))
+
 # =========================================================
 #   COMPLIANCE CLAUSE VIEWSET (CORRECT & HARDENED)
 # =========================================================
@@ -211,7 +266,7 @@ class ComplianceClauseViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if new_status in {"MI", "O"} and not clause.evidence:
+        if new_status in {"MI", "O"} and not (clause.evidence or clause.evidence_items.exists()):
             return Response(
                 {"error": "Evidence required before this transition."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -228,8 +283,7 @@ class ComplianceClauseViewSet(viewsets.ModelViewSet):
         if not file:
             return Response({"error": "No file uploaded"}, status=status.HTTP_400_BAD_REQUEST)
 
-        clause.evidence = file
-        clause.save()
+        attach_evidence(clause, file)
         return Response(
             ComplianceClauseSerializer(clause).data,
             status=status.HTTP_200_OK,
@@ -238,9 +292,7 @@ class ComplianceClauseViewSet(viewsets.ModelViewSet):
     @evidence.mapping.delete
     def delete_evidence(self, request, pk=None):
         clause = self.get_object()
-        had_file = bool(clause.evidence)
-
-        clause.evidence.delete(save=True)
+        had_file = detach_evidence(clause)
 
         if clause.status == "O":
             clause.status = "MI"
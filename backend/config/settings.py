@@ -130,6 +130,28 @@ STATIC_URL = "/static/"
 MEDIA_ROOT = BASE_DIR / "media"
 MEDIA_URL = "/media/"
 
+# Uploads are SHA-256 hashed while they stream in (evidence dedup, api/evidence.py)
+FILE_UPLOAD_HANDLERS = [
+    "api.evidence.HashingMemoryFileUploadHandler",
+    "api.evidence.HashingTemporaryFileUploadHandler",
+]
+
+# Chunked evidence uploads (api/evidence_uploads.py): temp files live
+# outside MEDIA_ROOT so partial uploads are never served
+EVIDENCE_UPLOAD_DIR = os.getenv("EVIDENCE_UPLOAD_DIR", str(BASE_DIR / "var" / "uploads"))
+EVIDENCE_UPLOAD_MAX_SIZE = int(os.getenv("EVIDENCE_UPLOAD_MAX_SIZE", str(2 * 1024 ** 3)))
+EVIDENCE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# gc_evidence --quarantine moves unreferenced files here (outside MEDIA_ROOT)
+EVIDENCE_QUARANTINE_DIR = os.getenv("EVIDENCE_QUARANTINE_DIR", str(BASE_DIR / "var" / "quarantine"))
+
+# Evidence downloads (api/evidence_downloads.py) hand the byte transfer to the
+# front server when set: "nginx" (X-Accel-Redirect to an `internal` location
+# aliased to MEDIA_ROOT at EVIDENCE_ACCEL_PREFIX) or "apache" (mod_xsendfile).
+# Empty: Django streams the file itself.
+EVIDENCE_SENDFILE_BACKEND = os.getenv("EVIDENCE_SENDFILE_BACKEND", "")
+EVIDENCE_ACCEL_PREFIX = os.getenv("EVIDENCE_ACCEL_PREFIX", "/protected-media/")
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # --------------------------------------------------------
@@ -143,8 +165,13 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",  # MVP – relax permissions
     ],
+    # Opt-in per request (?cursor= / ?page_size=), see api/pagination.py
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.KeysetPagination",
 }
 
+# Default page size for paginated list requests
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
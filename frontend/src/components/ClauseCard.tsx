@@ -1,12 +1,12 @@
 // src/components/ClauseCard.tsx
 "use client";
 
-import { useMemo, useState } from "react";
+import { useState } from "react";
 import { Card } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { useToast } from "@/components/ui/use-toast";
-import { apiFetch, apiUpload } from "@/lib/api";
+import { apiFetch, apiFetchBlob, apiUpload } from "@/lib/api";
 
 import {
   Status,
@@ -23,7 +23,10 @@ type Clause = {
   description?: string;
   short_description?: string;
   status: Status;
-  evidence?: string | string[] | null;
+  // Uploaded filename, and the tenant-checked download endpoint (the
+  // stored file itself is never exposed)
+  evidence_name?: string | null;
+  evidence_download_url?: string | null;
   owner?: string | null;
   comments?: string | null;
   last_updated?: string;
@@ -35,11 +38,9 @@ type Props = {
   onChange?: (updated: Clause) => void;
 };
 
-// Normalize backend evidence shape: string | string[] | null → string[]
-function normalizeEvidence(evidence?: string | string[] | null): string[] {
-  if (!evidence) return [];
-  if (Array.isArray(evidence)) return evidence.filter(Boolean);
-  return [evidence];
+// Absolute download URL from the API → path for apiFetchBlob
+function apiPath(url: string) {
+  return new URL(url, window.location.href).pathname.replace(/^\/api/, "");
 }
 
 function clauseDetailPath(standard: string | undefined, id: number) {
@@ -68,11 +69,25 @@ export default function ClauseCard({ clause, standard, onChange }: Props) {
   const [editingComments, setEditingComments] = useState(false);
   const [localComments, setLocalComments] = useState(clause.comments || "");
 
-  const evidenceList = useMemo(
-    () => normalizeEvidence(clause.evidence),
-    [clause.evidence],
-  );
-  const hasEvidence = evidenceList.length > 0;
+  const hasEvidence = Boolean(clause.evidence_download_url);
+
+  // The download view needs the bearer token, so fetch it rather than link it
+  async function downloadEvidence(url: string) {
+    const fallbackFilename = clause.evidence_name || "evidence";
+    try {
+      const { blob, filename } = await apiFetchBlob(`${apiPath(url)}?download=1`);
+      const objectUrl = URL.createObjectURL(blob);
+      const a = document.createElement("a");
+      a.href = objectUrl;
+      a.download = filename || fallbackFilename;
+      document.body.appendChild(a);
+      a.click();
+      a.remove();
+      URL.revokeObjectURL(objectUrl);
+    } catch (err: any) {
+      show(`Download failed: ${err.message}`, "error");
+    }
+  }
 
   async function patchClause(payload: Partial<Clause>) {
     return apiFetch(clauseDetailPath(standard, clause.id), {
@@ -306,22 +321,21 @@ export default function ClauseCard({ clause, standard, onChange }: Props) {
         <div className="flex items-start justify-between gap-4">
           <div className="min-w-0">
             <span className="font-medium">Evidence:</span>{" "}
-            {evidenceList.length === 0 ? (
+            {!clause.evidence_download_url ? (
               <span className="opacity-60">—</span>
             ) : (
               <ul className="list-disc ml-5">
-                {evidenceList.map((ev, i) => (
-                  <li key={i} className="break-all">
-                    <a
-                      href={ev}
-                      className="underline"
-                      target="_blank"
-                      rel="noreferrer"
-                    >
-                      {ev.split("/").pop()}
-                    </a>
-                  </li>
-                ))}
+                <li className="break-all">
+                  <button
+                    type="button"
+                    className="underline text-left"
+                    onClick={() =>
+                      downloadEvidence(clause.evidence_download_url!)
+                    }
+                  >
+                    {clause.evidence_name || "evidence"}
+                  </button>
+                </li>
               </ul>
             )}
           </div>
@@ -350,18 +364,9 @@ export default function ClauseCard({ clause, standard, onChange }: Props) {
 
                     show("Evidence uploaded successfully ✅", "success");
 
-                    // Backend might return evidence, evidence_url, or evidence_urls — be tolerant
-                    const nextEvidence =
-                      updated?.evidence ??
-                      updated?.evidence_url ??
-                      updated?.evidence_urls ??
-                      clause.evidence;
-
-                    onChange?.({
-                      ...clause,
-                      ...updated,
-                      evidence: nextEvidence,
-                    });
+                    // The serialized clause, with the new evidence_name and
+                    // evidence_download_url
+                    onChange?.({ ...clause, ...updated });
                   } catch (err: any) {
                     show(
                       `Failed to upload evidence: ${
@@ -13,7 +13,7 @@ type Clause = {
   status: "NI" | "P" | "IP" | "MI" | "O";
   owner: string;
   comments?: string | null;
-  evidence?: string | null;
+  evidence_download_url?: string | null;
   last_updated: string;
 };
 
@@ -95,7 +95,7 @@ export default function ClauseDrawer({
             <div>
               <div className="text-gray-500">Evidence</div>
               <div className="font-medium">
-                {clause.evidence ? "Stored" : "None"}
+                {clause.evidence_download_url ? "Stored" : "None"}
               </div>
             </div>
           </div>
@@ -10,7 +10,8 @@ export type ComplianceItem = {
   status: "NI" | "P" | "IP" | "MI" | "O";
   owner: string;
   comments: string | null;
-  evidence: string | null;
+  evidence_name: string | null;
+  evidence_download_url: string | null;
   last_updated: string;
 };
 